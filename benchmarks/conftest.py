@@ -0,0 +1,29 @@
+from src._types import Movie
+from src._constants import MOVIE_MAX_ROWS, MOVIE_MAX_COLS
+import pytest
+
+
+GRIDS = {
+    "max": (MOVIE_MAX_ROWS, MOVIE_MAX_COLS),
+    "large": (100, 200),
+    "huge": (500, 500),
+}
+
+
+@pytest.fixture(params=list(GRIDS))
+def grid_size(request):
+    return GRIDS[request.param]
+
+
+@pytest.fixture
+def movie(grid_size):
+    return Movie("title", *grid_size)
+
+
+@pytest.fixture
+def half_full_movie(grid_size):
+    rows, cols = grid_size
+    movie = Movie("title", rows, cols)
+    for _ in range(rows * cols // 2 // 4):
+        movie.book(4)
+    return movie
@@ -0,0 +1,20 @@
+from src._analytics import OccupancyMatrix, party_capacity, row_fill
+import pytest
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_row_fill(benchmark, half_full_movie, engine):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+        benchmark(OccupancyMatrix(half_full_movie).row_fill)
+    else:
+        benchmark(row_fill, half_full_movie)
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_party_capacity(benchmark, half_full_movie, engine):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+        benchmark(OccupancyMatrix(half_full_movie).party_capacity, 4)
+    else:
+        benchmark(party_capacity, half_full_movie, 4)
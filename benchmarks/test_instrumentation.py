@@ -0,0 +1,15 @@
+from src._instrumentation import disable, enable
+import pytest
+
+
+@pytest.mark.parametrize("instrumented", [False, True])
+def test_book(benchmark, half_full_movie, instrumented):
+    def book_then_unbook():
+        half_full_movie.unbook(half_full_movie.book(4))
+
+    if instrumented:
+        enable()
+    try:
+        benchmark(book_then_unbook)
+    finally:
+        disable()
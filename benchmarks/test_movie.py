@@ -0,0 +1,100 @@
+from src._allocators import BestBlockAllocator
+from src._types import Movie
+
+
+def test_init(benchmark, grid_size):
+    benchmark(Movie, "title", *grid_size)
+
+
+def test_book(benchmark, half_full_movie):
+    def book_then_unbook():
+        half_full_movie.unbook(half_full_movie.book(4))
+
+    benchmark(book_then_unbook)
+
+
+def test_preview(benchmark, half_full_movie):
+    benchmark(half_full_movie.preview, 4)
+
+
+def test_preview_uncached(benchmark, half_full_movie, monkeypatch):
+    monkeypatch.setattr("src._types.PLAN_CACHE_SIZE", 0)
+    benchmark(half_full_movie.preview, 4)
+
+
+def test_book_keep_together(benchmark, grid_size):
+    rows, cols = grid_size
+    movie = Movie("title", rows, cols, BestBlockAllocator())
+    # Leave every row half full, with no run of more than 2 free seats
+    for row in range(rows):
+        for col in range(0, cols, 4):
+            movie.book(min(2, cols - col), row, col)
+
+    def book_then_unbook():
+        movie.unbook(movie.book(4))
+
+    benchmark(book_then_unbook)
+
+
+def test_book_from_seat(benchmark, half_full_movie):
+    row_index = half_full_movie.rows // 2
+
+    def book_then_unbook():
+        half_full_movie.unbook(half_full_movie.book(4, row_index, 0))
+
+    benchmark(book_then_unbook)
+
+
+def test_unbook(benchmark, half_full_movie):
+    booking_ids = iter(
+        [half_full_movie.book(4) for _ in range(half_full_movie.seats_unbooked() // 4)]
+    )
+    benchmark.pedantic(
+        lambda: half_full_movie.unbook(next(booking_ids)),
+        rounds=half_full_movie.rows,
+    )
+
+
+def test_seats_unbooked(benchmark, half_full_movie):
+    benchmark(half_full_movie.seats_unbooked)
+
+
+def test_get_map(benchmark, half_full_movie):
+    booking_id = half_full_movie.book(4)
+    benchmark(half_full_movie.get_map, booking_id)
+
+
+def test_get_map_after_book(benchmark, half_full_movie):
+    def book_then_get_map():
+        booking_id = half_full_movie.book(4)
+        half_full_movie.get_map(booking_id)
+        half_full_movie.unbook(booking_id)
+
+    benchmark(book_then_get_map)
+
+
+def test_fill_to_sold_out(benchmark, grid_size):
+    def fill(movie):
+        while movie.seats_unbooked() >= 4:
+            movie.book(4)
+
+    benchmark.pedantic(
+        fill, setup=lambda: ((Movie("title", *grid_size),), {}), rounds=3
+    )
+
+
+def test_reseat_loop(benchmark, half_full_movie):
+    booking_id = half_full_movie.book(4)
+    seats = [
+        (row_index, col_index)
+        for row_index in range(half_full_movie.rows)
+        for col_index in range(0, half_full_movie.cols, 7)
+    ]
+    seats = iter(seats * 1000)
+
+    def reseat():
+        half_full_movie.unbook(booking_id)
+        half_full_movie.book(4, *next(seats))
+        half_full_movie.get_map(booking_id)
+
+    benchmark(reseat)
@@ -0,0 +1,39 @@
+from src._persistence import BookingStore
+from src._types import Movie
+from src._constants import MOVIE_MAX_ROWS, MOVIE_MAX_COLS
+import pytest
+
+
+def new_movie():
+    return Movie("max_title", MOVIE_MAX_ROWS, MOVIE_MAX_COLS)
+
+
+@pytest.mark.parametrize("sync_every", [1, 64])
+def test_book_write_cost(benchmark, tmp_path, sync_every):
+    store = BookingStore(tmp_path, sync_every=sync_every, snapshot_every=None)
+    movie = store.recover(new_movie())
+
+    def book_then_unbook():
+        movie.unbook(movie.book(4))
+
+    benchmark(book_then_unbook)
+    store.close()
+
+
+@pytest.mark.parametrize("tail", [0, 1_000, 10_000])
+def test_recovery_time(benchmark, tmp_path, tail):
+    store = BookingStore(tmp_path, sync_every=1_000, snapshot_every=None)
+    movie = store.recover(new_movie())
+    for _ in range(MOVIE_MAX_ROWS * MOVIE_MAX_COLS // 4 // 2):
+        movie.book(4)
+    store.snapshot()
+    for _ in range(tail // 2):
+        movie.unbook(movie.book(4))
+    store.close()
+
+    def recover():
+        store = BookingStore(tmp_path)
+        store.recover(new_movie())
+        store.close()
+
+    benchmark(recover)
@@ -0,0 +1,45 @@
+from src._cinema import Cinema
+from src._sharding import ShardedCinema
+from src._types import Movie
+import pytest
+
+
+SCREENINGS = [f"screening_{i}" for i in range(16)]
+BATCH_SIZE = 4_000
+
+
+def book_calls():
+    return [("book", SCREENINGS[i % len(SCREENINGS)], (4,)) for i in range(BATCH_SIZE)]
+
+
+def test_local(benchmark):
+    cinema = Cinema()
+    for screening in SCREENINGS:
+        cinema.add(screening, Movie("title", 100, 200))
+
+    def book_then_unbook():
+        calls = book_calls()
+        booking_ids = [cinema.book(screening, *args) for _, screening, args in calls]
+        for (_, screening, _), booking_id in zip(calls, booking_ids):
+            cinema.unbook(screening, booking_id)
+
+    benchmark(book_then_unbook)
+
+
+@pytest.mark.parametrize("shards", [1, 2, 4, 8])
+def test_sharded(benchmark, shards):
+    with ShardedCinema(shards) as cinema:
+        for screening in SCREENINGS:
+            cinema.add(screening, "title", 100, 200)
+
+        def book_then_unbook():
+            calls = book_calls()
+            booking_ids = cinema.batch(calls)
+            cinema.batch(
+                [
+                    ("unbook", screening, (booking_id,))
+                    for (_, screening, _), booking_id in zip(calls, booking_ids)
+                ]
+            )
+
+        benchmark(book_then_unbook)
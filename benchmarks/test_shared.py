@@ -0,0 +1,28 @@
+from src._shared import SeatMapReader, SharedSeats
+from src._types import BookingID
+
+
+def test_reader_seats_unbooked(benchmark, half_full_movie):
+    shared = SharedSeats.create(half_full_movie)
+    reader = SeatMapReader(shared.name)
+    benchmark(reader.seats_unbooked)
+    reader.close()
+    shared.close()
+
+
+def test_reader_get_map(benchmark, half_full_movie):
+    shared = SharedSeats.create(half_full_movie)
+    reader = SeatMapReader(shared.name)
+    benchmark(reader.get_map, BookingID(1))
+    reader.close()
+    shared.close()
+
+
+def test_shared_book(benchmark, half_full_movie):
+    shared = SharedSeats.create(half_full_movie)
+
+    def book_then_unbook():
+        half_full_movie.unbook(half_full_movie.book(4))
+
+    benchmark(book_then_unbook)
+    shared.close()
@@ -0,0 +1,16 @@
+from src._types import Movie
+import subprocess
+import sys
+
+
+def test_import_main(benchmark):
+    benchmark.pedantic(
+        subprocess.run, ([sys.executable, "-c", "import main"],), rounds=10
+    )
+
+
+def test_add_screenings(benchmark, grid_size):
+    def add_screenings():
+        return [Movie(f"title {index}", *grid_size) for index in range(1_000)]
+
+    benchmark(add_screenings)
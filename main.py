@@ -1,21 +1,52 @@
-import curses
-from src._types import Movie, ScrollingScreen
-from src._enums import MainMenuOptions
+import argparse
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, TextIO
+from src._cinema import Cinema
+from src._addressing import parse_seat
+from src._allocators import Allocator, BestBlockAllocator
+from src._constants import (
+    BOOKING_HOLD_TTL,
+    MOVIE_MAX_ROWS,
+    MOVIE_MAX_COLS,
+    VENUE_MAX_ROWS,
+    VENUE_MAX_COLS,
+    SCREEN_DEFAULT_SPACING,
+    SCREEN_PROMPT_LINES,
+)
+from src._types import BookingID, HeadlessScreen, Movie, Plan, Screen
+from src._enums import MainMenuOptions, MetricsFormat
 
 
-def handle_admin(screen: ScrollingScreen) -> Movie:
+# Only the front-end in use is imported, so headless runs never load curses,
+# and the TUI never loads asyncio
+if TYPE_CHECKING:
+    import curses
+
+
+def handle_admin(
+    screen: Screen,
+    max_rows: int = MOVIE_MAX_ROWS,
+    max_cols: int = MOVIE_MAX_COLS,
+    allocator: Optional[Allocator] = None,
+) -> Movie:
     while True:
         screen.addstr(
             "Please define movie title and seating map in "
             "[Title] [Row] [SeatsPerRow] format:\n> "
         )
         try:
-            return Movie.from_user_input(screen.getstr())
+            return Movie.from_user_input(
+                screen.getstr(),
+                max_rows=max_rows,
+                max_cols=max_cols,
+                allocator=allocator,
+            )
         except ValueError as e:
             screen.addstr(str(e), spacing=1)
 
 
-def handle_user(screen: ScrollingScreen, movie: Movie) -> None:
+def handle_user(screen: Screen, movie: Movie) -> None:
     while True:
         screen.addstr(
             f"""Welcome to GIC Cinemas
@@ -37,7 +68,7 @@ Please enter your selection:
                 screen.addstr("> ", spacing=1)
 
 
-def _make_booking(screen: ScrollingScreen, movie: Movie) -> None:
+def _make_booking(screen: Screen, movie: Movie) -> None:
     while True:
         screen.addstr(
             "Enter number of tickets to book, "
@@ -53,11 +84,14 @@ def _make_booking(screen: ScrollingScreen, movie: Movie) -> None:
             )
             continue
 
-        booking_id = movie.book(seats_to_book)
+        # Seats are only booked once accepted, so previews leave the grid as is
+        plan = movie.preview(seats_to_book)
+        booking_id = movie.next_booking_id
         screen.addstr(
             f"Successfully reserved {seats_to_book} {movie.title} tickets.", spacing=1
         )
-        screen.addstr(movie.get_map(booking_id), spacing=1)
+        map_top = _show_map(screen, movie, booking_id, spacing=1, plan=plan)
+        cursor = screen.getyx()
 
         while True:
             screen.addstr(
@@ -66,40 +100,254 @@ def _make_booking(screen: ScrollingScreen, movie: Movie) -> None:
             )
 
             if not (user_input := screen.getstr()):
+                booking_id = movie.commit(plan)
+                movie.confirm(booking_id)
                 screen.addstr(f"Booking id: {booking_id} confirmed.")
                 return
 
-            movie.unbook(booking_id)
-
-            row_index = ord(user_input[:1]) - ord("A")
-            col_index = int(user_input[1:]) - 1
+            try:
+                row_index, col_index = parse_seat(user_input, movie.rows, movie.cols)
+            except ValueError as e:
+                screen.addstr(str(e), spacing=1)
+                map_top = None
+                continue
 
-            booking_id = movie.book(seats_to_book, row_index, col_index)
-            screen.addstr(movie.get_map(booking_id), spacing=1)
+            new_plan = movie.preview(seats_to_book, row_index, col_index)
+            changes = movie.preview_changes(plan, new_plan)
+            plan = new_plan
+            if map_top is not None and changes is not None:
+                cells = [
+                    (*movie.map_position(row, col), chr) for row, col, chr in changes
+                ]
+                screen.repaint(map_top, cells, cursor)
+            else:
+                map_top = _show_map(screen, movie, booking_id, spacing=1, plan=plan)
+                cursor = screen.getyx()
 
 
-def _check_booking(screen: ScrollingScreen, movie: Movie) -> None:
+def _check_booking(screen: Screen, movie: Movie) -> None:
     while True:
         screen.addstr("Enter booking id, or enter blank to go back to main menu:\n> ")
-        if booking_id := screen.getstr():
-            screen.addstr(movie.get_map(booking_id))
+        if not (user_input := screen.getstr()):
+            return
+
+        try:
+            booking_id = BookingID.parse(user_input)
+        except ValueError:
+            booking_id = None
+        if booking_id is None or movie.get_booking(booking_id) is None:
+            screen.addstr(f"Sorry, booking id {user_input} does not exist.", spacing=1)
+            continue
+
+        _show_map(screen, movie, booking_id)
         return
 
 
-def _exit(screen: ScrollingScreen) -> None:
+def _show_map(
+    screen: Screen,
+    movie: Movie,
+    booking_id: BookingID,
+    spacing: int = SCREEN_DEFAULT_SPACING,
+    plan: Optional[Plan] = None,
+) -> Optional[int]:
+    """
+    Prints as much of the map of a booking as fits above a prompt
+
+    Parameters
+        screen: Screen
+            The screen to print to
+        movie: Movie
+            The Movie to print the map of
+        booking_id: BookingID
+            The Booking ID to highlight
+        spacing: int = SCREEN_DEFAULT_SPACING
+            The number of lines of spacing above the map
+        plan: Optional[Plan]
+            A plan from `Movie.preview` to show as selected seats, if any
+    Returns
+        Optional[int]
+            The line the map starts at, if the whole map was printed and can
+            be repainted in place
+    """
+    height, width = screen.getmaxyx()
+    height -= spacing + SCREEN_PROMPT_LINES
+    map_top = screen.addpad(
+        movie.get_viewport(booking_id, height, width, plan),
+        spacing=spacing,
+        reserve=SCREEN_PROMPT_LINES,
+    )
+    return map_top if movie.map_fits(height, width) else None
+
+
+def _exit(screen: Screen) -> None:
     screen.addstr("Thank you for using GIC Cinemas system. Bye!")
     screen.getch()
     exit()
 
 
-def main(stdscr: curses.window) -> None:
+def main(
+    stdscr: "curses.window", large_venue: bool = False, keep_together: bool = False
+) -> None:
+    import curses
+    from src._tui import ScrollingScreen
+
     curses.echo()
 
     screen = ScrollingScreen(stdscr)
 
-    movie = handle_admin(screen)
+    movie = handle_admin(screen, *_limits(large_venue), _allocator(keep_together))
     handle_user(screen, movie)
 
 
+def run_script(
+    script: TextIO,
+    output: TextIO,
+    large_venue: bool = False,
+    keep_together: bool = False,
+) -> None:
+    """
+    Runs the TUI headless, reading each line of user input from a script
+
+    Parameters
+        script: TextIO
+            Lines of user input, as typed at each prompt
+        output: TextIO
+            Where to write what would be printed to the terminal
+        large_venue: bool = False
+            Whether to allow up to `VENUE_MAX_ROWS` and `VENUE_MAX_COLS`
+        keep_together: bool = False
+            Whether to seat each party in a single block, if possible
+    Returns
+        None
+    """
+    screen = HeadlessScreen(script, output)
+    try:
+        movie = handle_admin(screen, *_limits(large_venue), _allocator(keep_together))
+        handle_user(screen, movie)
+    except EOFError:
+        pass
+    finally:
+        screen.flush()
+
+
+def serve(args: argparse.Namespace) -> None:
+    import asyncio
+    from src._persistence import BookingStore
+    from src._server import BookingServer
+
+    cinema = Cinema()
+    stores: dict[str, BookingStore] = {}
+    for user_input in args.movie:
+        movie = Movie.from_user_input(
+            user_input,
+            args.hold_ttl,
+            *_limits(args.large_venue),
+            _allocator(args.keep_together),
+        )
+        if args.data_dir is not None:
+            stores[movie.title] = BookingStore(args.data_dir / movie.title)
+            stores[movie.title].recover(movie)
+        cinema.add(movie.title, movie)
+
+    server = BookingServer(
+        cinema, (lambda screening: stores[screening].sync()) if stores else None
+    )
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port, args.unix))
+    finally:
+        for store in stores.values():
+            store.close()
+
+
+def _allocator(keep_together: bool) -> Optional[Allocator]:
+    if keep_together:
+        return BestBlockAllocator()
+    return None
+
+
+def _limits(large_venue: bool) -> tuple[int, int]:
+    if large_venue:
+        return VENUE_MAX_ROWS, VENUE_MAX_COLS
+    return MOVIE_MAX_ROWS, MOVIE_MAX_COLS
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="GIC Cinemas booking system")
+    parser.add_argument(
+        "--large-venue",
+        action="store_true",
+        help=f"allow up to {VENUE_MAX_ROWS} rows and {VENUE_MAX_COLS} seats per row",
+    )
+    parser.add_argument(
+        "--keep-together",
+        action="store_true",
+        help="seat each party in a single block of seats, where possible",
+    )
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="read user input from a file, or from stdin if -, instead of a terminal",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="FILE",
+        help="record latency, seats scanned and scroll retries, writing them to "
+        "a file on SIGUSR1 and at exit",
+    )
+    parser.add_argument(
+        "--metrics-format",
+        type=MetricsFormat,
+        choices=list(MetricsFormat),
+        default=MetricsFormat.JSON,
+        help="format to write metrics in",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    serve_parser = subparsers.add_parser(
+        "serve", help="serve bookings over a line protocol"
+    )
+    serve_parser.add_argument(
+        "--movie",
+        action="append",
+        required=True,
+        metavar="'[Title] [Row] [SeatsPerRow]'",
+        help="screening to serve, may be repeated",
+    )
+    serve_parser.add_argument(
+        "--hold-ttl",
+        type=float,
+        default=BOOKING_HOLD_TTL,
+        metavar="SECONDS",
+        help="seconds to hold a booking for until it is accepted",
+    )
+    serve_parser.add_argument(
+        "--data-dir",
+        type=Path,
+        help="directory to persist bookings to, and recover them from",
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8888)
+    serve_parser.add_argument("--unix", metavar="PATH", help="Unix socket to serve on")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    curses.wrapper(main)
+    args = parse_args()
+    if args.metrics is not None:
+        from src._instrumentation import install
+
+        # The TUI's screen is only instrumented if loaded first
+        if args.command != "serve" and args.script is None:
+            import src._tui  # noqa: F401
+        install(args.metrics, args.metrics_format)
+    match args.command:
+        case "serve":
+            serve(args)
+        case _ if args.script == "-":
+            run_script(sys.stdin, sys.stdout, args.large_venue, args.keep_together)
+        case _ if args.script is not None:
+            with open(args.script) as script:
+                run_script(script, sys.stdout, args.large_venue, args.keep_together)
+        case _:
+            import curses
+
+            curses.wrapper(main, args.large_venue, args.keep_together)
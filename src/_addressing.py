@@ -0,0 +1,72 @@
+from typing import Optional
+
+
+def row_label(row_index: int) -> str:
+    """
+    Returns the label of a row, i.e. A to Z, then AA to AZ, BA and so on
+
+    Parameters
+        row_index: int
+            Row index, from 0
+    Returns
+        str
+    """
+    label = []
+    row_index += 1
+    while row_index:
+        row_index, remainder = divmod(row_index - 1, 26)
+        label.append(chr(ord("A") + remainder))
+    return "".join(reversed(label))
+
+
+def row_index(label: str) -> int:
+    """
+    Returns the row index of a row label, as per `row_label`
+
+    Parameters
+        label: str
+            Row label, in upper case
+    Returns
+        int
+    """
+    if not label or not all("A" <= char <= "Z" for char in label):
+        raise ValueError(f"Invalid row {label}.")
+    index = 0
+    for char in label:
+        index = index * 26 + ord(char) - ord("A") + 1
+    return index - 1
+
+
+def format_seat(row_index: int, col_index: int) -> str:
+    return f"{row_label(row_index)}{col_index + 1}"
+
+
+def parse_seat(
+    seat: str, rows: Optional[int] = None, cols: Optional[int] = None
+) -> tuple[int, int]:
+    """
+    Returns the `(row_index, col_index)` of a seat such as `B03` or `AA12`
+
+    Parameters
+        seat: str
+            Row label followed by col number, from 1
+        rows: Optional[int]
+            Number of rows to check the seat against, if any
+        cols: Optional[int]
+            Number of cols to check the seat against, if any
+    Returns
+        tuple[int, int]
+    """
+    seat = seat.strip().upper()
+    label = seat.rstrip("0123456789")
+    number = seat[len(label) :]
+    if not number:
+        raise ValueError(f"Invalid seat {seat}.")
+    row, col = row_index(label), int(number) - 1
+    if (
+        col < 0
+        or (rows is not None and row >= rows)
+        or (cols is not None and col >= cols)
+    ):
+        raise ValueError(f"Seat {seat} does not exist.")
+    return row, col
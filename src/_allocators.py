@@ -0,0 +1,230 @@
+from functools import cache
+from typing import TYPE_CHECKING, Optional, Protocol, Self
+
+if TYPE_CHECKING:
+    from src._types import SeatGrid
+
+
+@cache
+def center_out_order(cols: int) -> tuple[int, ...]:
+    """
+    Returns col indexes from the middle of a row outwards, left before right
+
+    Parameters
+        cols: int
+            Number of cols in the row
+    Returns
+        tuple[int, ...]
+    """
+    right = cols // 2
+    left = right - 1
+    order = [] if cols % 2 == 0 else [right]
+    right += cols % 2
+    while left >= 0:
+        order.append(left)
+        order.append(right)
+        left -= 1
+        right += 1
+    return tuple(order)
+
+
+@cache
+def center_out_ranks(cols: int) -> tuple[int, ...]:
+    """
+    Returns the position of each col index within `center_out_order(cols)`
+
+    Parameters
+        cols: int
+            Number of cols in the row
+    Returns
+        tuple[int, ...]
+    """
+    ranks = [0] * cols
+    for rank, col in enumerate(center_out_order(cols)):
+        ranks[col] = rank
+    return tuple(ranks)
+
+
+def lowest_bits(mask: int, count: int) -> list[int]:
+    """
+    Returns the indexes of up to `count` lowest set bits of `mask`
+
+    Parameters
+        mask: int
+            The bitmask to pick set bits from
+        count: int
+            Maximum number of bit indexes to return
+    Returns
+        list[int]
+    """
+    indexes = []
+    while mask and len(indexes) < count:
+        low = mask & -mask
+        indexes.append(low.bit_length() - 1)
+        mask ^= low
+    return indexes
+
+
+def free_runs(mask: int, length: int) -> int:
+    """
+    Returns a bitmask of where runs of `length` set bits of `mask` start
+
+    Bit `i` of the result is set if bits `i` to `i + length - 1` of `mask`
+    are all set. The run length covered doubles with each AND-shift, so this
+    takes O(log length) operations on `mask`.
+
+    Parameters
+        mask: int
+            The bitmask to find runs of set bits in
+        length: int
+            Length of the runs to find, from 1
+    Returns
+        int
+    """
+    runs, covered = mask, 1
+    while covered < length:
+        step = min(covered, length - covered)
+        runs &= runs >> step
+        covered += step
+    return runs
+
+
+def nearest_bit(mask: int, target: int) -> Optional[int]:
+    """
+    Returns the index of the set bit of `mask` nearest to `target`, lower on ties
+
+    Parameters
+        mask: int
+            The bitmask to pick a set bit from
+        target: int
+            The bit index to measure distance from
+    Returns
+        Optional[int]
+            None if no bits are set
+    """
+    above = mask >> target
+    below = mask & ((1 << target) - 1)
+    if not above and not below:
+        return None
+    upper = target + (above & -above).bit_length() - 1 if above else None
+    lower = below.bit_length() - 1 if below else None
+    if upper is None or (lower is not None and target - lower <= upper - target):
+        return lower
+    return upper
+
+
+class Allocator(Protocol):
+    def allocate(
+        self,
+        grid: "SeatGrid",
+        seats_to_book: int,
+        row_index: Optional[int] = None,
+        col_index: Optional[int] = None,
+        start_row: int = 0,
+    ) -> list[tuple[int, int]]:
+        """
+        Returns the `(row_index, col_index)` of seats to book, without booking them
+
+        Parameters
+            grid: SeatGrid
+                The grid to allocate seats from
+            seats_to_book: int
+                Number of seats to allocate
+            row_index: Optional[int]
+                Starting row index, if any
+            col_index: Optional[int]
+                Starting col index, if any
+            start_row: int = 0
+                Row index to start filling from middle at, if no starting seat
+        Returns
+            list[tuple[int, int]]
+        """
+        ...
+
+
+class CenterOutAllocator:
+    """
+    Allocates seats following the following logic:
+
+    If `row_index` and `col_index`,
+        Fill from right of `(row_index, col_index)`.
+        Then from middle of next row in row order.
+
+    Else,
+        Fill from middle of each row in row order.
+
+    Free seats are found by taking the lowest set bits of each row's free
+    mask, which `SeatGrid` keeps permuted into `center_out_order`.
+    """
+
+    def allocate(
+        self,
+        grid: "SeatGrid",
+        seats_to_book: int,
+        row_index: Optional[int] = None,
+        col_index: Optional[int] = None,
+        start_row: int = 0,
+    ) -> list[tuple[int, int]]:
+        seats = []
+
+        if row_index is not None and col_index is not None:
+            # Fill from right
+            mask = grid.row_mask(row_index) >> col_index << col_index
+            for col in lowest_bits(mask, seats_to_book):
+                seats.append((row_index, col))
+            start_row = row_index + 1
+
+        # Fill from middle, skipping full rows
+        order = center_out_order(grid.cols)
+        row = grid.next_free_row(start_row)
+        while row is not None and len(seats) < seats_to_book:
+            mask = grid.row_center_mask(row)
+            for rank in lowest_bits(mask, seats_to_book - len(seats)):
+                seats.append((row, order[rank]))
+            row = grid.next_free_row(row + 1)
+
+        return seats
+
+
+class BestBlockAllocator:
+    """
+    Allocates seats to keep a party together, following the following logic:
+
+    If `row_index` and `col_index`,
+        Allocate as per `fallback`.
+
+    Else,
+        Find the first row in row order with a run of free seats for the
+        whole party, and take the run nearest the middle of that row.
+        If no row has such a run, allocate as per `fallback`.
+
+    Runs are found with `free_runs` on each row's free mask, which
+    `SeatGrid` keeps up to date as seats are booked and unbooked. Rows with
+    fewer free seats than the party are skipped without looking at their
+    mask, so a search costs O(rows * log cols).
+    """
+
+    def __init__(self, fallback: Optional[Allocator] = None) -> Self:
+        self._fallback = fallback if fallback is not None else CenterOutAllocator()
+
+    def allocate(
+        self,
+        grid: "SeatGrid",
+        seats_to_book: int,
+        row_index: Optional[int] = None,
+        col_index: Optional[int] = None,
+        start_row: int = 0,
+    ) -> list[tuple[int, int]]:
+        if (row_index is None or col_index is None) and 0 < seats_to_book <= grid.cols:
+            target = (grid.cols - seats_to_book) // 2
+            row = grid.next_free_row(start_row)
+            while row is not None:
+                if grid.count_row_free(row) >= seats_to_book:
+                    runs = free_runs(grid.row_mask(row), seats_to_book)
+                    if (col := nearest_bit(runs, target)) is not None:
+                        return [(row, col + i) for i in range(seats_to_book)]
+                row = grid.next_free_row(row + 1)
+
+        return self._fallback.allocate(
+            grid, seats_to_book, row_index, col_index, start_row
+        )
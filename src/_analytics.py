@@ -0,0 +1,130 @@
+from itertools import groupby
+from typing import Self
+from src._types import BookingID, Movie
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def row_fill(movie: Movie) -> list[float]:
+    """
+    Returns the fraction of seats booked in each row, in row order
+
+    Parameters
+        movie: Movie
+            The Movie to report on
+    Returns
+        list[float]
+    """
+    slots, cols = movie.slots(), movie.cols
+    return [
+        sum(map(bool, slots[row * cols : (row + 1) * cols])) / cols
+        for row in range(movie.rows)
+    ]
+
+
+def party_capacity(movie: Movie, party_size: int) -> list[int]:
+    """
+    Returns how many parties of a size can still sit together in each row
+
+    Each party needs `party_size` free seats next to each other, and no two
+    parties share a seat.
+
+    Parameters
+        movie: Movie
+            The Movie to report on
+        party_size: int
+            Number of seats per party, from 1
+    Returns
+        list[int]
+    """
+    slots, cols = movie.slots(), movie.cols
+    return [
+        sum(
+            len(list(run)) // party_size
+            for booked, run in groupby(slots[row * cols : (row + 1) * cols], bool)
+            if not booked
+        )
+        for row in range(movie.rows)
+    ]
+
+
+class OccupancyMatrix:
+    """
+    NumPy view of a Movie's seats, for reports over whole screenings
+
+    Reads straight from the Movie's slots, one `uint32` Booking ID per seat
+    or 0 if unbooked, so each query sees the Movie as it is, without copying
+    or visiting seats one by one. Needs NumPy, the optional `numpy` extra.
+    """
+
+    def __init__(self, movie: Movie) -> Self:
+        if np is None:
+            raise ImportError(
+                "OccupancyMatrix needs NumPy, the optional `numpy` extra."
+            )
+        self._movie = movie
+
+    def slots(self) -> "np.ndarray":
+        """Returns the Booking ID of every seat, or 0, as a read-only matrix"""
+        movie = self._movie
+        return np.frombuffer(movie.slots(), dtype=np.uint32).reshape(
+            movie.rows, movie.cols
+        )
+
+    def booked(self) -> "np.ndarray":
+        """Returns whether each seat is booked, e.g. for an occupancy heatmap"""
+        return self.slots() != 0
+
+    def seats_unbooked(self) -> int:
+        return int(np.count_nonzero(self.slots() == 0))
+
+    def row_fill(self) -> "np.ndarray":
+        """Returns the fraction of seats booked in each row, as per `row_fill`"""
+        return self.booked().mean(axis=1)
+
+    def party_capacity(self, party_size: int) -> "np.ndarray":
+        """
+        Returns how many parties of a size can still sit together in each row,
+        as per `party_capacity`
+
+        Runs of free seats are found for every row at once, from where the
+        seats change between booked and free.
+
+        Parameters
+            party_size: int
+                Number of seats per party, from 1
+        Returns
+            np.ndarray
+        """
+        free = self.slots() == 0
+        rows = free.shape[0]
+        # Bordered by booked seats, so every run has a start and an end
+        edges = np.diff(np.pad(free, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+        run_rows, starts = np.nonzero(edges == 1)
+        _, ends = np.nonzero(edges == -1)
+        return np.bincount(
+            run_rows, weights=(ends - starts) // party_size, minlength=rows
+        ).astype(np.int64)
+
+    def unbook(self, mask: "np.ndarray") -> list[BookingID]:
+        """
+        Unbooks every booking whose Booking ID is set in a mask, as one write
+
+        Parameters
+            mask: np.ndarray
+                Booleans indexed by Booking ID, e.g. from a comparison over
+                an array of attributes of each booking
+        Returns
+            list[BookingID]
+                The Booking IDs unbooked
+        """
+        booking_ids = np.unique(self.slots())
+        booking_ids = booking_ids[(booking_ids != 0) & (booking_ids < len(mask))]
+        booking_ids = [
+            BookingID(booking_id) for booking_id in booking_ids[mask[booking_ids]]
+        ]
+        self._movie.unbook_many(booking_ids)
+        return booking_ids
@@ -0,0 +1,200 @@
+from threading import Lock
+from typing import Optional, Self
+from src._types import BookingID, BookingMap, BookingRequest, Movie
+
+
+class Cinema:
+    """
+    Registry of screenings, each a `Movie` guarded by its own lock
+
+    Calls on different screenings never contend with each other, so they can
+    run in parallel from a thread pool. The registry lock is only held while
+    adding or removing screenings.
+    """
+
+    def __init__(self) -> Self:
+        self._screenings: dict[str, tuple[Movie, Lock]] = {}
+        self._lock = Lock()
+
+    def __contains__(self, screening: str) -> bool:
+        return screening in self._screenings
+
+    def __len__(self) -> int:
+        return len(self._screenings)
+
+    def screenings(self) -> list[str]:
+        return list(self._screenings)
+
+    def add(self, screening: str, movie: Movie) -> None:
+        """
+        Registers a Movie under a screening
+
+        Parameters
+            screening: str
+                The key to register the Movie under
+            movie: Movie
+                The Movie to register
+        Returns
+            None
+        """
+        with self._lock:
+            if screening in self._screenings:
+                raise ValueError(f"Screening {screening} already exists.")
+            self._screenings[screening] = (movie, Lock())
+
+    def remove(self, screening: str) -> Movie:
+        with self._lock:
+            movie, _ = self._get(screening)
+            del self._screenings[screening]
+            return movie
+
+    def movie(self, screening: str) -> Movie:
+        """
+        Returns the Movie registered under a screening, without its lock
+
+        Only for reading what never changes, e.g. `rows` and `cols`, as most
+        Movie methods may unbook expired holds.
+        """
+        movie, _ = self._get(screening)
+        return movie
+
+    def seats_unbooked(self, screening: str) -> int:
+        movie, lock = self._get(screening)
+        with lock:
+            return movie.seats_unbooked()
+
+    def book(
+        self,
+        screening: str,
+        seats_to_book: int,
+        row_index: Optional[int] = None,
+        col_index: Optional[int] = None,
+    ) -> BookingID:
+        """
+        Makes a booking under a new Booking ID, with seats picked as per `Movie.book`
+
+        Unlike `Movie.book`, a starting seat never books under the latest
+        Booking ID, as that may belong to another client of the screening.
+
+        Parameters
+            screening: str
+                The screening to book
+            seats_to_book: int
+                Number of seats to book
+            row_index: Optional[int]
+                Starting row index, if any
+            col_index: Optional[int]
+                Starting col index, if any
+        Returns
+            BookingID
+        """
+        movie, lock = self._get(screening)
+        with lock:
+            return movie.commit(movie.preview(seats_to_book, row_index, col_index))
+
+    def book_many(
+        self, screening: str, requests: list[BookingRequest]
+    ) -> list[BookingID]:
+        movie, lock = self._get(screening)
+        with lock:
+            return movie.book_many(requests)
+
+    def move(
+        self,
+        screening: str,
+        booking_id: BookingID,
+        row_index: int,
+        col_index: int,
+        seats_to_book: Optional[int] = None,
+    ) -> list[tuple[int, int, str]]:
+        """
+        Moves a booking to start from a seat, as per `Movie.move`
+
+        Parameters
+            screening: str
+                The screening the booking is for
+            booking_id: BookingID
+                The Booking ID to move
+            row_index: int
+                Starting row index
+            col_index: int
+                Starting col index
+            seats_to_book: Optional[int]
+                Number of seats to book, by default as many as the booking has
+        Returns
+            list[tuple[int, int, str]]
+        """
+        movie, lock = self._get(screening)
+        with lock:
+            return movie.move(booking_id, row_index, col_index, seats_to_book)
+
+    def confirm(self, screening: str, booking_id: BookingID) -> bool:
+        movie, lock = self._get(screening)
+        with lock:
+            return movie.confirm(booking_id)
+
+    def unbook(self, screening: str, booking_id: BookingID) -> None:
+        movie, lock = self._get(screening)
+        with lock:
+            movie.unbook(booking_id)
+
+    def get_booking(
+        self, screening: str, booking_id: BookingID
+    ) -> Optional[list[tuple[int, int]]]:
+        movie, lock = self._get(screening)
+        with lock:
+            return movie.get_booking(booking_id)
+
+    def changes_since(
+        self, screening: str, version: int, booking_id: BookingID
+    ) -> tuple[int, Optional[list[tuple[int, int, str]]]]:
+        """
+        Returns the current version of a screening, and its changes since `version`
+
+        Parameters
+            screening: str
+                The screening to diff
+            version: int
+                A past version of the screening
+            booking_id: BookingID
+                The Booking ID to highlight, as per `Movie.changes_since`
+        Returns
+            tuple[int, Optional[list[tuple[int, int, str]]]]
+        """
+        movie, lock = self._get(screening)
+        with lock:
+            changes = movie.changes_since(version, booking_id)
+            return movie.version, changes
+
+    def get_map(self, screening: str, booking_id: BookingID) -> BookingMap:
+        movie, lock = self._get(screening)
+        with lock:
+            return movie.get_map(booking_id)
+
+    def get_viewport(
+        self, screening: str, booking_id: BookingID, height: int, width: int
+    ) -> BookingMap:
+        """
+        Constructs a map of the window of seats around a booking, as per
+        `Movie.get_viewport`
+
+        Parameters
+            screening: str
+                The screening to render
+            booking_id: BookingID
+                The Booking ID to highlight
+            height: int
+                Number of lines the map has to fit in
+            width: int
+                Number of chars per line the map has to fit in
+        Returns
+            BookingMap
+        """
+        movie, lock = self._get(screening)
+        with lock:
+            return movie.get_viewport(booking_id, height, width)
+
+    def _get(self, screening: str) -> tuple[Movie, Lock]:
+        if (entry := self._screenings.get(screening)) is None:
+            raise KeyError(f"Screening {screening} does not exist.")
+        return entry
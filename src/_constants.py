@@ -5,8 +5,30 @@ MOVIE_MAX_ROWS: Final = 26
 MOVIE_MIN_COLS: Final = 1
 MOVIE_MAX_COLS: Final = 50
 
-BOOKING_ID_PAD: Final = 4
+VENUE_MAX_ROWS: Final = 18_278  # Up to row ZZZ
+VENUE_MAX_COLS: Final = 999
+
+BOOKING_ID_PREFIX: Final = "GIC"
+BOOKING_ID_PAD: Final = 4  # Minimum number of digits, not a maximum
 BOOKING_MAP_MIN_WIDTH: Final = 27
 BOOKING_MAP_COL_WIDTH: Final = 4
+BOOKING_MAP_CHROME_LINES: Final = 6  # Lines of a map other than rows of seats
+BOOKING_HOLD_TTL: Final = 300.0
+
+GRID_CHANGES_MAX: Final = 4_096  # Seat changes to remember for diffs
+GRID_EMPTY_CACHE_SIZE: Final = 16  # Sizes of empty grid to share seats of
+PLAN_CACHE_SIZE: Final = 32  # Plans to remember per Movie, see `Movie.preview`
 
 SCREEN_DEFAULT_SPACING: Final = 2
+SCREEN_PROMPT_LINES: Final = 4  # Lines to keep free below a map for a prompt
+SCREEN_BUFFER_SIZE: Final = 1 << 16  # Chars of output to buffer when headless
+
+# Lines and chars per line of maps sent to server clients, until they send
+# their own. Fits the whole map of any screening up to the standard maximum
+SERVER_MAP_HEIGHT: Final = 40
+SERVER_MAP_WIDTH: Final = 210
+
+HISTOGRAM_SUB_BUCKET_BITS: Final = 5  # Buckets are within 1/16 of their values
+
+LOG_SYNC_EVERY: Final = 64
+LOG_SNAPSHOT_EVERY: Final = 10_000
@@ -1,7 +1,12 @@
-from enum import IntEnum
+from enum import IntEnum, StrEnum
 
 
 class MainMenuOptions(IntEnum):
     MAKE_BOOKING = ord("1")
     CHECK_BOOKING = ord("2")
     EXIT = ord("3")
+
+
+class MetricsFormat(StrEnum):
+    JSON = "json"
+    PROMETHEUS = "prometheus"
@@ -0,0 +1,452 @@
+import atexit
+import json
+import os
+import signal
+import sys
+from functools import wraps
+from threading import RLock, local
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Callable, Optional, Self
+from src._constants import HISTOGRAM_SUB_BUCKET_BITS
+from src._enums import MetricsFormat
+from src._types import Movie, SeatGrid
+
+
+if TYPE_CHECKING:
+    from src._tui import ScrollingScreen
+
+
+# Movie methods to time, and count seats scanned by
+_MOVIE_OPERATIONS = (
+    "book",
+    "book_many",
+    "preview",
+    "commit",
+    "move",
+    "unbook",
+    "get_map",
+    "get_viewport",
+    "seats_unbooked",
+)
+# ScrollingScreen methods to time, and count scroll retries of
+_SCREEN_OPERATIONS = ("addstr",)
+# SeatGrid methods which look at seats, and how many seats each call looks at
+_SCANS: dict[str, Callable[[SeatGrid, Any], int]] = {
+    "row_mask": lambda grid, _: grid.cols,
+    "row_center_mask": lambda grid, _: grid.cols,
+    "is_booked": lambda grid, _: 1,
+    "get_row": lambda grid, row: len(row),
+}
+
+_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+_SUB_BUCKETS = 1 << HISTOGRAM_SUB_BUCKET_BITS
+_HALF_SUB_BUCKETS = _SUB_BUCKETS >> 1
+
+
+def _bucket(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - HISTOGRAM_SUB_BUCKET_BITS
+    return shift * _HALF_SUB_BUCKETS + (value >> shift)
+
+
+def _bucket_start(bucket: int) -> int:
+    if bucket < _SUB_BUCKETS:
+        return bucket
+    shift = bucket // _HALF_SUB_BUCKETS - 1
+    return (bucket - shift * _HALF_SUB_BUCKETS) << shift
+
+
+class Histogram:
+    """
+    Counts of non-negative ints, in log-linear buckets as per HdrHistogram
+
+    Values below `2 ** HISTOGRAM_SUB_BUCKET_BITS` have a bucket each. Above
+    that, every power of two is split into as many buckets as half that,
+    so buckets stay within the same fraction of their values at any scale,
+    and only buckets which were recorded into take up memory.
+    """
+
+    def __init__(self) -> Self:
+        self._counts: dict[int, int] = {}
+        self._count = 0
+        self._sum = 0
+        self._min = 0
+        self._max = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> int:
+        return self._sum
+
+    @property
+    def min(self) -> int:
+        return self._min
+
+    @property
+    def max(self) -> int:
+        return self._max
+
+    def record(self, value: int) -> None:
+        bucket = _bucket(value)
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        self._min = min(self._min, value) if self._count else value
+        self._max = max(self._max, value)
+        self._count += 1
+        self._sum += value
+
+    def buckets(self) -> list[tuple[int, int]]:
+        """
+        Returns the upper bound and count of every bucket recorded into
+
+        Returns
+            list[tuple[int, int]]
+                The `(upper_bound, count)` of each bucket, where the upper
+                bound is inclusive, in order
+        """
+        return [
+            (_bucket_start(bucket + 1) - 1, self._counts[bucket])
+            for bucket in sorted(self._counts)
+        ]
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Returns the upper bound of the bucket holding a percentile
+
+        Parameters
+            percentile: float
+                Percentile, from 0 to 100
+        Returns
+            int
+        """
+        rank = max(percentile / 100 * self._count, 1)
+        seen = 0
+        for upper_bound, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return min(upper_bound, self._max)
+        return self._max
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self._count,
+            "sum": self._sum,
+            "min": self._min,
+            "max": self._max,
+            **{
+                f"p{percentile:g}": self.percentile(percentile)
+                for percentile in _PERCENTILES
+            },
+            "buckets": self.buckets(),
+        }
+
+
+class Instruments:
+    """
+    Histograms of latency and seats scanned, per operation and screening,
+    and a count of scroll retries
+
+    Operations on screens rather than screenings are under a screening of "".
+    """
+
+    def __init__(self) -> Self:
+        # Reentrant, as a dump on a signal may interrupt a record
+        self._lock = RLock()
+        self._latency: dict[tuple[str, str], Histogram] = {}
+        self._scanned: dict[tuple[str, str], Histogram] = {}
+        self._scroll_retries = 0
+        self._local = local()
+
+    @property
+    def scroll_retries(self) -> int:
+        return self._scroll_retries
+
+    def latency(self, operation: str, screening: str = "") -> Optional[Histogram]:
+        """Returns the latency of an operation, in nanoseconds, if recorded"""
+        return self._latency.get((operation, screening))
+
+    def scanned(self, operation: str, screening: str) -> Optional[Histogram]:
+        """Returns the seats scanned per call of an operation, if recorded"""
+        return self._scanned.get((operation, screening))
+
+    def record(
+        self,
+        operation: str,
+        screening: str,
+        nanoseconds: int,
+        seats_scanned: Optional[int] = None,
+    ) -> None:
+        """
+        Records a call of an operation
+
+        Parameters
+            operation: str
+                Name of the operation, e.g. `book`
+            screening: str
+                Title of the screening, or "" for operations on screens
+            nanoseconds: int
+                Time taken by the call
+            seats_scanned: Optional[int]
+                Number of seats looked at by the call, if counted
+        Returns
+            None
+        """
+        key = (operation, screening)
+        with self._lock:
+            if (latency := self._latency.get(key)) is None:
+                latency = self._latency[key] = Histogram()
+            latency.record(nanoseconds)
+            if seats_scanned is not None:
+                if (scanned := self._scanned.get(key)) is None:
+                    scanned = self._scanned[key] = Histogram()
+                scanned.record(seats_scanned)
+
+    def record_scroll_retries(self, retries: int) -> None:
+        if retries:
+            with self._lock:
+                self._scroll_retries += retries
+
+    def scan(self, seats: int) -> None:
+        """Counts seats looked at by the current thread"""
+        self._local.seats = self.seats_scanned() + seats
+
+    def seats_scanned(self) -> int:
+        """Returns the seats looked at by the current thread so far"""
+        return getattr(self._local, "seats", 0)
+
+    def dump(self, format: MetricsFormat) -> str:
+        """
+        Returns everything recorded so far, as JSON or Prometheus text
+
+        Parameters
+            format: MetricsFormat
+                The format to dump in
+        Returns
+            str
+        """
+        with self._lock:
+            match format:
+                case MetricsFormat.JSON:
+                    return self._to_json()
+                case MetricsFormat.PROMETHEUS:
+                    return self._to_prometheus()
+
+    def write(self, path: str, format: MetricsFormat) -> None:
+        """
+        Replaces a file with a dump, so readers never see a partial one
+
+        Parameters
+            path: str
+                Path of the file to write
+            format: MetricsFormat
+                The format to dump in
+        Returns
+            None
+        """
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w") as file:
+            file.write(self.dump(format))
+        os.replace(temporary_path, path)
+
+    def _to_json(self) -> str:
+        return json.dumps(
+            {
+                "operations": [
+                    {
+                        "operation": operation,
+                        "screening": screening,
+                        "latency_ns": latency.to_dict(),
+                        "seats_scanned": (
+                            scanned.to_dict()
+                            if (scanned := self._scanned.get((operation, screening)))
+                            else None
+                        ),
+                    }
+                    for (operation, screening), latency in self._latency.items()
+                ],
+                "scroll_retries": self._scroll_retries,
+            },
+            indent=2,
+        )
+
+    def _to_prometheus(self) -> str:
+        lines = [
+            "# HELP gic_operation_seconds Latency of operations",
+            "# TYPE gic_operation_seconds histogram",
+        ]
+        for key, latency in self._latency.items():
+            lines.extend(
+                _prometheus_histogram("gic_operation_seconds", key, latency, 1e-9)
+            )
+        lines.append("# HELP gic_seats_scanned Seats looked at per operation")
+        lines.append("# TYPE gic_seats_scanned histogram")
+        for key, scanned in self._scanned.items():
+            lines.extend(_prometheus_histogram("gic_seats_scanned", key, scanned, 1))
+        lines.append("# HELP gic_scroll_retries_total Prints retried after scrolling")
+        lines.append("# TYPE gic_scroll_retries_total counter")
+        lines.append(f"gic_scroll_retries_total {self._scroll_retries}")
+        return "\n".join(lines) + "\n"
+
+
+def _prometheus_histogram(
+    name: str, key: tuple[str, str], histogram: Histogram, scale: float
+) -> list[str]:
+    operation, screening = key
+    labels = f'operation="{_escape(operation)}",screening="{_escape(screening)}"'
+    lines = []
+    cumulative = 0
+    for upper_bound, count in histogram.buckets():
+        cumulative += count
+        lines.append(
+            f'{name}_bucket{{{labels},le="{upper_bound * scale:g}"}} {cumulative}'
+        )
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum * scale:g}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+def _escape(label: str) -> str:
+    return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _time_movie(method: Callable, operation: str, instruments: Instruments) -> Callable:
+    @wraps(method)
+    def wrapper(self: Movie, *args, **kwargs):
+        seats_scanned = instruments.seats_scanned()
+        start = perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            instruments.record(
+                operation,
+                self.title,
+                perf_counter_ns() - start,
+                instruments.seats_scanned() - seats_scanned,
+            )
+
+    return wrapper
+
+
+def _time_screen(
+    method: Callable, operation: str, instruments: Instruments
+) -> Callable:
+    @wraps(method)
+    def wrapper(self: "ScrollingScreen", *args, **kwargs):
+        scroll_retries = self.scroll_retries
+        start = perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            instruments.record(operation, "", perf_counter_ns() - start)
+            instruments.record_scroll_retries(self.scroll_retries - scroll_retries)
+
+    return wrapper
+
+
+def _count_scan(
+    method: Callable, seats: Callable[[SeatGrid, Any], int], instruments: Instruments
+) -> Callable:
+    @wraps(method)
+    def wrapper(self: SeatGrid, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        instruments.scan(seats(self, result))
+        return result
+
+    return wrapper
+
+
+_instruments: Optional[Instruments] = None
+_originals: dict[tuple[type, str], Callable] = {}
+
+
+def _swap(cls: type, name: str, method: Callable) -> None:
+    _originals[(cls, name)] = cls.__dict__[name]
+    setattr(cls, name, method)
+
+
+def enable(instruments: Optional[Instruments] = None) -> Instruments:
+    """
+    Starts recording into a set of instruments, replacing any before
+
+    Instrumented methods are swapped onto `Movie`, `ScrollingScreen` and
+    `SeatGrid` only while enabled, so instrumentation costs nothing at all
+    until then, and again once disabled. `ScrollingScreen` is only
+    instrumented if `src._tui` is already imported, so that headless runs
+    never load curses.
+
+    Parameters
+        instruments: Optional[Instruments]
+            The instruments to record into, by default new ones
+    Returns
+        Instruments
+    """
+    global _instruments
+    disable()
+    instruments = instruments if instruments is not None else Instruments()
+    for operation in _MOVIE_OPERATIONS:
+        _swap(
+            Movie,
+            operation,
+            _time_movie(getattr(Movie, operation), operation, instruments),
+        )
+    if (tui := sys.modules.get("src._tui")) is not None:
+        for operation in _SCREEN_OPERATIONS:
+            _swap(
+                tui.ScrollingScreen,
+                operation,
+                _time_screen(
+                    getattr(tui.ScrollingScreen, operation), operation, instruments
+                ),
+            )
+    for name, seats in _SCANS.items():
+        _swap(SeatGrid, name, _count_scan(getattr(SeatGrid, name), seats, instruments))
+    _instruments = instruments
+    return instruments
+
+
+def disable() -> Optional[Instruments]:
+    """
+    Stops recording, putting back the original methods
+
+    Returns
+        Optional[Instruments]
+            The instruments recorded into, if enabled
+    """
+    global _instruments
+    for (cls, name), method in _originals.items():
+        setattr(cls, name, method)
+    _originals.clear()
+    instruments, _instruments = _instruments, None
+    return instruments
+
+
+def enabled() -> Optional[Instruments]:
+    return _instruments
+
+
+def install(
+    path: str, format: MetricsFormat, signum: int = signal.SIGUSR1
+) -> Instruments:
+    """
+    Enables instrumentation, writing a dump on a signal and at exit
+
+    Parameters
+        path: str
+            Path of the file to write dumps to, as per `Instruments.write`
+        format: MetricsFormat
+            The format to dump in
+        signum: int = signal.SIGUSR1
+            The signal to write a dump on
+    Returns
+        Instruments
+    """
+    instruments = enable()
+    signal.signal(signum, lambda *_: instruments.write(path, format))
+    # Reads from the terminal carry on after a dump, rather than failing
+    signal.siginterrupt(signum, False)
+    atexit.register(instruments.write, path, format)
+    return instruments
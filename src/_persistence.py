@@ -0,0 +1,345 @@
+import os
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Self
+from src._constants import LOG_SNAPSHOT_EVERY, LOG_SYNC_EVERY
+from src._types import BookingID, Movie
+
+
+# Every record and snapshot is framed by the CRC32 and length of its body
+_FRAME = struct.Struct("<II")
+# Log record body: op, booking counter, number of seats, Booking ID
+_RECORD = struct.Struct("<BIII")
+# Snapshot body: log segment, rows, cols, booking counter, number of bookings,
+# number of held bookings
+_SNAPSHOT = struct.Struct("<IIIIII")
+# Snapshot booking: number of seats, Booking ID
+_BOOKING = struct.Struct("<II")
+# Snapshot held booking: Booking ID
+_HELD = struct.Struct("<I")
+
+_OP_BOOK = 1
+_OP_UNBOOK = 2
+_OP_HOLD = 3
+_OP_CONFIRM = 4
+
+_SNAPSHOT_MAGIC = b"GICS"
+_SNAPSHOT_NAME = "snapshot"
+_SEGMENT_PREFIX = "wal."
+
+
+def _frame(body: bytes) -> bytes:
+    return _FRAME.pack(zlib.crc32(body), len(body)) + body
+
+
+def _pack_seats(seats: list[tuple[int, int]]) -> bytes:
+    indexes = array("H", [index for seat in seats for index in seat])
+    if sys.byteorder == "big":
+        indexes.byteswap()
+    return indexes.tobytes()
+
+
+def _unpack_seats(data: bytes) -> list[tuple[int, int]]:
+    indexes = array("H")
+    indexes.frombytes(data)
+    if sys.byteorder == "big":
+        indexes.byteswap()
+    return list(zip(indexes[::2], indexes[1::2]))
+
+
+class BookingLog:
+    """
+    Append-only binary write-ahead log of bookings and unbookings
+
+    Records are buffered and written with a single fsync once `sync_every`
+    records are pending, or when `sync` is called, so that the cost of an
+    fsync is shared by a group of records. Records still in the buffer are
+    lost on a crash, so `sync` before acknowledging anything as durable.
+    """
+
+    def __init__(self, path: Path, sync_every: int = LOG_SYNC_EVERY) -> Self:
+        self._path = path
+        self._file: BinaryIO = open(path, "ab")
+        self._sync_every = sync_every
+        self._buffer = bytearray()
+        self._pending = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def record_book(
+        self,
+        booking_id: BookingID,
+        seats: list[tuple[int, int]],
+        booking_counter: int,
+        held: bool = False,
+    ) -> None:
+        self._append(
+            _RECORD.pack(
+                _OP_HOLD if held else _OP_BOOK, booking_counter, len(seats), booking_id
+            )
+            + _pack_seats(seats)
+        )
+
+    def record_confirm(self, booking_id: BookingID) -> None:
+        self._append(_RECORD.pack(_OP_CONFIRM, 0, 0, booking_id))
+
+    def record_unbook(self, booking_id: BookingID) -> None:
+        self._append(_RECORD.pack(_OP_UNBOOK, 0, 0, booking_id))
+
+    def sync(self) -> None:
+        """Writes and fsyncs every pending record"""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+            self._pending = 0
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self.sync()
+        self._file.close()
+
+    def _append(self, body: bytes) -> None:
+        self._buffer += _frame(body)
+        self._pending += 1
+        if self._pending >= self._sync_every:
+            self.sync()
+
+    @staticmethod
+    def replay(path: Path, movie: Movie, held: Optional[set[BookingID]] = None) -> int:
+        """
+        Applies every intact record in a log to a Movie, raising ValueError
+        if one holds other than its number of seats
+
+        Bookings still held at the end of the log are unbooked, as whoever
+        held them is gone and their holds cannot be confirmed.
+
+        Parameters
+            path: Path
+                The log to replay
+            movie: Movie
+                The Movie to apply records to
+            held: Optional[set[BookingID]]
+                Booking IDs held before the log, e.g. as of a snapshot
+        Returns
+            int
+                The length of the intact prefix of the log, in bytes
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        held = set(held) if held is not None else set()
+        offset = 0
+        for end, body in _read_frames(data):
+            op, booking_counter, seat_count, booking_id = _RECORD.unpack_from(body)
+            if len(body) - _RECORD.size != 4 * seat_count:
+                raise ValueError(f"Log record at offset {offset} is corrupt.")
+            booking_id = BookingID(booking_id)
+            if op in (_OP_BOOK, _OP_HOLD):
+                movie.restore(booking_id, _unpack_seats(body[_RECORD.size :]))
+                movie.restore_booking_counter(booking_counter)
+            elif op == _OP_UNBOOK:
+                movie.unbook(booking_id)
+            if op == _OP_HOLD:
+                held.add(booking_id)
+            else:
+                held.discard(booking_id)
+            offset = end
+
+        for booking_id in held:
+            movie.unbook(booking_id)
+        return offset
+
+
+class BookingStore:
+    """
+    Durable storage for a `Movie`, as snapshots plus a log of later changes
+
+    The store directory holds the latest snapshot, and the log segment that
+    was started when it was taken. Recovery loads the snapshot then replays
+    only that segment. A snapshot is taken every `snapshot_every` records,
+    or when `snapshot` is called.
+
+    Held bookings which were never confirmed are not recovered.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        sync_every: int = LOG_SYNC_EVERY,
+        snapshot_every: Optional[int] = LOG_SNAPSHOT_EVERY,
+    ) -> Self:
+        self._directory = Path(directory)
+        self._sync_every = sync_every
+        self._snapshot_every = snapshot_every
+        self._movie: Optional[Movie] = None
+        self._log: Optional[BookingLog] = None
+        self._segment = 0
+        self._records = 0
+
+    def recover(self, movie: Movie) -> Movie:
+        """
+        Restores a freshly constructed Movie from the store, then journals it
+
+        Parameters
+            movie: Movie
+                An empty Movie, with the same rows and cols as when stored
+        Returns
+            Movie
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        held: set[BookingID] = set()
+        self._segment = self._load_snapshot(movie, held) if self._has_snapshot() else 1
+
+        # Replayed even if empty, to drop bookings held as of the snapshot
+        segment_path = self._segment_path(self._segment)
+        segment_path.touch()
+        with open(segment_path, "r+b") as file:
+            file.truncate(BookingLog.replay(segment_path, movie, held))
+        self._remove_segments_before(self._segment)
+
+        self._movie = movie
+        self._log = BookingLog(segment_path, self._sync_every)
+        movie.journal = self
+        return movie
+
+    def record_book(
+        self,
+        booking_id: BookingID,
+        seats: list[tuple[int, int]],
+        booking_counter: int,
+        held: bool = False,
+    ) -> None:
+        self._log.record_book(booking_id, seats, booking_counter, held)
+        self._count_record()
+
+    def record_confirm(self, booking_id: BookingID) -> None:
+        self._log.record_confirm(booking_id)
+        self._count_record()
+
+    def record_unbook(self, booking_id: BookingID) -> None:
+        self._log.record_unbook(booking_id)
+        self._count_record()
+
+    def sync(self) -> None:
+        self._log.sync()
+
+    def close(self) -> None:
+        self._log.close()
+        self._movie.journal = None
+
+    def snapshot(self) -> None:
+        """
+        Writes a snapshot of the Movie, then starts a new log segment
+        """
+        movie = self._movie
+        self._log.sync()
+
+        bookings = movie.bookings()
+        holds = movie.holds()
+        body = bytearray(
+            _SNAPSHOT.pack(
+                self._segment + 1,
+                movie.rows,
+                movie.cols,
+                movie.booking_counter,
+                len(bookings),
+                len(holds),
+            )
+        )
+        for booking_id, seats in bookings.items():
+            body += _BOOKING.pack(len(seats), booking_id)
+            body += _pack_seats(seats)
+        for booking_id in holds:
+            body += _HELD.pack(booking_id)
+
+        temporary_path = self._directory / f"{_SNAPSHOT_NAME}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(_SNAPSHOT_MAGIC + _frame(bytes(body)))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self._directory / _SNAPSHOT_NAME)
+        self._fsync_directory()
+
+        self._log.close()
+        self._segment += 1
+        self._log = BookingLog(self._segment_path(self._segment), self._sync_every)
+        self._remove_segments_before(self._segment)
+        self._records = 0
+
+    def _count_record(self) -> None:
+        self._records += 1
+        if self._snapshot_every is not None and self._records >= self._snapshot_every:
+            self.snapshot()
+
+    def _has_snapshot(self) -> bool:
+        return (self._directory / _SNAPSHOT_NAME).exists()
+
+    def _load_snapshot(self, movie: Movie, held: set[BookingID]) -> int:
+        with open(self._directory / _SNAPSHOT_NAME, "rb") as file:
+            data = file.read()
+        if data[: len(_SNAPSHOT_MAGIC)] != _SNAPSHOT_MAGIC:
+            raise ValueError("Snapshot is corrupt.")
+        frames = list(_read_frames(data[len(_SNAPSHOT_MAGIC) :]))
+        if len(frames) != 1:
+            raise ValueError("Snapshot is corrupt.")
+        _, body = frames[0]
+
+        segment, rows, cols, booking_counter, booking_count, held_count = (
+            _SNAPSHOT.unpack_from(body)
+        )
+        if (rows, cols) != (movie.rows, movie.cols):
+            raise ValueError(
+                f"Snapshot is of {rows} rows and {cols} seats per row, "
+                f"not {movie.rows} rows and {movie.cols} seats per row."
+            )
+
+        offset = _SNAPSHOT.size
+        for _ in range(booking_count):
+            seat_count, booking_id = _BOOKING.unpack_from(body, offset)
+            booking_id = BookingID(booking_id)
+            offset += _BOOKING.size
+            seats = _unpack_seats(body[offset : offset + 4 * seat_count])
+            offset += 4 * seat_count
+            movie.restore(booking_id, seats)
+        movie.restore_booking_counter(booking_counter)
+        for _ in range(held_count):
+            (booking_id,) = _HELD.unpack_from(body, offset)
+            offset += _HELD.size
+            held.add(BookingID(booking_id))
+        return segment
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._directory / f"{_SEGMENT_PREFIX}{segment:06d}"
+
+    def _remove_segments_before(self, segment: int) -> None:
+        for path in self._directory.glob(f"{_SEGMENT_PREFIX}*"):
+            if int(path.name.removeprefix(_SEGMENT_PREFIX)) < segment:
+                path.unlink()
+
+    def _fsync_directory(self) -> None:
+        directory = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def _read_frames(data: bytes) -> Iterator[tuple[int, bytes]]:
+    """
+    Yields the end offset and body of each intact frame, up to the first torn one
+    """
+    offset = 0
+    while offset + _FRAME.size <= len(data):
+        crc, length = _FRAME.unpack_from(data, offset)
+        start = offset + _FRAME.size
+        body = data[start : start + length]
+        if len(body) < length or zlib.crc32(body) != crc:
+            return
+        offset = start + length
+        yield offset, body
@@ -0,0 +1,255 @@
+import asyncio
+from typing import Callable, Optional, Self
+from src._addressing import format_seat, parse_seat
+from src._cinema import Cinema
+from src._constants import SERVER_MAP_HEIGHT, SERVER_MAP_WIDTH
+from src._types import BookingID, BookingMap
+
+
+class Session:
+    """
+    State of one client connection: its screening, its pending booking, and
+    the window its maps are rendered in
+    """
+
+    def __init__(self) -> Self:
+        self.screening: Optional[str] = None
+        self.booking_id: Optional[BookingID] = None
+        self.seats_to_book = 0
+        self.window = (SERVER_MAP_HEIGHT, SERVER_MAP_WIDTH)
+
+
+class BookingServer:
+    """
+    Line protocol front-end serving a `Cinema` to many clients at once
+
+    Each request is a single line, a command followed by its arguments.
+    Each response is a status line, `OK [...]` or `ERR [...]`, followed by
+    any payload lines, and terminated by a line holding a single `.`. Maps
+    are only of the seats around the booking which fit the session's window,
+    as per `Movie.get_viewport`, so that replies stay small in large venues.
+
+    Commands
+        SCREENINGS              List screenings
+        USE <screening>         Select a screening for this session
+        WINDOW <height> <width> Render maps in a window of `height` lines of
+                                `width` chars, by default `SERVER_MAP_HEIGHT`
+                                by `SERVER_MAP_WIDTH`
+        AVAILABLE               Number of seats available
+        BOOK <seats>            Hold seats, as per menu option [1], releasing any
+                                seats held but not yet accepted
+        MOVE <seat>             Move the held seats to start at e.g. `B03` or `AA12`
+        ACCEPT                  Confirm the held seats
+        CHECK <booking_id>      Show a booking, as per menu option [2]
+        CHANGES [<version>]     The current version, and the seats changed since
+                                `version` as lines of e.g. `B3 o`, highlighting
+                                the held seats
+        QUIT                    Close the session, as per menu option [3]
+
+    Commands run to completion on the event loop without awaiting, and go
+    through the screening's lock in `Cinema`, so requests against the same
+    screening are applied one at a time.
+
+    Given a `sync`, e.g. `BookingStore.sync` by screening, confirmations are
+    only acknowledged once the screening is synced. Every confirmation for a
+    screening handled in the same event loop iteration shares one sync.
+    """
+
+    def __init__(
+        self, cinema: Cinema, sync: Optional[Callable[[str], None]] = None
+    ) -> Self:
+        self._cinema = cinema
+        self._sync = sync
+        self._syncs: dict[str, asyncio.Future] = {}
+
+    async def start(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        path: Optional[str] = None,
+    ) -> asyncio.Server:
+        """
+        Starts listening on a TCP host and port, or on a Unix socket path
+
+        Parameters
+            host: Optional[str]
+                TCP host to listen on
+            port: Optional[int]
+                TCP port to listen on
+            path: Optional[str]
+                Unix socket path to listen on, instead of TCP
+        Returns
+            asyncio.Server
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path)
+        return await asyncio.start_server(self.handle, host, port)
+
+    async def serve_forever(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        path: Optional[str] = None,
+    ) -> None:
+        server = await self.start(host, port, path)
+        async with server:
+            await server.serve_forever()
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        session = Session()
+        try:
+            while line := await reader.readline():
+                command, _, argument = line.decode().strip().partition(" ")
+                status, payload = self.execute(session, command.upper(), argument)
+                if command.upper() == "ACCEPT" and status.startswith("OK"):
+                    await self._synced(session.screening)
+                writer.write(
+                    "\n".join([status, *payload.splitlines(), "."]).encode() + b"\n"
+                )
+                await writer.drain()
+                if command.upper() == "QUIT":
+                    break
+        finally:
+            self._release(session)
+            writer.close()
+
+    def _release(self, session: Session) -> None:
+        """Unbooks the session's pending booking, if it was never accepted"""
+        if session.booking_id is not None:
+            self._cinema.unbook(session.screening, session.booking_id)
+            session.booking_id = None
+
+    async def _synced(self, screening: str) -> None:
+        """Waits for the next sync of a screening, scheduling one if none is"""
+        if self._sync is None:
+            return
+        if (synced := self._syncs.get(screening)) is None:
+            loop = asyncio.get_running_loop()
+            synced = self._syncs[screening] = loop.create_future()
+            loop.call_soon(self._sync_screening, screening)
+        await synced
+
+    def _sync_screening(self, screening: str) -> None:
+        synced = self._syncs.pop(screening)
+        try:
+            self._sync(screening)
+        except Exception as e:
+            synced.set_exception(e)
+        else:
+            synced.set_result(None)
+
+    def _map(self, session: Session, booking_id: BookingID) -> BookingMap:
+        return self._cinema.get_viewport(session.screening, booking_id, *session.window)
+
+    def execute(self, session: Session, command: str, argument: str) -> tuple[str, str]:
+        """
+        Executes a command for a session, returning a status and a payload
+
+        Parameters
+            session: Session
+                The session of the client sending the command
+            command: str
+                The command, in upper case
+            argument: str
+                The rest of the request line
+        Returns
+            tuple[str, str]
+        """
+        cinema = self._cinema
+        try:
+            match command:
+                case "SCREENINGS":
+                    return "OK", "\n".join(cinema.screenings())
+                case "USE":
+                    if argument not in cinema:
+                        return f"ERR Screening {argument} does not exist.", ""
+                    self._release(session)
+                    session.screening = argument
+                    return "OK", ""
+                case "WINDOW":
+                    height, width = map(int, argument.split())
+                    if height <= 0 or width <= 0:
+                        return "ERR Window height and width must be positive.", ""
+                    session.window = (height, width)
+                    return "OK", ""
+                case "QUIT":
+                    return "OK Thank you for using GIC Cinemas system. Bye!", ""
+
+            if (screening := session.screening) is None:
+                return "ERR Select a screening with USE first.", ""
+
+            match command:
+                case "AVAILABLE":
+                    return f"OK {cinema.seats_unbooked(screening)}", ""
+                case "BOOK":
+                    if (seats_to_book := int(argument)) <= 0:
+                        return "ERR Number of tickets must be positive.", ""
+                    self._release(session)
+                    if seats_to_book > (seats := cinema.seats_unbooked(screening)):
+                        return f"ERR Sorry, there are only {seats} seats available.", ""
+                    session.booking_id = cinema.book(screening, seats_to_book)
+                    session.seats_to_book = seats_to_book
+                    return f"OK {session.booking_id}", self._map(
+                        session, session.booking_id
+                    )
+                case "MOVE":
+                    if session.booking_id is None:
+                        return "ERR No booking to move.", ""
+                    movie = cinema.movie(screening)
+                    try:
+                        row_index, col_index = parse_seat(
+                            argument, movie.rows, movie.cols
+                        )
+                    except ValueError as e:
+                        return f"ERR {e}", ""
+                    try:
+                        cinema.move(
+                            screening,
+                            session.booking_id,
+                            row_index,
+                            col_index,
+                            session.seats_to_book,
+                        )
+                    except ValueError as e:
+                        # A booking which could not be moved keeps its seats
+                        if cinema.get_booking(screening, session.booking_id) is None:
+                            session.booking_id = None
+                        return f"ERR {e}", ""
+                    return f"OK {session.booking_id}", self._map(
+                        session, session.booking_id
+                    )
+                case "ACCEPT":
+                    if (booking_id := session.booking_id) is None:
+                        return "ERR No booking to accept.", ""
+                    session.booking_id = None
+                    if not cinema.confirm(screening, booking_id):
+                        return f"ERR Sorry, booking id {booking_id} has expired.", ""
+                    return f"OK Booking id: {booking_id} confirmed.", ""
+                case "CHECK":
+                    booking_id = BookingID.parse(argument)
+                    if cinema.get_booking(screening, booking_id) is None:
+                        return f"ERR Sorry, booking id {argument} does not exist.", ""
+                    return "OK", self._map(session, booking_id)
+                case "CHANGES":
+                    if not argument:
+                        return f"OK {cinema.movie(screening).version}", ""
+                    version, changes = cinema.changes_since(
+                        screening, int(argument), session.booking_id
+                    )
+                    if changes is None:
+                        return (
+                            (
+                                f"ERR Changes since version {argument} are no "
+                                "longer available."
+                            ),
+                            "",
+                        )
+                    return f"OK {version}", "\n".join(
+                        f"{format_seat(row, col)} {chr}" for row, col, chr in changes
+                    )
+                case _:
+                    return f"ERR Unknown command {command}.", ""
+        except ValueError:
+            return f"ERR Invalid argument {argument}.", ""
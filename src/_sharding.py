@@ -0,0 +1,234 @@
+import multiprocessing
+import os
+import zlib
+from multiprocessing.connection import Connection
+from threading import Lock
+from typing import Any, Optional, Self
+from src._allocators import Allocator
+from src._cinema import Cinema
+from src._types import BookingID, BookingMap, BookingRequest, Movie
+
+
+# A call is a `Cinema` method name, a screening, and the rest of its arguments
+Call = tuple[str, str, tuple]
+
+
+def shard_of(screening: str, shards: int) -> int:
+    """
+    Returns the shard a screening belongs to, the same in every process
+
+    Parameters
+        screening: str
+            The screening to route, e.g. a title and show time
+        shards: int
+            Number of shards
+    Returns
+        int
+    """
+    return zlib.crc32(screening.encode()) % shards
+
+
+def _run_shard(connection: Connection) -> None:
+    """
+    Serves batches of calls against a `Cinema` of this shard's screenings
+
+    Each batch is a list of calls, answered by a list of `(ok, result)`,
+    where `result` is the exception raised if not `ok`. A batch of None
+    stops the shard.
+    """
+    cinema = Cinema()
+    while (calls := connection.recv()) is not None:
+        results = []
+        for method, screening, args in calls:
+            try:
+                if method == "add":
+                    result = cinema.add(screening, Movie(*args))
+                else:
+                    result = getattr(cinema, method)(screening, *args)
+            except Exception as e:
+                results.append((False, e))
+            else:
+                results.append((True, result))
+        connection.send(results)
+    connection.close()
+
+
+class ShardedCinema:
+    """
+    Front door to screenings partitioned across worker processes
+
+    Each worker process owns a `Cinema` of the screenings routed to it by
+    `shard_of`, so bookings on different shards run on different cores.
+    Calls are sent over a pipe per worker, and `batch` sends every call for
+    a worker in one message, then waits for all workers at once.
+
+    Each pipe is guarded by a lock, so many threads can share the router,
+    only contending when they call into the same shard.
+    """
+
+    def __init__(
+        self, shards: Optional[int] = None, start_method: str = "spawn"
+    ) -> Self:
+        context = multiprocessing.get_context(start_method)
+        self._shards = shards if shards is not None else os.cpu_count() or 1
+        self._connections: list[Connection] = []
+        self._locks: list[Lock] = []
+        self._processes: list[multiprocessing.Process] = []
+        self._screenings: dict[str, None] = {}
+        for _ in range(self._shards):
+            parent, child = context.Pipe()
+            process = context.Process(target=_run_shard, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._locks.append(Lock())
+            self._processes.append(process)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __contains__(self, screening: str) -> bool:
+        return screening in self._screenings
+
+    def __len__(self) -> int:
+        return len(self._screenings)
+
+    @property
+    def shards(self) -> int:
+        return self._shards
+
+    def screenings(self) -> list[str]:
+        return list(self._screenings)
+
+    def close(self) -> None:
+        for connection, lock in zip(self._connections, self._locks):
+            with lock:
+                connection.send(None)
+                connection.close()
+        for process in self._processes:
+            process.join()
+
+    def batch(self, calls: list[Call]) -> list[Any]:
+        """
+        Makes many calls at once, in order within each shard
+
+        Screenings must be added with `add` rather than through a batch.
+
+        Parameters
+            calls: list[Call]
+                The `(method, screening, args)` of each call
+        Returns
+            list[Any]
+                The result of each call, or the exception it raised
+        """
+        by_shard: dict[int, list[int]] = {}
+        for index, (_, screening, _) in enumerate(calls):
+            by_shard.setdefault(shard_of(screening, self._shards), []).append(index)
+
+        # Locks are taken in shard order, so concurrent batches cannot deadlock
+        shards = sorted(by_shard)
+        results: list[Any] = [None] * len(calls)
+        for shard in shards:
+            self._locks[shard].acquire()
+        try:
+            for shard in shards:
+                self._connections[shard].send([calls[i] for i in by_shard[shard]])
+            for shard in shards:
+                replies = self._connections[shard].recv()
+                for index, (_, result) in zip(by_shard[shard], replies):
+                    results[index] = result
+        finally:
+            for shard in shards:
+                self._locks[shard].release()
+        return results
+
+    def add(
+        self,
+        screening: str,
+        title: str,
+        rows: int,
+        cols: int,
+        allocator: Optional[Allocator] = None,
+        hold_ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Registers a new Movie under a screening, on the shard it belongs to
+
+        Parameters
+            screening: str
+                The key to register the Movie under
+            title: str
+                Title of the Movie
+            rows: int
+                Number of rows
+            cols: int
+                Number of seats per row
+            allocator: Optional[Allocator]
+                Allocator to pick seats with, which must be picklable
+            hold_ttl: Optional[float]
+                Seconds to hold bookings for until confirmed, if any
+        Returns
+            None
+        """
+        self._call("add", screening, title, rows, cols, allocator, hold_ttl)
+        self._screenings[screening] = None
+
+    def seats_unbooked(self, screening: str) -> int:
+        return self._call("seats_unbooked", screening)
+
+    def book(
+        self,
+        screening: str,
+        seats_to_book: int,
+        row_index: Optional[int] = None,
+        col_index: Optional[int] = None,
+    ) -> BookingID:
+        return self._call("book", screening, seats_to_book, row_index, col_index)
+
+    def book_many(
+        self, screening: str, requests: list[BookingRequest]
+    ) -> list[BookingID]:
+        return self._call("book_many", screening, requests)
+
+    def move(
+        self,
+        screening: str,
+        booking_id: BookingID,
+        row_index: int,
+        col_index: int,
+        seats_to_book: Optional[int] = None,
+    ) -> list[tuple[int, int, str]]:
+        return self._call(
+            "move", screening, booking_id, row_index, col_index, seats_to_book
+        )
+
+    def confirm(self, screening: str, booking_id: BookingID) -> bool:
+        return self._call("confirm", screening, booking_id)
+
+    def unbook(self, screening: str, booking_id: BookingID) -> None:
+        self._call("unbook", screening, booking_id)
+
+    def get_booking(
+        self, screening: str, booking_id: BookingID
+    ) -> Optional[list[tuple[int, int]]]:
+        return self._call("get_booking", screening, booking_id)
+
+    def get_map(self, screening: str, booking_id: BookingID) -> BookingMap:
+        return self._call("get_map", screening, booking_id)
+
+    def get_viewport(
+        self, screening: str, booking_id: BookingID, height: int, width: int
+    ) -> BookingMap:
+        return self._call("get_viewport", screening, booking_id, height, width)
+
+    def _call(self, method: str, screening: str, *args) -> Any:
+        shard = shard_of(screening, self._shards)
+        with self._locks[shard]:
+            self._connections[shard].send([(method, screening, args)])
+            ((ok, result),) = self._connections[shard].recv()
+        if not ok:
+            raise result
+        return result
@@ -0,0 +1,164 @@
+import os
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Optional, Self, TypeVar
+from src._addressing import row_label
+from src._types import BookingID, BookingMap, Movie, map_frame
+
+
+# Header: sequence, rows, cols, number of free seats, then the seat slots
+_HEADER = struct.Struct("<QIII4x")
+
+T = TypeVar("T")
+
+
+class SharedSeats:
+    """
+    Writer end of a Movie's seats in shared memory
+
+    The header holds a sequence number, which the writer makes odd before
+    changing any seats and even again once done, as a seqlock. Readers
+    retry whenever the sequence number was odd or changed while they were
+    reading, so they only ever see whole changes, without taking a lock.
+    """
+
+    def __init__(self, memory: SharedMemory, rows: int, cols: int) -> Self:
+        self._memory = memory
+        self._rows = rows
+        self._cols = cols
+        self._sequence = 0
+        self._depth = 0
+        self._slots = memory.buf[_HEADER.size :].cast("I")
+        self._movie: Optional[Movie] = None
+        self._publish(0)
+
+    @classmethod
+    def create(cls, movie: Movie, name: Optional[str] = None) -> Self:
+        """
+        Moves the seats of a Movie into a new block of shared memory
+
+        Parameters
+            movie: Movie
+                The Movie to share, which stays the only writer
+            name: Optional[str]
+                Name of the block of shared memory, by default a random one
+        Returns
+            SharedSeats
+        """
+        memory = SharedMemory(
+            name, create=True, size=_HEADER.size + 4 * movie.rows * movie.cols
+        )
+        shared = cls(memory, movie.rows, movie.cols)
+        movie.share(shared)
+        shared._movie = movie
+        return shared
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def slots(self) -> memoryview:
+        return self._slots
+
+    def begin(self) -> None:
+        self._depth += 1
+        if self._depth == 1:
+            self._sequence += 1
+            self._publish(self._free())
+
+    def end(self, free: int) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._sequence += 1
+            self._publish(free)
+
+    def close(self) -> None:
+        """Moves the seats back into the Movie, then frees the shared memory"""
+        if self._movie is not None:
+            self._movie.unshare()
+        self._slots.release()
+        self._memory.close()
+        self._memory.unlink()
+
+    def _free(self) -> int:
+        return _HEADER.unpack_from(self._memory.buf)[3]
+
+    def _publish(self, free: int) -> None:
+        _HEADER.pack_into(
+            self._memory.buf, 0, self._sequence, self._rows, self._cols, free
+        )
+
+
+class SeatMapReader:
+    """
+    Reader end of a Movie's seats in shared memory, for other processes
+
+    Renders straight from shared memory, without copying the seats first,
+    then checks that the writer did not change them meanwhile.
+    """
+
+    def __init__(self, name: str) -> Self:
+        self._memory = SharedMemory(name, track=False)
+        _, self._rows, self._cols, _ = _HEADER.unpack_from(self._memory.buf)
+        self._slots = self._memory.buf[_HEADER.size :].cast("I")
+        self._label_width, self._map_header, self._map_footer = map_frame(
+            self._rows, self._cols
+        )
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def cols(self) -> int:
+        return self._cols
+
+    def close(self) -> None:
+        self._slots.release()
+        self._memory.close()
+
+    def seats_unbooked(self) -> int:
+        return self._read(lambda: _HEADER.unpack_from(self._memory.buf)[3])
+
+    def get_map(self, booking_id: Optional[BookingID]) -> BookingMap:
+        """
+        Constructs and returns a map of seats, as per `Movie.get_map`
+
+        Parameters
+            booking_id: Optional[BookingID]
+                The Booking ID to show and highlight in the map, if any
+        Returns
+            BookingMap
+        """
+        return self._read(lambda: self._render(booking_id))
+
+    def _render(self, booking_id: Optional[BookingID]) -> BookingMap:
+        slot = booking_id or 0
+        cols = self._cols
+        slots = self._slots
+        booking_map = []
+        booking_map.append(f"Booking id: {booking_id or ''}")
+        booking_map.append("Selected seats:\n")
+        booking_map.append(self._map_header)
+        for row in reversed(range(self._rows)):
+            booking_row = [row_label(row).ljust(self._label_width)]
+            booking_row.extend(
+                "o" if seat and seat == slot else "#" if seat else "."
+                for seat in slots[row * cols : (row + 1) * cols]
+            )
+            booking_map.append("   ".join(booking_row))
+        booking_map.append(self._map_footer)
+        return BookingMap("\n".join(booking_map))
+
+    def _read(self, read: Callable[[], T]) -> T:
+        buffer = self._memory.buf
+        while True:
+            (start,) = struct.unpack_from("<Q", buffer)
+            if start % 2:
+                os.sched_yield()
+                continue
+            result = read()
+            (end,) = struct.unpack_from("<Q", buffer)
+            if start == end:
+                return result
@@ -0,0 +1,122 @@
+import curses
+from typing import Optional, Self
+from src._constants import SCREEN_DEFAULT_SPACING
+
+
+class ScrollingScreen:
+    def __init__(self, screen: curses.window) -> Self:
+        self._screen = screen
+        self._scroll_retries = 0
+
+        self._screen.clear()
+        self._screen.scrollok(True)
+        self._screen.idlok(True)
+
+    def getstr(self) -> str:
+        return self._screen.getstr().decode().strip()
+
+    def getch(self) -> int:
+        return self._screen.getch()
+
+    def deleteln(self) -> None:
+        self._screen.deleteln()
+
+    def clear(self) -> None:
+        self._screen.clear()
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self._screen.getmaxyx()
+
+    def getyx(self) -> tuple[int, int]:
+        return self._screen.getyx()
+
+    @property
+    def scroll_retries(self) -> int:
+        """Number of times `addstr` had to scroll and print again"""
+        return self._scroll_retries
+
+    def addstr(self, str: str, spacing: int = SCREEN_DEFAULT_SPACING) -> None:
+        """
+        Scrolls the screen instead of moving cursor out of bounds
+
+        Parameters
+            str: str
+                The string to be printed
+            spacing: int = SCREEN_DEFAULT_SPACING
+                The number of lines of spacing above the string to be printed
+        Returns
+            None
+        """
+        y, _ = self._screen.getyx()
+        try:
+            self._screen.addstr(y + spacing, 0, str)
+        except curses.error:
+            # Only the first line can be out of bounds, as the screen scrolls
+            # by itself once the string reaches the bottom
+            height, _ = self._screen.getmaxyx()
+            overflow = max(y + spacing - (height - 1), 1)
+            self._scroll_retries += 1
+            self._screen.scroll(overflow)
+            self._screen.addstr(y + spacing - overflow, 0, str)
+
+    def addpad(
+        self, str: str, spacing: int = SCREEN_DEFAULT_SPACING, reserve: int = 0
+    ) -> Optional[int]:
+        """
+        Prints a block of lines through a pad, clipped to the screen
+
+        The screen is scrolled once by as many lines as the block needs, and
+        only the region of the pad which fits is copied onto the screen, so
+        the cost does not depend on how far the block overflows.
+
+        Parameters
+            str: str
+                The block of lines to be printed, e.g. from `Movie.get_viewport`
+            spacing: int = SCREEN_DEFAULT_SPACING
+                The number of lines of spacing above the block to be printed
+            reserve: int = 0
+                The number of lines to keep free below the block
+        Returns
+            Optional[int]
+                The line the block starts at, for `repaint`
+        """
+        lines = str.split("\n")
+        pad_cols = max(map(len, lines)) + 1
+        pad = curses.newpad(len(lines) + 1, pad_cols)
+        pad.addstr(0, 0, str)
+
+        height, width = self._screen.getmaxyx()
+        shown = max(min(len(lines), height - 1 - reserve), 1)
+        y, _ = self._screen.getyx()
+        top = y + spacing
+        if (overflow := top + shown - (height - 1 - reserve)) > 0:
+            self._screen.scroll(overflow)
+            top = max(top - overflow, 0)
+
+        bottom = top + shown - 1
+        pad.overwrite(self._screen, 0, 0, top, 0, bottom, min(pad_cols, width) - 1)
+        self._screen.move(bottom, min(len(lines[shown - 1]), width - 1))
+        return top
+
+    def repaint(
+        self, top: int, cells: list[tuple[int, int, str]], cursor: tuple[int, int]
+    ) -> None:
+        """
+        Repaints cells of a block printed by `addpad` in place
+
+        Parameters
+            top: int
+                The line the block starts at, as returned by `addpad`
+            cells: list[tuple[int, int, str]]
+                The line and char offsets within the block, and char, of each cell
+            cursor: tuple[int, int]
+                Where to move the cursor to, clearing the screen below it
+        Returns
+            None
+        """
+        height, width = self._screen.getmaxyx()
+        for line, x, chr in cells:
+            if top + line < height and x < width:
+                self._screen.addch(top + line, x, chr)
+        self._screen.move(*cursor)
+        self._screen.clrtobot()
@@ -1,41 +1,139 @@
-import curses
-from typing import NewType, Optional, Self
+import sys
+from array import array
+from collections import OrderedDict
+from heapq import heappop, heappush
+from threading import Lock
+from time import monotonic
+from functools import lru_cache, wraps
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    NewType,
+    Optional,
+    Protocol,
+    Self,
+    TextIO,
+)
+from src._addressing import row_label
+from src._allocators import Allocator, CenterOutAllocator, center_out_ranks
 from src._constants import (
     MOVIE_MIN_ROWS,
     MOVIE_MAX_ROWS,
     MOVIE_MIN_COLS,
     MOVIE_MAX_COLS,
+    BOOKING_ID_PREFIX,
     BOOKING_ID_PAD,
     BOOKING_MAP_MIN_WIDTH,
     BOOKING_MAP_COL_WIDTH,
+    BOOKING_MAP_CHROME_LINES,
+    GRID_CHANGES_MAX,
+    GRID_EMPTY_CACHE_SIZE,
+    PLAN_CACHE_SIZE,
     SCREEN_DEFAULT_SPACING,
+    SCREEN_BUFFER_SIZE,
 )
 
 
-BookingID = NewType("BookingID", str)
+if TYPE_CHECKING:
+    from src._shared import SharedSeats
+
+
+class BookingID(int):
+    """
+    Booking ID, numbered from 1, which only prints as e.g. `GIC0001`
+
+    Booking IDs are compared, hashed and stored in seat slots as plain ints.
+    The `GIC0001` form is only for user input and output, see `parse`.
+    """
+
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return BOOKING_ID_PREFIX + int.__repr__(self).zfill(BOOKING_ID_PAD)
+
+    def __repr__(self) -> str:
+        return f"BookingID({int.__repr__(self)})"
+
+    @classmethod
+    def parse(cls, booking_id: str) -> Self:
+        """
+        Returns the Booking ID printed as e.g. `GIC0001`
+
+        Parameters
+            booking_id: str
+                The Booking ID, as printed
+        Returns
+            BookingID
+        """
+        number = booking_id.strip().upper().removeprefix(BOOKING_ID_PREFIX)
+        if len(number) < BOOKING_ID_PAD or not number.isdecimal() or not int(number):
+            raise ValueError(f"Invalid booking id {booking_id}.")
+        return cls(number)
+
+
 BookingMap = NewType("BookingMap", str)
+BookingRequest = tuple[int, Optional[tuple[int, int]]]
+
+
+class Journal(Protocol):
+    """
+    Receives every booking, confirmation and unbooking made through a `Movie`
+
+    Bookings recorded as held are only kept for good once confirmed.
+    """
+
+    def record_book(
+        self,
+        booking_id: BookingID,
+        seats: list[tuple[int, int]],
+        booking_counter: int,
+        held: bool = False,
+    ) -> None: ...
+
+    def record_confirm(self, booking_id: BookingID) -> None: ...
+
+    def record_unbook(self, booking_id: BookingID) -> None: ...
 
 
 class Seat:
-    def __init__(self) -> Self:
-        self._is_booked = False
-        self._booking_id: Optional[BookingID] = None
+    """
+    A view onto a single seat of a `SeatGrid`
+
+    Seats constructed without a grid are backed by their own 1x1 grid,
+    so they can still be used standalone.
+    """
+
+    def __init__(
+        self, grid: Optional["SeatGrid"] = None, row: int = 0, col: int = 0
+    ) -> Self:
+        self._grid = grid if grid is not None else SeatGrid(1, 1)
+        self._row = row
+        self._col = col
 
     @property
     def is_booked(self) -> bool:
-        return self._is_booked
+        return self._grid.is_booked(self._row, self._col)
 
     @property
-    def booking_id(self) -> BookingID:
-        return self._booking_id
+    def booking_id(self) -> Optional[BookingID]:
+        return self._grid.booking_id(self._row, self._col)
 
     def book(self, booking_id: BookingID) -> None:
-        self._is_booked = True
-        self._booking_id = booking_id
+        grid = self._grid
+        grid.begin_write()
+        try:
+            grid.assign(self._row, self._col, booking_id)
+        finally:
+            grid.end_write()
 
     def unbook(self) -> None:
-        self._is_booked = False
-        self._booking_id = None
+        grid = self._grid
+        grid.begin_write()
+        try:
+            grid.release(self._row, self._col)
+        finally:
+            grid.end_write()
 
     def get_chr(self, booking_id: BookingID) -> str:
         """
@@ -47,27 +145,517 @@ class Seat:
         Returns
             str
         """
-        if self._is_booked and self._booking_id == booking_id:
+        return self._grid.get_chr(self._row, self._col, booking_id)
+
+
+class FenwickTree:
+    """
+    Binary indexed tree over a list of counts, for prefix sums and searches
+    in O(log n)
+    """
+
+    def __init__(self, counts: list[int]) -> Self:
+        self._size = len(counts)
+        self._tree = [0] + counts
+        for index in range(1, self._size + 1):
+            if (parent := index + (index & -index)) <= self._size:
+                self._tree[parent] += self._tree[index]
+
+    def add(self, index: int, delta: int) -> None:
+        index += 1
+        while index <= self._size:
+            self._tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, stop: int) -> int:
+        """Returns the sum of counts before index `stop`"""
+        total = 0
+        while stop > 0:
+            total += self._tree[stop]
+            stop -= stop & -stop
+        return total
+
+    def copy(self) -> "FenwickTree":
+        tree = FenwickTree.__new__(FenwickTree)
+        tree._size = self._size
+        tree._tree = self._tree[:]
+        return tree
+
+    def search(self, target: int) -> int:
+        """Returns the first index whose prefix sum, inclusive, exceeds `target`"""
+        index = 0
+        step = 1 << self._size.bit_length()
+        while step:
+            if index + step <= self._size and self._tree[index + step] <= target:
+                index += step
+                target -= self._tree[index]
+            step >>= 1
+        return index
+
+
+class SeatGrid:
+    """
+    Compact seat store, holding one booking slot per seat in a flat array
+
+    Slot 0 means the seat is unbooked. Every other slot is the Booking ID
+    of the seat, so each seat costs 4 bytes instead of a Python object.
+    A reverse index from Booking ID to seats lets bookings be looked up
+    and released without scanning the grid.
+
+    Every change bumps `version` and is appended to a journal of the last
+    `GRID_CHANGES_MAX` changed seats, for `changes_since`.
+
+    A new grid shares its seats with an empty grid of the same size, and
+    only copies them on its first write, so grids which are never booked
+    cost next to nothing to create.
+    """
+
+    def __init__(self, rows: int, cols: int) -> Self:
+        empty = _empty_grid(rows, cols)
+        self._rows = rows
+        self._cols = cols
+        self._owned = False
+        self._slots = empty._slots
+        self._free = rows * cols
+        self._row_free = empty._row_free
+        self._rows_with_free = empty._rows_with_free
+        self._row_masks = empty._row_masks
+        self._row_center_masks = empty._row_center_masks
+        self._center_ranks = empty._center_ranks
+        self._version = 0
+        self._row_versions = empty._row_versions
+        self._changes: list[tuple[int, int]] = []
+        self._changes_start = 0
+        self._shared: Optional["SharedSeats"] = None
+        self._booking_seats: dict[BookingID, list[tuple[int, int]]] = {}
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def cols(self) -> int:
+        return self._cols
+
+    @property
+    def version(self) -> int:
+        """Incremented whenever any seat is booked or unbooked"""
+        return self._version
+
+    def row_version(self, row: int) -> int:
+        """Returns `version` as of the last time a seat in the row changed"""
+        return self._row_versions[row]
+
+    def row_mask(self, row: int) -> int:
+        """Returns a bitmask of free seats in a row, where bit `i` is col `i`"""
+        return self._row_masks[row]
+
+    def row_center_mask(self, row: int) -> int:
+        """Returns a bitmask of free seats in a row, in `center_out_order`"""
+        return self._row_center_masks[row]
+
+    def is_booked(self, row: int, col: int) -> bool:
+        return self._slots[row * self._cols + col] != 0
+
+    def booking_id(self, row: int, col: int) -> Optional[BookingID]:
+        if slot := self._slots[row * self._cols + col]:
+            return BookingID(slot)
+        return None
+
+    def assign(self, row: int, col: int, booking_id: BookingID) -> None:
+        """
+        Books a seat under the given Booking ID
+
+        Parameters
+            row: int
+                Row index of the seat
+            col: int
+                Col index of the seat
+            booking_id: BookingID
+                The Booking ID to book the seat under
+        Returns
+            None
+        """
+        if not self._owned:
+            self._own()
+        index = row * self._cols + col
+        if self._slots[index]:
+            self._forget(row, col)
+        else:
+            self._occupy(row, col)
+        self._slots[index] = booking_id
+        self._booking_seats.setdefault(booking_id, []).append((row, col))
+        self._touch(row, col)
+
+    def release(self, row: int, col: int) -> None:
+        index = row * self._cols + col
+        if self._slots[index]:
+            self._forget(row, col)
+            self._vacate(row, col)
+            self._slots[index] = 0
+
+    def release_booking(self, booking_id: BookingID) -> bool:
+        """
+        Unbooks every seat booked under the given Booking ID
+
+        Parameters
+            booking_id: BookingID
+                The Booking ID to match against seat slots
+        Returns
+            bool
+                Whether any seats were booked under the Booking ID
+        """
+        if (seats := self._booking_seats.pop(booking_id, None)) is None:
+            return False
+        for row, col in seats:
+            self._slots[row * self._cols + col] = 0
+            self._vacate(row, col)
+        return True
+
+    def booking_ids(self) -> list[BookingID]:
+        return list(self._booking_seats)
+
+    def slots(self) -> memoryview:
+        """
+        Returns a read-only view of every slot, row by row
+
+        The view is of the slots as they are stored now. Writes may move the
+        slots, see `_own` and `share`, so take a new view after writing.
+
+        Returns
+            memoryview
+        """
+        return memoryview(self._slots).toreadonly()
+
+    def seats(self, booking_id: BookingID) -> Optional[list[tuple[int, int]]]:
+        if (seats := self._booking_seats.get(booking_id)) is None:
+            return None
+        return list(seats)
+
+    def share(self, shared: "SharedSeats") -> None:
+        """
+        Moves the slots into shared memory, for readers in other processes
+
+        Parameters
+            shared: SharedSeats
+                The shared memory to move the slots into
+        Returns
+            None
+        """
+        self._own()
+        shared.slots[:] = self._slots
+        self._slots = shared.slots
+        self._shared = shared
+        self.begin_write()
+        self.end_write()
+
+    def unshare(self) -> None:
+        """Moves the slots out of shared memory, back into a private array"""
+        self._slots = array("I", self._slots)
+        self._shared = None
+
+    def begin_write(self) -> None:
+        """Marks the start of a change that readers should only see as a whole"""
+        if self._shared is not None:
+            self._shared.begin()
+
+    def end_write(self) -> None:
+        if self._shared is not None:
+            self._shared.end(self._free)
+
+    def changes_since(self, version: int) -> Optional[list[tuple[int, int]]]:
+        """
+        Returns the seats changed since `version`, each once, in O(changes)
+
+        Parameters
+            version: int
+                A past `version` of the grid
+        Returns
+            Optional[list[tuple[int, int]]]
+                None if the changes since `version` are no longer journaled
+        """
+        if not self._changes_start <= version <= self._version:
+            return None
+        return list(dict.fromkeys(self._changes[version - self._changes_start :]))
+
+    def _own(self) -> None:
+        """Copies any seats still shared with the empty grid, before writing"""
+        if self._owned:
+            return
+        self._owned = True
+        self._slots = array("I", self._slots)
+        self._row_free = self._row_free[:]
+        self._rows_with_free = self._rows_with_free.copy()
+        self._row_masks = self._row_masks[:]
+        self._row_center_masks = self._row_center_masks[:]
+        self._row_versions = self._row_versions[:]
+
+    def _occupy(self, row: int, col: int) -> None:
+        self._free -= 1
+        self._row_free[row] -= 1
+        if not self._row_free[row]:
+            self._rows_with_free.add(row, -1)
+        self._row_masks[row] &= ~(1 << col)
+        self._row_center_masks[row] &= ~(1 << self._center_ranks[col])
+
+    def _vacate(self, row: int, col: int) -> None:
+        self._free += 1
+        self._row_free[row] += 1
+        if self._row_free[row] == 1:
+            self._rows_with_free.add(row, 1)
+        self._row_masks[row] |= 1 << col
+        self._row_center_masks[row] |= 1 << self._center_ranks[col]
+        self._touch(row, col)
+
+    def _touch(self, row: int, col: int) -> None:
+        self._version += 1
+        self._row_versions[row] = self._version
+        self._changes.append((row, col))
+        if len(self._changes) > GRID_CHANGES_MAX:
+            forgotten = len(self._changes) - GRID_CHANGES_MAX // 2
+            del self._changes[:forgotten]
+            self._changes_start += forgotten
+
+    def _forget(self, row: int, col: int) -> None:
+        booking_id = self.booking_id(row, col)
+        seats = self._booking_seats[booking_id]
+        seats.remove((row, col))
+        if not seats:
+            del self._booking_seats[booking_id]
+
+    def count_free(self) -> int:
+        return self._free
+
+    def count_row_free(self, row: int) -> int:
+        return self._row_free[row]
+
+    def next_free_row(self, row: int) -> Optional[int]:
+        """
+        Returns the index of the first row from `row` with free seats, in O(log rows)
+
+        Parameters
+            row: int
+                Row index to start searching from
+        Returns
+            Optional[int]
+                None if every row from `row` is full
+        """
+        if row >= self._rows:
+            return None
+        rows_with_free = self._rows_with_free
+        index = rows_with_free.search(rows_with_free.prefix_sum(row))
+        return index if index < self._rows else None
+
+    def get_chr(self, row: int, col: int, booking_id: Optional[BookingID]) -> str:
+        slot = self._slots[row * self._cols + col]
+        if slot and slot == booking_id:
             return "o"
-        if self._is_booked:
+        if slot:
             return "#"
         return "."
 
+    def get_row(
+        self,
+        row: int,
+        booking_id: Optional[BookingID],
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Returns the chars of the seats in a row, as per `Seat.get_chr`
+
+        Parameters
+            row: int
+                Row index of the row to render
+            booking_id: Optional[BookingID]
+                The Booking ID to match against seat slots, if any
+            start: int = 0
+                Col index of the first seat to render
+            stop: Optional[int]
+                Col index to stop rendering at, by default the end of the row
+        Returns
+            list[str]
+        """
+        highlight = booking_id or 0
+        offset = row * self._cols
+        stop = self._cols if stop is None else stop
+        return [
+            "o" if slot and slot == highlight else "#" if slot else "."
+            for slot in self._slots[offset + start : offset + stop]
+        ]
+
+
+@lru_cache(maxsize=GRID_EMPTY_CACHE_SIZE)
+def _empty_grid(rows: int, cols: int) -> "_EmptyGrid":
+    return _EmptyGrid(rows, cols)
+
+
+class _EmptyGrid:
+    """Seats of an empty grid, shared by new grids until their first write"""
+
+    def __init__(self, rows: int, cols: int) -> Self:
+        self._slots = array("I", [0]) * (rows * cols)
+        self._row_free = [cols] * rows
+        self._rows_with_free = FenwickTree([int(cols > 0)] * rows)
+        self._row_masks = [(1 << cols) - 1] * rows
+        self._row_center_masks = [(1 << cols) - 1] * rows
+        self._center_ranks = center_out_ranks(cols)
+        self._row_versions = [0] * rows
+
+
+def _writes(method: Callable) -> Callable:
+    """
+    Wraps a `Movie` method changing seats in `SeatGrid.begin_write` and
+    `SeatGrid.end_write`
+    """
+
+    @wraps(method)
+    def wrapper(self: "Movie", *args, **kwargs):
+        grid = self._grid
+        grid.begin_write()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            grid.end_write()
+
+    return wrapper
+
+
+@lru_cache(maxsize=GRID_EMPTY_CACHE_SIZE)
+def map_frame(rows: int, cols: int) -> tuple[int, str, str]:
+    """
+    Returns the parts of a map of seats which do not depend on bookings
+
+    The parts are cached per size, as many screenings share a size.
+
+    Parameters
+        rows: int
+            Number of rows
+        cols: int
+            Number of seats per row
+    Returns
+        tuple[int, str, str]
+            The width of row labels, the screen banner, and the seat numbers
+    """
+    label_width = len(row_label(max(rows - 1, 0)))
+    width = max(BOOKING_MAP_MIN_WIDTH, BOOKING_MAP_COL_WIDTH * cols)
+    width += label_width - 1
+    footer_row = []
+    footer_row.append(" " * label_width)
+    for i in range(cols):
+        footer_row.append(str(i + 1))
+    header = "S   C   R   E   E   N".center(width) + "\n" + "-" * width
+    footer = "   ".join(footer_row[:10]) + "  " + "  ".join(footer_row[10:100])
+    if cols >= 100:
+        footer += " " + " ".join(footer_row[100:])
+    return label_width, header, footer
+
+
+class Plan:
+    """
+    Seats a booking would be allocated, as of a version of the grid
+
+    See `Movie.preview` and `Movie.commit`.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        seats_to_book: int,
+        row_index: Optional[int],
+        col_index: Optional[int],
+        seats: tuple[tuple[int, int], ...],
+    ) -> Self:
+        self._version = version
+        self._seats_to_book = seats_to_book
+        self._row_index = row_index
+        self._col_index = col_index
+        self._seats = seats
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def seats_to_book(self) -> int:
+        return self._seats_to_book
+
+    @property
+    def row_index(self) -> Optional[int]:
+        return self._row_index
+
+    @property
+    def col_index(self) -> Optional[int]:
+        return self._col_index
+
+    @property
+    def seats(self) -> tuple[tuple[int, int], ...]:
+        return self._seats
+
 
 class Movie:
-    def __init__(self, title: str, rows: int, cols: int):
+    def __init__(
+        self,
+        title: str,
+        rows: int,
+        cols: int,
+        allocator: Optional[Allocator] = None,
+        hold_ttl: Optional[float] = None,
+        clock: Callable[[], float] = monotonic,
+        journal: Optional[Journal] = None,
+    ):
         self._title = title
-        self._seats = [[Seat() for _ in range(cols)] for _ in range(rows)]
+        self._journal = journal
+        self._grid = SeatGrid(rows, cols)
+        self._allocator = allocator if allocator is not None else CenterOutAllocator()
         self._booking_id = 0
+        self._booking_id_lock = Lock()
+
+        # Unconfirmed bookings, see `book` and `expire_holds`
+        self._hold_ttl = hold_ttl
+        self._clock = clock
+        self._holds: dict[BookingID, float] = {}
+        self._hold_deadlines: list[tuple[float, BookingID]] = []
+
+        # Plan cache, see `preview`
+        self._plans: OrderedDict[
+            tuple[int, int, Optional[int], Optional[int]], Plan
+        ] = OrderedDict()
+
+        # Render cache, see `get_map`
+        self._label_width, self._map_header, self._map_footer = map_frame(rows, cols)
+        self._map_width = max(
+            len(self._map_header.partition("\n")[0]),
+            len(self._map_footer),
+            self._label_width + BOOKING_MAP_COL_WIDTH * cols,
+        )
+        self._map_rows: list[Optional[tuple[int, str]]] = [None] * rows
+        self._map_key: Optional[tuple[int, Optional[BookingID], Optional[Plan]]] = None
+        self._map: Optional[BookingMap] = None
 
     @classmethod
-    def from_user_input(cls, user_input: str) -> Self:
+    def from_user_input(
+        cls,
+        user_input: str,
+        hold_ttl: Optional[float] = None,
+        max_rows: int = MOVIE_MAX_ROWS,
+        max_cols: int = MOVIE_MAX_COLS,
+        allocator: Optional[Allocator] = None,
+    ) -> Self:
         """
         Returns a Movie object from user input
 
         Parameters
             user_input: str
                 The user input to validate then initalize the Movie with
+            hold_ttl: Optional[float]
+                Seconds to hold bookings for until confirmed, if any
+            max_rows: int = MOVIE_MAX_ROWS
+                Maximum number of rows, e.g. `VENUE_MAX_ROWS` for large venues
+            max_cols: int = MOVIE_MAX_COLS
+                Maximum number of seats per row, e.g. `VENUE_MAX_COLS`
+            allocator: Optional[Allocator]
+                Allocator to pick seats with, by default `CenterOutAllocator`
         Returns
             Movie
         """
@@ -78,27 +666,134 @@ class Movie:
         title, rows, cols = split_input
         if not title:
             raise ValueError("Movie title cannot be empty.")
-        if not rows.isdecimal() or not MOVIE_MIN_ROWS <= int(rows) <= MOVIE_MAX_ROWS:
-            raise ValueError("Row number must be between 1 and 26.")
-        if not cols.isdecimal() or not MOVIE_MIN_COLS <= int(cols) <= MOVIE_MAX_COLS:
-            raise ValueError("Seats per row must be between 1 and 50.")
-        return cls(title, int(rows), int(cols))
+        if not rows.isdecimal() or not MOVIE_MIN_ROWS <= int(rows) <= max_rows:
+            raise ValueError(
+                f"Row number must be between {MOVIE_MIN_ROWS} and {max_rows}."
+            )
+        if not cols.isdecimal() or not MOVIE_MIN_COLS <= int(cols) <= max_cols:
+            raise ValueError(
+                f"Seats per row must be between {MOVIE_MIN_COLS} and {max_cols}."
+            )
+        return cls(title, int(rows), int(cols), allocator, hold_ttl)
 
     @property
     def title(self) -> str:
         return self._title
 
+    @property
+    def rows(self) -> int:
+        return self._grid.rows
+
+    @property
+    def cols(self) -> int:
+        return self._grid.cols
+
+    @property
+    def version(self) -> int:
+        """Incremented whenever any seat is booked or unbooked"""
+        return self._grid.version
+
+    @property
+    def booking_counter(self) -> int:
+        """The number of the latest Booking ID issued"""
+        return self._booking_id
+
+    @property
+    def next_booking_id(self) -> BookingID:
+        """The Booking ID `book` or `commit` would issue next, if no other is first"""
+        return BookingID(self._booking_id + 1)
+
+    @property
+    def journal(self) -> Optional[Journal]:
+        return self._journal
+
+    @journal.setter
+    def journal(self, journal: Optional[Journal]) -> None:
+        self._journal = journal
+
+    def slots(self) -> memoryview:
+        """Returns a read-only view of every seat's slot, as per `SeatGrid.slots`"""
+        self.expire_holds()
+        return self._grid.slots()
+
+    def bookings(self) -> dict[BookingID, list[tuple[int, int]]]:
+        """Returns the seats of every booking, keyed by Booking ID"""
+        return {
+            booking_id: seats
+            for booking_id in self._grid.booking_ids()
+            if (seats := self._grid.seats(booking_id)) is not None
+        }
+
+    @_writes
+    def restore(self, booking_id: BookingID, seats: list[tuple[int, int]]) -> None:
+        """
+        Books exact seats under a Booking ID, without journaling it
+
+        Used to rebuild a Movie from its journal, see `src._persistence`.
+
+        Parameters
+            booking_id: BookingID
+                The Booking ID to book under
+            seats: list[tuple[int, int]]
+                The `(row_index, col_index)` of seats to book
+        Returns
+            None
+        """
+        for row, col in seats:
+            self._grid.assign(row, col, booking_id)
+
+    def restore_booking_counter(self, booking_counter: int) -> None:
+        """Makes sure Booking IDs are issued after the number `booking_counter`"""
+        with self._booking_id_lock:
+            self._booking_id = max(self._booking_id, booking_counter)
+
+    def share(self, shared: "SharedSeats") -> None:
+        """
+        Backs the Movie's seats with shared memory, see `src._shared`
+
+        Parameters
+            shared: SharedSeats
+                The shared memory to move the seats into
+        Returns
+            None
+        """
+        self._grid.share(shared)
+
+    def unshare(self) -> None:
+        self._grid.unshare()
+
     def seats_unbooked(self) -> int:
-        return sum(1 for row in self._seats for seat in row if not seat.is_booked)
+        self.expire_holds()
+        return self._grid.count_free()
+
+    def seat(self, row_index: int, col_index: int) -> Seat:
+        return Seat(self._grid, row_index, col_index)
 
+    def get_booking(self, booking_id: BookingID) -> Optional[list[tuple[int, int]]]:
+        """
+        Returns the `(row_index, col_index)` of seats booked under a Booking ID
+
+        Parameters
+            booking_id: BookingID
+                The Booking ID to look up
+        Returns
+            Optional[list[tuple[int, int]]]
+                None if no seats are booked under the Booking ID
+        """
+        self.expire_holds()
+        return self._grid.seats(booking_id)
+
+    @_writes
     def book(
         self,
         seats_to_book: int,
         row_index: Optional[int] = None,
         col_index: Optional[int] = None,
+        booking_id: Optional[BookingID] = None,
     ) -> BookingID:
         """
-        Make a booking and return its Booking ID, following the following logic:
+        Make a booking and return its Booking ID, with seats picked by the
+        Movie's allocator. By default, that follows the following logic:
 
         If `row_index` and `col_index`,
             Fill from right of `(row_index, col_index)`.
@@ -107,6 +802,9 @@ class Movie:
         Else,
             Fill from middle of each row in row order.
 
+        If the Movie has a `hold_ttl`, the booking is only held until it is
+        confirmed with `confirm`, and is unbooked if that takes too long.
+
         Parameters
             seats_to_book: int
                 Number of seats to book
@@ -114,73 +812,219 @@ class Movie:
                 Starting row index, if any
             col_index: Optional[int]
                 Starting col index, if any
+            booking_id: Optional[BookingID]
+                Booking ID to book under, if any. Defaults to the latest
+                Booking ID if a starting seat is given and one was issued,
+                else a new one
         Returns
             BookingID
         """
-        if row_index is not None and col_index is not None:
-            booking_id = f"GIC{str(self._booking_id).zfill(BOOKING_ID_PAD)}"
-
-            # Fill from right
-            for seat in self._seats[row_index][col_index:]:
-                if seats_to_book <= 0:
-                    return BookingID(booking_id)
-
-                if seat.is_booked:
-                    continue
-
-                seat.book(booking_id)
-                seats_to_book -= 1
-
-            # Fill from middle from next row
-            for row in self._seats[row_index + 1 :]:
-                left_ptr = right_ptr = len(row) // 2
-                left_ptr -= (
-                    len(row) % 2 == 0
-                )  # So left and right pointers are symmetric
-                while left_ptr >= 0 and right_ptr < len(row):
-                    if seats_to_book <= 0:
-                        return BookingID(booking_id)
-                    if not row[left_ptr].is_booked:
-                        row[left_ptr].book(booking_id)
-                        seats_to_book -= 1
-
-                    if seats_to_book <= 0:
-                        return BookingID(booking_id)
-                    if not row[right_ptr].is_booked:
-                        row[right_ptr].book(booking_id)
-                        seats_to_book -= 1
-
-                    left_ptr -= 1
-                    right_ptr += 1
+        self.expire_holds()
 
+        if booking_id is not None:
+            pass
+        elif row_index is not None and col_index is not None and self._booking_id:
+            booking_id = BookingID(self._booking_id)
         else:
+            booking_id = self._next_booking_id()
+
+        self._assign(booking_id, self._plan(seats_to_book, row_index, col_index))
+        return booking_id
+
+    def preview(
+        self,
+        seats_to_book: int,
+        row_index: Optional[int] = None,
+        col_index: Optional[int] = None,
+    ) -> Plan:
+        """
+        Returns the seats `book` would allocate, without booking them
+
+        Plans are cached on the grid version, number of seats and starting
+        seat, so previewing the same booking again costs a lookup until any
+        seat is booked or unbooked. The least recently used plans beyond
+        `PLAN_CACHE_SIZE` are evicted.
+
+        Parameters
+            seats_to_book: int
+                Number of seats to book
+            row_index: Optional[int]
+                Starting row index, if any
+            col_index: Optional[int]
+                Starting col index, if any
+        Returns
+            Plan
+        """
+        self.expire_holds()
+        return self._plan(seats_to_book, row_index, col_index)
+
+    @_writes
+    def commit(self, plan: Plan) -> BookingID:
+        """
+        Books the seats of a plan from `preview` under a new Booking ID
+
+        If any seat was booked or unbooked since, the booking is planned
+        again first, as `book` would.
+
+        Parameters
+            plan: Plan
+                The plan to book
+        Returns
+            BookingID
+        """
+        self.expire_holds()
+
+        if plan.version != self._grid.version:
+            plan = self._plan(plan.seats_to_book, plan.row_index, plan.col_index)
+        booking_id = self._next_booking_id()
+        self._assign(booking_id, plan)
+        return booking_id
+
+    def preview_changes(
+        self, old_plan: Plan, new_plan: Plan
+    ) -> Optional[list[tuple[int, int, str]]]:
+        """
+        Returns the seats to repaint on a map of one plan to show another,
+        as per `changes_since`
+
+        Parameters
+            old_plan: Plan
+                The plan the map shows
+            new_plan: Plan
+                The plan to show instead
+        Returns
+            Optional[list[tuple[int, int, str]]]
+                The `(row_index, col_index, chr)` of every changed seat, or
+                None if the grid changed between the plans
+        """
+        if old_plan.version != new_plan.version:
+            return None
+        grid = self._grid
+        old_seats, new_seats = set(old_plan.seats), set(new_plan.seats)
+        return [
+            (row, col, grid.get_chr(row, col, None))
+            for row, col in old_plan.seats
+            if (row, col) not in new_seats
+        ] + [
+            (row, col, "o")
+            for row, col in new_plan.seats
+            if (row, col) not in old_seats
+        ]
+
+    def _plan(
+        self, seats_to_book: int, row_index: Optional[int], col_index: Optional[int]
+    ) -> Plan:
+        grid = self._grid
+        plans = self._plans
+        key = (grid.version, seats_to_book, row_index, col_index)
+        if (plan := plans.get(key)) is not None:
+            plans.move_to_end(key)
+            return plan
+
+        # Plans of an older version can never be used again
+        if plans and next(iter(plans))[0] != grid.version:
+            plans.clear()
+        seats = self._allocator.allocate(grid, seats_to_book, row_index, col_index)
+        plan = plans[key] = Plan(*key, tuple(seats))
+        if len(plans) > PLAN_CACHE_SIZE:
+            plans.popitem(last=False)
+        return plan
+
+    def _assign(self, booking_id: BookingID, plan: Plan) -> None:
+        for row, col in plan.seats:
+            self._grid.assign(row, col, booking_id)
+
+        if self._journal is not None:
+            self._journal.record_book(
+                booking_id,
+                list(plan.seats),
+                self._booking_id,
+                self._hold_ttl is not None,
+            )
+
+        if self._hold_ttl is not None:
+            self._hold(booking_id)
+
+    def _reassign(self, booking_id: BookingID, seats: list[tuple[int, int]]) -> None:
+        for row, col in seats:
+            self._grid.assign(row, col, booking_id)
+
+    @_writes
+    def book_many(self, requests: list[BookingRequest]) -> list[BookingID]:
+        """
+        Make a booking for each request, all or nothing, and return their Booking IDs
+
+        Each request is a number of seats to book and an optional starting
+        `(row_index, col_index)`, allocated as per `book`. Since no seats are
+        unbooked in between, rows found full by one request are skipped
+        outright by the next. Bookings made in bulk are never held.
+
+        Parameters
+            requests: list[BookingRequest]
+                Number of seats to book and starting seat, if any, per booking
+        Returns
+            list[BookingID]
+        """
+        self.expire_holds()
+
+        # Checked up front, so an allocator error never leaves half a batch
+        for _, start_seat in requests:
+            if start_seat is not None:
+                self._check_seat(*start_seat)
+
+        grid = self._grid
+        booking_ids = []
+        booking_seats = []
+        start_row = 0
+
+        for seats_to_book, start_seat in requests:
+            booking_id = self._next_booking_id()
+            booking_ids.append(booking_id)
+
+            if start_seat is None:
+                while start_row < grid.rows and not grid.count_row_free(start_row):
+                    start_row += 1
+                seats = self._allocator.allocate(
+                    grid, seats_to_book, start_row=start_row
+                )
+            else:
+                seats = self._allocator.allocate(grid, seats_to_book, *start_seat)
+
+            for row, col in seats:
+                grid.assign(row, col, booking_id)
+            booking_seats.append(seats)
+
+            if len(seats) < seats_to_book:
+                for booked_id in booking_ids:
+                    grid.release_booking(booked_id)
+                self._rewind_booking_id(booking_ids)
+                raise ValueError(
+                    f"Sorry, unable to book {seats_to_book} seats "
+                    f"for booking {len(booking_ids)}."
+                )
+
+        if self._journal is not None:
+            for booking_id, seats in zip(booking_ids, booking_seats):
+                self._journal.record_book(booking_id, seats, self._booking_id)
+
+        return booking_ids
+
+    def _check_seat(self, row_index: int, col_index: int) -> None:
+        if not (0 <= row_index < self.rows and 0 <= col_index < self.cols):
+            raise ValueError(f"Seat ({row_index}, {col_index}) does not exist.")
+
+    def _next_booking_id(self) -> BookingID:
+        with self._booking_id_lock:
             self._booking_id += 1
-            booking_id = f"GIC{str(self._booking_id).zfill(BOOKING_ID_PAD)}"
-
-            # Fill from middle
-            for row in self._seats:
-                left_ptr = right_ptr = len(row) // 2
-                left_ptr -= (
-                    len(row) % 2 == 0
-                )  # So left and right pointers are symmetric
-                while left_ptr >= 0 and right_ptr < len(row):
-                    if seats_to_book <= 0:
-                        return BookingID(booking_id)
-                    if not row[left_ptr].is_booked:
-                        row[left_ptr].book(booking_id)
-                        seats_to_book -= 1
-
-                    if seats_to_book <= 0:
-                        return BookingID(booking_id)
-                    if not row[right_ptr].is_booked:
-                        row[right_ptr].book(booking_id)
-                        seats_to_book -= 1
-
-                    left_ptr -= 1
-                    right_ptr += 1
-
-        return BookingID(booking_id)
+            return BookingID(self._booking_id)
+
+    def _rewind_booking_id(self, booking_ids: list[BookingID]) -> None:
+        """Takes back Booking IDs, if none were issued since"""
+        with self._booking_id_lock:
+            if booking_ids and booking_ids[-1] == self._booking_id:
+                self._booking_id = booking_ids[0] - 1
 
+    @_writes
     def unbook(self, booking_id: BookingID) -> None:
         """
         Unbooks seats with given Booking ID
@@ -191,83 +1035,431 @@ class Movie:
         Returns
             None
         """
-        for row in self._seats:
-            for seat in row:
-                if seat.booking_id == booking_id:
-                    seat.unbook()
+        self._holds.pop(booking_id, None)
+        if self._grid.release_booking(booking_id) and self._journal is not None:
+            self._journal.record_unbook(booking_id)
 
-    def get_map(self, booking_id: BookingID) -> BookingMap:
+    @_writes
+    def unbook_many(self, booking_ids: Iterable[BookingID]) -> None:
         """
-        Constructs and returns a string representing a matrix of seats
+        Unbooks seats with any of the given Booking IDs, as one write
+
+        Parameters
+            booking_ids: Iterable[BookingID]
+                The Booking IDs to match against seat Booking ID
+        Returns
+            None
+        """
+        for booking_id in booking_ids:
+            self.unbook(booking_id)
+
+    @_writes
+    def move(
+        self,
+        booking_id: BookingID,
+        row_index: int,
+        col_index: int,
+        seats_to_book: Optional[int] = None,
+    ) -> list[tuple[int, int, str]]:
+        """
+        Moves a booking to start from a seat, as per `book` with a starting seat
+
+        The new seats are allocated with the booking's own seats treated as
+        free, and the move is applied in one call, so the booking's seats are
+        never left free for another booking to take. If `seats_to_book` seats
+        cannot be found from the starting seat, the booking keeps its seats
+        and ValueError is raised. It also keeps them if the allocator raises. A held booking is held for another
+        `hold_ttl` from the move.
 
         Parameters
             booking_id: BookingID
-                The Booking ID to match against seat Booking ID
+                The Booking ID to move
+            row_index: int
+                Starting row index
+            col_index: int
+                Starting col index
+            seats_to_book: Optional[int]
+                Number of seats to book, by default as many as the booking has
+        Returns
+            list[tuple[int, int, str]]
+                The `(row_index, col_index, chr)` of every seat which changed,
+                as per `changes_since`
+        """
+        self.expire_holds()
+
+        grid = self._grid
+        if (old_seats := grid.seats(booking_id)) is None:
+            raise ValueError(f"Booking id {booking_id} does not exist.")
+        self._check_seat(row_index, col_index)
+        if seats_to_book is None:
+            seats_to_book = len(old_seats)
+
+        grid.release_booking(booking_id)
+        try:
+            new_seats = self._allocator.allocate(
+                grid, seats_to_book, row_index, col_index
+            )
+        except BaseException:
+            self._reassign(booking_id, old_seats)
+            raise
+        if len(new_seats) < seats_to_book:
+            self._reassign(booking_id, old_seats)
+            raise ValueError(
+                f"Sorry, unable to move booking {booking_id} to {seats_to_book} "
+                "seats from there."
+            )
+        for row, col in new_seats:
+            grid.assign(row, col, booking_id)
+
+        if self._journal is not None:
+            self._journal.record_unbook(booking_id)
+            self._journal.record_book(
+                booking_id, new_seats, self._booking_id, booking_id in self._holds
+            )
+
+        if booking_id in self._holds:
+            self._hold(booking_id)
+
+        unchanged = set(old_seats) & set(new_seats)
+        return [
+            (row, col, ".") for row, col in old_seats if (row, col) not in unchanged
+        ] + [(row, col, "o") for row, col in new_seats if (row, col) not in unchanged]
+
+    def holds(self) -> list[BookingID]:
+        """Returns the Booking IDs of held bookings, without expiring any"""
+        return list(self._holds)
+
+    def is_held(self, booking_id: BookingID) -> bool:
+        self.expire_holds()
+        return booking_id in self._holds
+
+    def confirm(self, booking_id: BookingID) -> bool:
+        """
+        Confirms a held booking, so that it no longer expires
+
+        Parameters
+            booking_id: BookingID
+                The Booking ID to confirm
+        Returns
+            bool
+                Whether the booking exists, i.e. had not already expired
+        """
+        self.expire_holds()
+        if self._holds.pop(booking_id, None) is not None and self._journal is not None:
+            self._journal.record_confirm(booking_id)
+        return self._grid.seats(booking_id) is not None
+
+    def expire_holds(self) -> list[BookingID]:
+        """
+        Unbooks held bookings whose hold has expired, and returns their Booking IDs
+
+        Deadlines are kept in a heap, so only expired deadlines are visited.
+        Deadlines of bookings since confirmed, unbooked or held again are
+        skipped when they come up.
+
+        Returns
+            list[BookingID]
+        """
+        deadlines = self._hold_deadlines
+        if not deadlines or deadlines[0][0] > (now := self._clock()):
+            return []
+
+        expired = []
+        while deadlines and deadlines[0][0] <= now:
+            deadline, booking_id = heappop(deadlines)
+            if self._holds.get(booking_id) == deadline:
+                self.unbook(booking_id)
+                expired.append(booking_id)
+        return expired
+
+    def _hold(self, booking_id: BookingID) -> None:
+        deadline = self._clock() + self._hold_ttl
+        self._holds[booking_id] = deadline
+        heappush(self._hold_deadlines, (deadline, booking_id))
+
+    def get_map(
+        self, booking_id: Optional[BookingID], plan: Optional[Plan] = None
+    ) -> BookingMap:
+        """
+        Constructs and returns a string representing a matrix of seats
+
+        The map is cached on the grid version, Booking ID and plan. Otherwise,
+        only rows which changed since they were last rendered, or which hold
+        seats of the Booking ID or plan, are rendered again.
+
+        Parameters
+            booking_id: Optional[BookingID]
+                The Booking ID to match against seat Booking ID, if any
+            plan: Optional[Plan]
+                A plan from `preview` to show as selected seats, if any
+        Returns
+            BookingMap
+        """
+        self.expire_holds()
+
+        grid = self._grid
+        if self._map_key == (key := (grid.version, booking_id, plan)):
+            return self._map
+
+        highlighted_rows = {row for row, _ in grid.seats(booking_id) or ()}
+        planned = _planned_cols(plan)
+
+        booking_map = []
+        booking_map.append(f"Booking id: {booking_id or ''}")
+        booking_map.append("Selected seats:\n")
+        booking_map.append(self._map_header)
+        for row in reversed(range(grid.rows)):
+            if row in planned:
+                booking_map.append(self._render_row(row, booking_id, planned[row]))
+                continue
+            if row in highlighted_rows:
+                booking_map.append(self._render_row(row, booking_id))
+                continue
+
+            cached = self._map_rows[row]
+            if cached is None or cached[0] != grid.row_version(row):
+                cached = self._map_rows[row] = (
+                    grid.row_version(row),
+                    self._render_row(row, None),
+                )
+            booking_map.append(cached[1])
+        booking_map.append(self._map_footer)
+
+        self._map_key = key
+        self._map = BookingMap("\n".join(booking_map))
+        return self._map
+
+    def get_viewport(
+        self,
+        booking_id: Optional[BookingID],
+        height: int,
+        width: int,
+        plan: Optional[Plan] = None,
+    ) -> BookingMap:
+        """
+        Constructs a map of the window of seats around a booking, as per `get_map`
+
+        Only the rows and seats which fit in `height` lines of `width` chars
+        are rendered, centered on the first seat of the plan or Booking ID,
+        or on the front of the screen if neither has seats. The whole map is
+        returned if it fits.
+
+        Parameters
+            booking_id: Optional[BookingID]
+                The Booking ID to match against seat Booking ID, if any
+            height: int
+                Number of lines the map has to fit in
+            width: int
+                Number of chars per line the map has to fit in
+            plan: Optional[Plan]
+                A plan from `preview` to show as selected seats, if any
         Returns
             BookingMap
         """
-        width = max(BOOKING_MAP_MIN_WIDTH, BOOKING_MAP_COL_WIDTH * len(self._seats[0]))
+        grid = self._grid
+        label_width = self._label_width
+        window_rows = max(height - BOOKING_MAP_CHROME_LINES, 1)
+        window_cols = max((width - label_width) // BOOKING_MAP_COL_WIDTH, 1)
+        if self.map_fits(height, width):
+            return self.get_map(booking_id, plan)
+
+        self.expire_holds()
+
+        planned = _planned_cols(plan)
+        seats = (
+            (plan.seats if plan is not None else None)
+            or grid.seats(booking_id)
+            or [(0, grid.cols // 2)]
+        )
+        center_row, center_col = seats[0]
+        row_start = min(
+            max(center_row - window_rows // 2, 0), max(grid.rows - window_rows, 0)
+        )
+        col_start = min(
+            max(center_col - window_cols // 2, 0), max(grid.cols - window_cols, 0)
+        )
+        row_stop = min(row_start + window_rows, grid.rows)
+        col_stop = min(col_start + window_cols, grid.cols)
+
+        map_width = max(
+            BOOKING_MAP_MIN_WIDTH, BOOKING_MAP_COL_WIDTH * (col_stop - col_start)
+        )
+        map_width += label_width - 1
 
         booking_map = []
-        booking_map.append(f"Booking id: {booking_id}")
+        booking_map.append(f"Booking id: {booking_id or ''}")
         booking_map.append("Selected seats:\n")
-        booking_map.append("S   C   R   E   E   N".center(width))
-        booking_map.append("-" * width)
-        for index, row in enumerate(reversed(self._seats)):
-            booking_row = []
-            booking_row.append(chr(ord("A") + len(self._seats) - 1 - index))
-            for seat in row:
-                booking_row.append(seat.get_chr(booking_id))
+        booking_map.append("S   C   R   E   E   N".center(map_width))
+        booking_map.append("-" * map_width)
+        for row in reversed(range(row_start, row_stop)):
+            booking_row = [row_label(row).ljust(label_width)]
+            booking_row.extend(grid.get_row(row, booking_id, col_start, col_stop))
+            for col in planned.get(row, ()):
+                if col_start <= col < col_stop:
+                    booking_row[1 + col - col_start] = "o"
             booking_map.append("   ".join(booking_row))
-        footer_row = []
-        footer_row.append(" ")
-        for i in range(len(self._seats[0])):
-            footer_row.append(str(i + 1))
         booking_map.append(
-            "   ".join(footer_row[:10]) + "  " + "  ".join(footer_row[10:])
+            " " * label_width
+            + "".join(f"{col + 1:>4}" for col in range(col_start, col_stop))
         )
+        return BookingMap("\n".join(booking_map))
+
+    def map_fits(self, height: int, width: int) -> bool:
+        """Returns whether the whole of `get_map` fits in `height` lines of `width` chars"""
+        return (
+            self._grid.rows + BOOKING_MAP_CHROME_LINES <= height
+            and self._map_width <= width
+        )
+
+    def map_position(self, row_index: int, col_index: int) -> tuple[int, int]:
+        """Returns the line and char offsets of a seat within `get_map`"""
+        return (
+            BOOKING_MAP_CHROME_LINES - 1 + self._grid.rows - 1 - row_index,
+            self._label_width + 3 + BOOKING_MAP_COL_WIDTH * col_index,
+        )
+
+    def changes_since(
+        self, version: int, booking_id: Optional[BookingID]
+    ) -> Optional[list[tuple[int, int, str]]]:
+        """
+        Returns the seats changed since a past `version`, as per `Seat.get_chr`
+
+        Repainting just these seats of a map from `get_map(booking_id)` at
+        `version` brings it up to date, at a cost which depends on the number
+        of changes rather than the size of the map.
+
+        Parameters
+            version: int
+                A past `version` of the Movie
+            booking_id: Optional[BookingID]
+                The Booking ID to match against seat Booking ID, if any
+        Returns
+            Optional[list[tuple[int, int, str]]]
+                The `(row_index, col_index, chr)` of every changed seat, or
+                None if the changes are too old to be known
+        """
+        self.expire_holds()
+
+        grid = self._grid
+        if (seats := grid.changes_since(version)) is None:
+            return None
+        return [(row, col, grid.get_chr(row, col, booking_id)) for row, col in seats]
+
+    def _render_row(
+        self, row: int, booking_id: Optional[BookingID], planned: Iterable[int] = ()
+    ) -> str:
+        booking_row = [row_label(row).ljust(self._label_width)]
+        booking_row.extend(self._grid.get_row(row, booking_id))
+        for col in planned:
+            booking_row[1 + col] = "o"
+        return "   ".join(booking_row)
+
+
+def _planned_cols(plan: Optional[Plan]) -> dict[int, list[int]]:
+    """Returns the cols of the seats of a plan, by row"""
+    planned: dict[int, list[int]] = {}
+    for row, col in plan.seats if plan is not None else ():
+        planned.setdefault(row, []).append(col)
+    return planned
+
+
+class Screen(Protocol):
+    """
+    Reads user input for, and prints the output of, `main.py`
+    """
 
-        return "\n".join(booking_map)
+    def getstr(self) -> str: ...
 
+    def getch(self) -> int: ...
 
-class ScrollingScreen:
-    def __init__(self, screen: curses.window) -> Self:
-        self._screen = screen
+    def deleteln(self) -> None: ...
 
-        self._screen.clear()
-        self._screen.scrollok(True)
-        self._screen.idlok(True)
+    def clear(self) -> None: ...
+
+    def getmaxyx(self) -> tuple[int, int]: ...
+
+    def getyx(self) -> tuple[int, int]: ...
+
+    def addstr(self, str: str, spacing: int = SCREEN_DEFAULT_SPACING) -> None: ...
+
+    def addpad(
+        self, str: str, spacing: int = SCREEN_DEFAULT_SPACING, reserve: int = 0
+    ) -> Optional[int]: ...
+
+    def repaint(
+        self, top: int, cells: list[tuple[int, int, str]], cursor: tuple[int, int]
+    ) -> None: ...
+
+
+class HeadlessScreen:
+    """
+    Screen which reads lines of input from, and writes output to, text streams
+
+    Output is buffered and written once `SCREEN_BUFFER_SIZE` chars are
+    pending, or when `flush` is called. Reading past the end of the input
+    raises `EOFError`.
+    """
+
+    def __init__(self, input: TextIO, output: TextIO) -> Self:
+        self._input = input
+        self._output = output
+        self._buffer: list[str] = []
+        self._buffered = 0
 
     def getstr(self) -> str:
-        return self._screen.getstr().decode().strip()
+        if not (line := self._input.readline()):
+            raise EOFError
+        return line.strip()
 
     def getch(self) -> int:
-        return self._screen.getch()
+        """Returns the first char of the next line, or a newline if it is blank"""
+        return ord(self.getstr()[:1] or "\n")
 
     def deleteln(self) -> None:
-        self._screen.deleteln()
+        pass
 
     def clear(self) -> None:
-        self._screen.clear()
+        pass
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return sys.maxsize, sys.maxsize
+
+    def getyx(self) -> tuple[int, int]:
+        return 0, 0
 
     def addstr(self, str: str, spacing: int = SCREEN_DEFAULT_SPACING) -> None:
-        """
-        Uses line-by-line scrolling instead of moving cursor out of bounds
+        self._buffer.append("\n" * spacing)
+        self._buffer.append(str)
+        self._buffered += spacing + len(str)
+        if self._buffered >= SCREEN_BUFFER_SIZE:
+            self.flush()
 
-        Parameters
-            str: str
-                The string to be printed
-            spacing: int = SCREEN_DEFAULT_SPACING
-                The number of lines of spacing above the string to be printed
-        Returns
-            None
+    def addpad(
+        self, str: str, spacing: int = SCREEN_DEFAULT_SPACING, reserve: int = 0
+    ) -> Optional[int]:
+        """Prints the block as per `addstr`, as it cannot be repainted in place"""
+        self.addstr(str, spacing)
+        return None
+
+    def repaint(
+        self, top: int, cells: list[tuple[int, int, str]], cursor: tuple[int, int]
+    ) -> None:
         """
-        y, _ = self._screen.getyx()
-        while True:
-            try:
-                self._screen.addstr(y + spacing, 0, str)
-            except curses.error:
-                self._screen.scroll()
-                y -= 1
-            else:
-                break
+        Does nothing, as output cannot be repainted in place. `addpad` returns
+        None, so callers print the block again instead
+        """
+
+    def flush(self) -> None:
+        self._output.write("".join(self._buffer))
+        self._output.flush()
+        self._buffer.clear()
+        self._buffered = 0
+
+
+def __getattr__(name: str) -> type:
+    # ScrollingScreen moved to `src._tui`, so that only the TUI imports curses
+    if name == "ScrollingScreen":
+        from src._tui import ScrollingScreen
+
+        return ScrollingScreen
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
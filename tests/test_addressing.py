@@ -0,0 +1,43 @@
+from src._addressing import format_seat, parse_seat, row_index, row_label
+from src._constants import VENUE_MAX_ROWS
+import pytest
+
+
+def test_row_label():
+    assert row_label(0) == "A"
+    assert row_label(25) == "Z"
+    assert row_label(26) == "AA"
+    assert row_label(51) == "AZ"
+    assert row_label(52) == "BA"
+    assert row_label(VENUE_MAX_ROWS - 1) == "ZZZ"
+
+
+def test_row_index():
+    for index in range(VENUE_MAX_ROWS):
+        assert row_index(row_label(index)) == index
+    with pytest.raises(ValueError):
+        row_index("")
+    with pytest.raises(ValueError):
+        row_index("A1")
+
+
+def test_format_seat():
+    assert format_seat(0, 0) == "A1"
+    assert format_seat(26, 11) == "AA12"
+
+
+def test_parse_seat():
+    assert parse_seat("B03") == (1, 2)
+    assert parse_seat("aa12") == (26, 11)
+    assert parse_seat(format_seat(700, 998)) == (700, 998)
+    assert parse_seat("B3", 2, 3) == (1, 2)
+
+
+def test_parse_seat_invalid():
+    for seat in ["", "B", "3", "B0", "3B", "B-1"]:
+        with pytest.raises(ValueError):
+            parse_seat(seat)
+    with pytest.raises(ValueError):
+        parse_seat("C1", 2, 3)
+    with pytest.raises(ValueError):
+        parse_seat("A4", 2, 3)
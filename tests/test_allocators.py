@@ -0,0 +1,110 @@
+from src._allocators import (
+    BestBlockAllocator,
+    CenterOutAllocator,
+    center_out_order,
+    center_out_ranks,
+    free_runs,
+    lowest_bits,
+    nearest_bit,
+)
+from src._types import BookingID, SeatGrid
+import pytest
+
+
+def test_center_out_order():
+    assert center_out_order(1) == (0,)
+    assert center_out_order(4) == (1, 2, 0, 3)
+    assert center_out_order(5) == (2, 1, 3, 0, 4)
+
+
+def test_center_out_ranks():
+    for cols in range(1, 10):
+        order = center_out_order(cols)
+        ranks = center_out_ranks(cols)
+        assert sorted(order) == list(range(cols))
+        assert all(order[ranks[col]] == col for col in range(cols))
+
+
+def test_lowest_bits():
+    assert lowest_bits(0b10110, 2) == [1, 2]
+    assert lowest_bits(0b10110, 5) == [1, 2, 4]
+    assert lowest_bits(0, 5) == []
+
+
+def test_free_runs():
+    assert free_runs(0b0111011, 1) == 0b0111011
+    assert free_runs(0b0111011, 2) == 0b0011001
+    assert free_runs(0b0111011, 3) == 0b0001000
+    assert free_runs(0b0111011, 4) == 0
+    for length in range(1, 8):
+        assert free_runs((1 << 7) - 1, length) == (1 << (8 - length)) - 1
+
+
+def test_nearest_bit():
+    assert nearest_bit(0b1000001, 3) == 0
+    assert nearest_bit(0b1000001, 4) == 6
+    assert nearest_bit(0b0001000, 3) == 3
+    assert nearest_bit(0, 3) is None
+
+
+@pytest.fixture
+def grid():
+    return SeatGrid(3, 5)
+
+
+class TestCenterOutAllocator:
+    def test_allocate(self, grid):
+        allocator = CenterOutAllocator()
+        assert allocator.allocate(grid, 6) == [
+            (0, 2),
+            (0, 1),
+            (0, 3),
+            (0, 0),
+            (0, 4),
+            (1, 2),
+        ]
+        assert grid.count_free() == 15
+
+    def test_allocate_skips_booked(self, grid):
+        grid.assign(0, 2, BookingID(1))
+        grid.assign(0, 1, BookingID(1))
+        allocator = CenterOutAllocator()
+        assert allocator.allocate(grid, 2) == [(0, 3), (0, 0)]
+
+    def test_allocate_from_seat(self, grid):
+        grid.assign(1, 4, BookingID(1))
+        allocator = CenterOutAllocator()
+        assert allocator.allocate(grid, 4, 1, 3) == [
+            (1, 3),
+            (2, 2),
+            (2, 1),
+            (2, 3),
+        ]
+
+    def test_allocate_overflow(self, grid):
+        allocator = CenterOutAllocator()
+        assert len(allocator.allocate(grid, 20)) == 15
+        assert len(allocator.allocate(grid, 20, 2, 0)) == 5
+
+
+class TestBestBlockAllocator:
+    def test_allocate(self, grid):
+        allocator = BestBlockAllocator()
+        assert allocator.allocate(grid, 3) == [(0, 1), (0, 2), (0, 3)]
+        assert allocator.allocate(grid, 5) == [(0, c) for c in range(5)]
+
+    def test_allocate_keeps_together(self, grid):
+        grid.assign(0, 2, BookingID(1))
+        allocator = BestBlockAllocator()
+        assert allocator.allocate(grid, 2) == [(0, 0), (0, 1)]
+        assert allocator.allocate(grid, 3) == [(1, 1), (1, 2), (1, 3)]
+        assert allocator.allocate(grid, 3, start_row=2) == [(2, 1), (2, 2), (2, 3)]
+
+    def test_allocate_fallback(self, grid):
+        grid.assign(0, 2, BookingID(1))
+        grid.assign(1, 2, BookingID(1))
+        grid.assign(2, 2, BookingID(1))
+        allocator = BestBlockAllocator()
+        assert allocator.allocate(grid, 3) == CenterOutAllocator().allocate(grid, 3)
+        assert allocator.allocate(grid, 2, 1, 3) == [(1, 3), (1, 4)]
+        assert len(allocator.allocate(grid, 20)) == 12
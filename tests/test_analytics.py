@@ -0,0 +1,62 @@
+from src._analytics import OccupancyMatrix, party_capacity, row_fill
+from src._types import BookingID, Movie
+import pytest
+
+
+@pytest.fixture
+def movie():
+    # A   .  o  o  .  .  .  .  .
+    # B   o  o  o  .  o  o  o  o
+    # C   .  .  .  .  .  .  .  .
+    movie = Movie("title", 3, 8)
+    movie.restore(BookingID(1), [(0, 1), (0, 2)])
+    movie.restore(BookingID(2), [(1, 0), (1, 1), (1, 2)])
+    movie.restore(BookingID(3), [(1, 4), (1, 5), (1, 6), (1, 7)])
+    return movie
+
+
+@pytest.fixture
+def matrix(movie):
+    pytest.importorskip("numpy")
+    return OccupancyMatrix(movie)
+
+
+def test_row_fill(movie):
+    assert row_fill(movie) == [2 / 8, 7 / 8, 0.0]
+
+
+def test_party_capacity(movie):
+    assert party_capacity(movie, 1) == [6, 1, 8]
+    assert party_capacity(movie, 2) == [2, 0, 4]
+    assert party_capacity(movie, 5) == [1, 0, 1]
+    assert party_capacity(movie, 9) == [0, 0, 0]
+
+
+class TestOccupancyMatrix:
+    def test_booked(self, movie, matrix):
+        booked = matrix.booked()
+        assert booked.shape == (3, 8)
+        assert booked[1].tolist() == [True] * 3 + [False] + [True] * 4
+        assert matrix.slots()[0, 1] == 1
+        assert matrix.seats_unbooked() == movie.seats_unbooked() == 15
+
+    def test_same_as_python(self, movie, matrix):
+        assert matrix.row_fill().tolist() == row_fill(movie)
+        for party_size in range(1, 10):
+            assert matrix.party_capacity(party_size).tolist() == party_capacity(
+                movie, party_size
+            )
+
+    def test_sees_writes(self, movie, matrix):
+        movie.book(8, 2, 0)
+        assert matrix.booked()[2].all()
+        assert matrix.party_capacity(1).tolist() == [6, 1, 0]
+
+    def test_unbook(self, movie, matrix):
+        import numpy as np
+
+        mask = np.zeros(3, dtype=bool)
+        mask[[1, 2]] = True
+        assert matrix.unbook(mask) == [BookingID(1), BookingID(2)]
+        assert movie.bookings() == {BookingID(3): [(1, 4), (1, 5), (1, 6), (1, 7)]}
+        assert matrix.seats_unbooked() == 20
@@ -0,0 +1,137 @@
+from src._cinema import Cinema
+from src._types import BookingID, Movie
+from src._constants import MOVIE_MAX_ROWS, MOVIE_MAX_COLS
+from concurrent.futures import ThreadPoolExecutor
+import random
+import sys
+import pytest
+
+
+@pytest.fixture
+def cinema():
+    cinema = Cinema()
+    cinema.add("min_screening", Movie("min_title", 1, 1))
+    cinema.add("max_screening", Movie("max_title", MOVIE_MAX_ROWS, MOVIE_MAX_COLS))
+    return cinema
+
+
+class TestCinema:
+    def test_add(self, cinema):
+        assert len(cinema) == 2
+        assert "min_screening" in cinema
+        assert cinema.movie("min_screening").title == "min_title"
+        with pytest.raises(ValueError):
+            cinema.add("min_screening", Movie("other_title", 1, 1))
+
+    def test_remove(self, cinema):
+        assert cinema.remove("min_screening").title == "min_title"
+        assert cinema.screenings() == ["max_screening"]
+        with pytest.raises(KeyError):
+            cinema.book("min_screening", 1)
+
+    def test_book(self, cinema):
+        booking_id = cinema.book("min_screening", 1)
+        assert cinema.seats_unbooked("min_screening") == 0
+        assert cinema.get_booking("min_screening", booking_id) == [(0, 0)]
+        assert cinema.get_map("min_screening", booking_id).endswith("A   o\n    1  ")
+
+        cinema.unbook("min_screening", booking_id)
+        assert cinema.seats_unbooked("min_screening") == 1
+        assert cinema.book_many("max_screening", [(1, None), (2, (0, 0))]) == [
+            BookingID(1),
+            BookingID(2),
+        ]
+        assert cinema.confirm("max_screening", BookingID(1)) is True
+        assert cinema.confirm("max_screening", BookingID(3)) is False
+
+    def test_book_start_seat(self, cinema):
+        first_id = cinema.book("max_screening", 2)
+        second_id = cinema.book("max_screening", 3, 1, 0)
+        assert first_id == BookingID(1)
+        assert second_id == BookingID(2)
+        assert cinema.get_booking("max_screening", first_id) == [(0, 24), (0, 25)]
+        assert cinema.get_booking("max_screening", second_id) == [
+            (1, 0),
+            (1, 1),
+            (1, 2),
+        ]
+
+    def test_move(self, cinema):
+        booking_id = cinema.book("max_screening", 2)
+        assert cinema.move("max_screening", booking_id, 1, 0) == [
+            (0, 24, "."),
+            (0, 25, "."),
+            (1, 0, "o"),
+            (1, 1, "o"),
+        ]
+        assert cinema.get_booking("max_screening", booking_id) == [(1, 0), (1, 1)]
+
+    def test_seats_unbooked_locked(self, cinema):
+        _, lock = cinema._get("min_screening")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with lock:
+                future = executor.submit(cinema.seats_unbooked, "min_screening")
+                with pytest.raises(TimeoutError):
+                    future.result(timeout=0.05)
+            assert future.result() == 1
+
+    def test_stress(self):
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        cinema = Cinema()
+        screenings = [f"screening_{i}" for i in range(4)]
+        for screening in screenings:
+            cinema.add(screening, Movie("title", MOVIE_MAX_ROWS, MOVIE_MAX_COLS))
+
+        def worker(seed):
+            rng = random.Random(seed)
+            booked = []
+            for _ in range(200):
+                screening = rng.choice(screenings)
+                if booked and rng.random() < 0.3:
+                    cinema.unbook(*booked.pop(rng.randrange(len(booked)))[:2])
+                    continue
+                seats_to_book = rng.randint(1, 10)
+                start_seat = (
+                    (rng.randrange(MOVIE_MAX_ROWS), rng.randrange(MOVIE_MAX_COLS))
+                    if rng.random() < 0.5
+                    else None
+                )
+                try:
+                    # All or nothing, so every booking has the seats requested
+                    (booking_id,) = cinema.book_many(
+                        screening, [(seats_to_book, start_seat)]
+                    )
+                except ValueError:
+                    continue
+                booked.append((screening, booking_id, seats_to_book))
+            return booked
+
+        try:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(executor.map(worker, range(32)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        for screening in screenings:
+            bookings = [
+                (booking_id, seats_to_book)
+                for booked in results
+                for booked_screening, booking_id, seats_to_book in booked
+                if booked_screening == screening
+            ]
+            booking_ids = [booking_id for booking_id, _ in bookings]
+            assert len(booking_ids) == len(set(booking_ids))
+            for booking_id, seats_to_book in bookings:
+                assert len(cinema.get_booking(screening, booking_id)) == seats_to_book
+
+            seats = [
+                seat
+                for booking_id in booking_ids
+                for seat in cinema.get_booking(screening, booking_id) or []
+            ]
+            assert len(seats) == len(set(seats))
+            assert cinema.seats_unbooked(screening) == (
+                MOVIE_MAX_ROWS * MOVIE_MAX_COLS - len(seats)
+            )
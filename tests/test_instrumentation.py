@@ -0,0 +1,117 @@
+from src._enums import MetricsFormat
+from src._instrumentation import Histogram, Instruments, disable, enable, enabled
+from src._tui import ScrollingScreen
+from src._types import Movie, SeatGrid
+import curses
+import json
+from unittest.mock import Mock
+import pytest
+
+
+@pytest.fixture
+def instruments():
+    yield enable()
+    disable()
+
+
+class TestHistogram:
+    def test_record(self):
+        histogram = Histogram()
+        for value in [0, 1, 5, 31, 1_000, 1_000_000]:
+            histogram.record(value)
+        assert histogram.count == 6
+        assert histogram.sum == 1_001_037
+        assert (histogram.min, histogram.max) == (0, 1_000_000)
+
+    def test_buckets(self):
+        histogram = Histogram()
+        for value in range(100_000):
+            histogram.record(value)
+        buckets = histogram.buckets()
+        assert sum(count for _, count in buckets) == 100_000
+        assert buckets[:32] == [(value, 1) for value in range(32)]
+        lower_bound = 32
+        for upper_bound, count in buckets[32:]:
+            assert (upper_bound + 1 - lower_bound) / lower_bound <= 1 / 16
+            lower_bound = upper_bound + 1
+
+    def test_percentile(self):
+        histogram = Histogram()
+        for value in range(1, 10_001):
+            histogram.record(value)
+        assert histogram.percentile(0) == 1
+        assert 5_000 <= histogram.percentile(50) <= 5_000 * 17 / 16
+        assert 9_900 <= histogram.percentile(99) <= 9_900 * 17 / 16
+        assert histogram.percentile(100) == 10_000
+        assert Histogram().percentile(50) == 0
+
+
+class TestInstruments:
+    def test_enable_disable(self):
+        book, addstr, row_mask = Movie.book, ScrollingScreen.addstr, SeatGrid.row_mask
+        instruments = enable()
+        assert enabled() is instruments
+        assert Movie.book is not book
+        assert disable() is instruments
+        assert enabled() is None
+        assert (Movie.book, ScrollingScreen.addstr, SeatGrid.row_mask) == (
+            book,
+            addstr,
+            row_mask,
+        )
+
+    def test_movie(self, instruments):
+        movie = Movie("title", 3, 10)
+        booking_id = movie.book(4)
+        movie.book(2)
+        movie.unbook(booking_id)
+        movie.get_map(booking_id)
+        assert instruments.latency("book", "title").count == 2
+        assert instruments.latency("unbook", "title").count == 1
+        assert instruments.scanned("book", "title").min >= 10
+        assert instruments.scanned("get_map", "title").max == 30
+
+    def test_movie_preview(self, instruments):
+        movie = Movie("title", 3, 10)
+        booking_id = movie.commit(movie.preview(4))
+        movie.get_viewport(booking_id, 5, 20)
+        assert instruments.latency("preview", "title").count == 1
+        assert instruments.latency("commit", "title").count == 1
+        assert instruments.latency("get_viewport", "title").count == 1
+        assert instruments.scanned("preview", "title").min >= 10
+
+    def test_screen(self, instruments):
+        stdscn = Mock()
+        stdscn.getyx = Mock(return_value=(23, 0))
+        stdscn.getmaxyx = Mock(return_value=(24, 80))
+        stdscn.addstr = Mock(side_effect=[curses.error, None, None])
+        screen = ScrollingScreen(stdscn)
+        screen.addstr("str")
+        screen.addstr("str")
+        assert instruments.latency("addstr").count == 2
+        assert instruments.scroll_retries == 1
+
+    def test_dump(self, instruments, tmp_path):
+        Movie('say "hi"', 1, 1).book(1)
+        dump = json.loads(instruments.dump(MetricsFormat.JSON))
+        (operation,) = dump["operations"]
+        assert operation["operation"] == "book"
+        assert operation["latency_ns"]["count"] == 1
+        assert dump["scroll_retries"] == 0
+
+        prometheus = instruments.dump(MetricsFormat.PROMETHEUS)
+        assert "# TYPE gic_operation_seconds histogram" in prometheus
+        assert (
+            'gic_operation_seconds_count{operation="book",screening="say \\"hi\\""} 1'
+            in prometheus
+        )
+        assert "gic_scroll_retries_total 0" in prometheus
+
+        instruments.write(tmp_path / "metrics.prom", MetricsFormat.PROMETHEUS)
+        assert (tmp_path / "metrics.prom").read_text() == prometheus
+
+    def test_record_unlabelled(self):
+        instruments = Instruments()
+        instruments.record("addstr", "", 100)
+        assert instruments.scanned("addstr", "") is None
+        assert instruments.latency("addstr").sum == 100
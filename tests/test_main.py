@@ -1,4 +1,10 @@
 import main
+from src._types import BookingID, Movie
+from src._constants import SCREEN_PROMPT_LINES
+from src._enums import MetricsFormat
+from io import StringIO
+import subprocess
+import sys
 from unittest.mock import Mock
 import pytest
 
@@ -11,8 +17,129 @@ def test_handle_admin():
     assert movie.seats_unbooked() == 1
 
 
+def test_make_booking_preview():
+    movie = Movie("title", 8, 10)
+    versions = []
+    inputs = iter(["4", "B03", "Z99", "A01", ""])
+
+    def getstr():
+        versions.append(movie.version)
+        return next(inputs)
+
+    screen = Mock()
+    screen.getstr = getstr
+    screen.getmaxyx = Mock(return_value=(24, 80))
+    screen.getyx = Mock(return_value=(20, 2))
+    screen.addpad = Mock(return_value=3)
+    main._make_booking(screen, movie)
+    assert versions == [0] * 5
+    assert movie.get_booking(BookingID(1)) == [(0, 0), (0, 1), (0, 2), (0, 3)]
+    screen.repaint.assert_called_once_with(
+        3,
+        [(*movie.map_position(0, col), ".") for col in (4, 5, 3, 6)]
+        + [(*movie.map_position(1, col), "o") for col in (2, 3, 4, 5)],
+        (20, 2),
+    )
+    screen.addstr.assert_called_with("Booking id: GIC0001 confirmed.")
+
+
+def test_check_booking_nonexistent():
+    screen = Mock()
+    screen.getstr = Mock(side_effect=["GIC0001", "foo", ""])
+    movie = Movie("title", 1, 1)
+    main._check_booking(screen, movie)
+    screen.addstr.assert_any_call(
+        "Sorry, booking id GIC0001 does not exist.", spacing=1
+    )
+    screen.addstr.assert_any_call("Sorry, booking id foo does not exist.", spacing=1)
+
+
+def test_check_booking_existent():
+    screen = Mock()
+    screen.getstr = Mock(return_value="GIC0001")
+    screen.getmaxyx = Mock(return_value=(24, 80))
+    movie = Movie("title", 1, 1)
+    movie.book(1)
+    main._check_booking(screen, movie)
+    screen.addpad.assert_called_with(
+        movie.get_map(BookingID(1)), spacing=2, reserve=SCREEN_PROMPT_LINES
+    )
+
+
+def test_check_booking_viewport():
+    screen = Mock()
+    screen.getstr = Mock(return_value="GIC0001")
+    screen.getmaxyx = Mock(return_value=(24, 80))
+    movie = Movie("title", 100, 200)
+    movie.book(1)
+    main._check_booking(screen, movie)
+    (booking_map,), _ = screen.addpad.call_args
+    assert len(booking_map.splitlines()) <= 24 - 2 - 4
+    assert max(map(len, booking_map.splitlines())) <= 80
+    assert "o" in booking_map
+
+
+def test_parse_args():
+    assert main.parse_args([]).command is None
+
+    args = main.parse_args(["serve", "--movie", "title 1 1", "--port", "9000"])
+    assert args.command == "serve"
+    assert args.movie == ["title 1 1"]
+    assert args.port == 9000
+    assert args.large_venue is False
+    assert main.parse_args(["--large-venue"]).large_venue is True
+    assert main.parse_args(["--script", "-"]).script == "-"
+    assert main.parse_args(["--keep-together"]).keep_together is True
+    assert main.parse_args([]).metrics is None
+    args = main.parse_args(["--metrics", "m.prom", "--metrics-format", "prometheus"])
+    assert (args.metrics, args.metrics_format) == ("m.prom", MetricsFormat.PROMETHEUS)
+
+
+def test_run_script():
+    script = StringIO("title 2 5\n1\n3\n\n2\nGIC0001\n")
+    output = StringIO()
+    main.run_script(script, output)
+    transcript = output.getvalue()
+    assert "Successfully reserved 3 title tickets." in transcript
+    assert "Booking id: GIC0001 confirmed." in transcript
+    assert "A   .   o   o   o   ." in transcript
+    assert "(7 seats available)" in transcript
+
+
+def test_run_script_exit():
+    output = StringIO()
+    with pytest.raises(SystemExit):
+        main.run_script(StringIO("title 1 1\n3\n\n"), output)
+    assert output.getvalue().endswith("Thank you for using GIC Cinemas system. Bye!")
+
+
 def test_exit():
     with pytest.raises(SystemExit) as e:
         main._exit(Mock())
     assert e.type is SystemExit
     assert e.value.code is None
+
+
+def test_lazy_imports():
+    modules = subprocess.run(
+        [sys.executable, "-c", "import sys, main; print(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+    assert "curses" not in modules
+    assert "asyncio" not in modules
+
+
+def test_lazy_imports_metrics():
+    script = (
+        "import sys, main; from src._instrumentation import enable; enable(); "
+        "print(*sys.modules)"
+    )
+    modules = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+    assert "curses" not in modules
@@ -0,0 +1,137 @@
+from src._persistence import (
+    BookingLog,
+    BookingStore,
+    _RECORD,
+    _frame,
+    _pack_seats,
+    _unpack_seats,
+)
+from src._types import BookingID, Movie
+from src._constants import MOVIE_MAX_ROWS, MOVIE_MAX_COLS
+import pytest
+
+
+def new_movie():
+    return Movie("max_title", MOVIE_MAX_ROWS, MOVIE_MAX_COLS)
+
+
+class TestBookingLog:
+    def test_replay(self, tmp_path):
+        log = BookingLog(tmp_path / "wal", sync_every=1)
+        movie = new_movie()
+        movie.journal = log
+        booking_id = movie.book(3)
+        movie.book(2, 4, 5)
+        movie.unbook(booking_id)
+        movie.book_many([(4, None), (1, (7, 7))])
+        log.close()
+
+        recovered = new_movie()
+        BookingLog.replay(tmp_path / "wal", recovered)
+        assert recovered.bookings() == movie.bookings()
+        assert recovered.booking_counter == movie.booking_counter
+        assert recovered.get_map(BookingID(3)) == movie.get_map(BookingID(3))
+
+    def test_group_commit(self, tmp_path):
+        log = BookingLog(tmp_path / "wal", sync_every=3)
+        log.record_unbook(BookingID(1))
+        log.record_unbook(BookingID(2))
+        assert (tmp_path / "wal").stat().st_size == 0
+        log.record_unbook(BookingID(3))
+        assert (tmp_path / "wal").stat().st_size > 0
+        log.close()
+
+    def test_replay_torn(self, tmp_path):
+        log = BookingLog(tmp_path / "wal", sync_every=1)
+        log.record_book(BookingID(1), [(0, 0), (0, 1)], 1)
+        log.record_book(BookingID(2), [(0, 2)], 2)
+        log.close()
+        size = (tmp_path / "wal").stat().st_size
+        with open(tmp_path / "wal", "r+b") as file:
+            file.truncate(size - 1)
+
+        movie = new_movie()
+        assert 0 < BookingLog.replay(tmp_path / "wal", movie) < size - 1
+        assert movie.bookings() == {BookingID(1): [(0, 0), (0, 1)]}
+
+    def test_pack_seats(self):
+        assert _pack_seats([(1, 258)]) == b"\x01\x00\x02\x01"
+        assert _unpack_seats(b"\x01\x00\x02\x01") == [(1, 258)]
+
+    def test_replay_corrupt(self, tmp_path):
+        with open(tmp_path / "wal", "wb") as file:
+            file.write(_frame(_RECORD.pack(1, 1, 3, 1) + _pack_seats([(0, 0)])))
+
+        movie = new_movie()
+        with pytest.raises(ValueError):
+            BookingLog.replay(tmp_path / "wal", movie)
+        assert movie.bookings() == {}
+
+
+class TestBookingStore:
+    def test_recover(self, tmp_path):
+        store = BookingStore(tmp_path, sync_every=1, snapshot_every=None)
+        movie = store.recover(new_movie())
+        movie.book(10)
+        movie.unbook(movie.book(5))
+        store.close()
+
+        store = BookingStore(tmp_path)
+        recovered = store.recover(new_movie())
+        assert recovered.bookings() == movie.bookings()
+        assert recovered.book(1) == BookingID(3)
+        store.close()
+
+    def test_snapshot(self, tmp_path):
+        store = BookingStore(tmp_path, sync_every=1, snapshot_every=4)
+        movie = store.recover(new_movie())
+        for _ in range(10):
+            movie.book(3)
+        movie.unbook(BookingID(2))
+        store.close()
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "snapshot",
+            "wal.000003",
+        ]
+
+        store = BookingStore(tmp_path)
+        recovered = store.recover(new_movie())
+        assert recovered.bookings() == movie.bookings()
+        assert recovered.booking_counter == 10
+        store.close()
+
+    @pytest.mark.parametrize("snapshot", [False, True])
+    def test_recover_holds(self, tmp_path, snapshot):
+        def held_movie():
+            return Movie("max_title", MOVIE_MAX_ROWS, MOVIE_MAX_COLS, hold_ttl=10.0)
+
+        store = BookingStore(tmp_path, sync_every=1, snapshot_every=None)
+        movie = store.recover(held_movie())
+        confirmed_id = movie.book(2)
+        confirmed_late_id = movie.book(4)
+        held_id = movie.book(3)
+        movie.confirm(confirmed_id)
+        if snapshot:
+            store.snapshot()
+        movie.confirm(confirmed_late_id)
+        movie.move(held_id, 5, 0)
+        store.close()
+
+        store = BookingStore(tmp_path)
+        recovered = store.recover(held_movie())
+        assert recovered.bookings() == {
+            confirmed_id: movie.get_booking(confirmed_id),
+            confirmed_late_id: movie.get_booking(confirmed_late_id),
+        }
+        assert recovered.holds() == []
+        assert recovered.booking_counter == 3
+        store.close()
+
+    def test_recover_mismatch(self, tmp_path):
+        store = BookingStore(tmp_path, snapshot_every=None)
+        store.recover(new_movie()).book(1)
+        store.snapshot()
+        store.close()
+
+        with pytest.raises(ValueError):
+            BookingStore(tmp_path).recover(Movie("min_title", 1, 1))
@@ -0,0 +1,203 @@
+from src._cinema import Cinema
+from src._server import BookingServer
+from src._types import BookingID, Movie
+from src._constants import (
+    MOVIE_MAX_ROWS,
+    MOVIE_MAX_COLS,
+    SERVER_MAP_HEIGHT,
+    SERVER_MAP_WIDTH,
+    VENUE_MAX_ROWS,
+    VENUE_MAX_COLS,
+)
+import asyncio
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+
+    async def request(self, line):
+        self._writer.write(line.encode() + b"\n")
+        await self._writer.drain()
+        lines = []
+        while (response := (await self._reader.readline()).decode()) != ".\n":
+            lines.append(response.rstrip("\n"))
+        return lines[0], lines[1:]
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+def run_server(client_main, sync=None):
+    async def run():
+        cinema = Cinema()
+        cinema.add("min_title", Movie("min_title", 1, 1))
+        cinema.add("max_title", Movie("max_title", MOVIE_MAX_ROWS, MOVIE_MAX_COLS))
+        server = await BookingServer(cinema, sync).start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+
+        async def connect():
+            return Client(*await asyncio.open_connection("127.0.0.1", port))
+
+        async with server:
+            return await client_main(connect, cinema)
+
+    return asyncio.run(run())
+
+
+def test_session():
+    async def client_main(connect, cinema):
+        client = await connect()
+        assert await client.request("SCREENINGS") == ("OK", ["min_title", "max_title"])
+        assert (await client.request("AVAILABLE"))[0].startswith("ERR")
+        assert await client.request("USE min_title") == ("OK", [])
+        assert await client.request("AVAILABLE") == ("OK 1", [])
+        assert (await client.request("BOOK 2"))[0] == (
+            "ERR Sorry, there are only 1 seats available."
+        )
+
+        status, booking_map = await client.request("BOOK 1")
+        assert status == "OK GIC0001"
+        assert booking_map[-2] == "A   o"
+        assert (await client.request("MOVE A1"))[0] == "OK GIC0001"
+        assert (await client.request("MOVE Z1"))[0].startswith("ERR")
+        assert await client.request("ACCEPT") == (
+            "OK Booking id: GIC0001 confirmed.",
+            [],
+        )
+        assert (await client.request("CHECK GIC0002"))[0].startswith("ERR")
+        assert (await client.request("CHECK GIC0001"))[1][-2] == "A   o"
+        assert (await client.request("BOOK x"))[0] == "ERR Invalid argument x."
+        assert (await client.request("QUIT"))[0].startswith("OK")
+        await client.close()
+
+    run_server(client_main)
+
+
+def test_changes():
+    async def client_main(connect, cinema):
+        client = await connect()
+        await client.request("USE max_title")
+        assert await client.request("CHANGES") == ("OK 0", [])
+        await client.request("BOOK 2")
+        assert await client.request("CHANGES 0") == ("OK 2", ["A25 o", "A26 o"])
+        await client.request("MOVE B1")
+        assert await client.request("CHANGES 2") == (
+            "OK 6",
+            ["A25 .", "A26 .", "B1 o", "B2 o"],
+        )
+        assert (await client.request("CHANGES 7"))[0].startswith("ERR")
+        assert (await client.request("MOVE Z50"))[0] == (
+            "ERR Sorry, unable to move booking GIC0001 to 2 seats from there."
+        )
+        assert (await client.request("MOVE C1"))[0] == "OK GIC0001"
+        await client.close()
+
+    run_server(client_main)
+
+
+def test_concurrent_sessions():
+    async def session(connect):
+        client = await connect()
+        await client.request("USE max_title")
+        status, _ = await client.request("BOOK 3")
+        booking_id = status.split()[1]
+        status, _ = await client.request("MOVE B10")
+        assert status == f"OK {booking_id}"
+        await client.request("ACCEPT")
+        await client.close()
+        return booking_id
+
+    async def client_main(connect, cinema):
+        booking_ids = await asyncio.gather(*(session(connect) for _ in range(200)))
+        assert len(set(booking_ids)) == 200
+
+        seats = [
+            seat
+            for booking_id in booking_ids
+            for seat in cinema.get_booking("max_title", BookingID.parse(booking_id))
+        ]
+        assert len(seats) == len(set(seats)) == 600
+        assert cinema.seats_unbooked("max_title") == (
+            MOVIE_MAX_ROWS * MOVIE_MAX_COLS - 600
+        )
+
+    run_server(client_main)
+
+
+def test_accept_synced():
+    synced = []
+
+    async def client_main(connect, cinema):
+        clients = [await connect() for _ in range(3)]
+        for client in clients:
+            await client.request("USE max_title")
+            await client.request("BOOK 2")
+        assert synced == []
+
+        statuses = await asyncio.gather(
+            *(client.request("ACCEPT") for client in clients)
+        )
+        for client in clients:
+            await client.close()
+        assert [status for status, _ in statuses] == [
+            f"OK Booking id: GIC000{i} confirmed." for i in range(1, 4)
+        ]
+        assert synced and set(synced) == {"max_title"}
+        assert len(synced) <= 3
+
+    run_server(client_main, synced.append)
+
+
+def test_pending_released():
+    async def client_main(connect, cinema):
+        client = await connect()
+        await client.request("USE max_title")
+        await client.request("BOOK 6")
+        assert (await client.request("BOOK 4"))[0] == "OK GIC0002"
+        assert cinema.seats_unbooked("max_title") == MOVIE_MAX_ROWS * MOVIE_MAX_COLS - 4
+
+        await client.request("USE min_title")
+        assert cinema.seats_unbooked("max_title") == MOVIE_MAX_ROWS * MOVIE_MAX_COLS
+        await client.request("BOOK 1")
+        assert cinema.seats_unbooked("min_title") == 0
+        await client.close()
+        # Released once the server sees the disconnect
+        for _ in range(100):
+            if cinema.seats_unbooked("min_title"):
+                break
+            await asyncio.sleep(0.01)
+
+        other = await connect()
+        await other.request("USE min_title")
+        assert await other.request("AVAILABLE") == ("OK 1", [])
+        await other.request("BOOK 1")
+        await other.request("ACCEPT")
+        await other.close()
+        await asyncio.sleep(0)
+        assert cinema.seats_unbooked("min_title") == 0
+
+    run_server(client_main)
+
+
+def test_window():
+    async def client_main(connect, cinema):
+        cinema.add("venue", Movie("venue", VENUE_MAX_ROWS, VENUE_MAX_COLS))
+        client = await connect()
+        await client.request("USE venue")
+        status, booking_map = await client.request("BOOK 2")
+        assert status == "OK GIC0001"
+        assert len(booking_map) <= SERVER_MAP_HEIGHT
+        assert max(map(len, booking_map)) <= SERVER_MAP_WIDTH
+
+        assert await client.request("WINDOW 10 60") == ("OK", [])
+        booking_map = (await client.request("CHECK GIC0001"))[1]
+        assert len(booking_map) <= 10
+        assert max(map(len, booking_map)) <= 60
+        assert (await client.request("WINDOW 0 60"))[0].startswith("ERR")
+        assert (await client.request("WINDOW 10"))[0].startswith("ERR")
+        await client.close()
+
+    run_server(client_main)
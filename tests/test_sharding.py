@@ -0,0 +1,54 @@
+from src._sharding import ShardedCinema, shard_of
+from src._types import BookingID, Movie
+import pytest
+
+
+@pytest.fixture
+def cinema():
+    with ShardedCinema(2) as cinema:
+        for i in range(4):
+            cinema.add(f"screening_{i}", "title", 2, 5)
+        yield cinema
+
+
+def test_shard_of():
+    assert shard_of("screening_0", 4) == shard_of("screening_0", 4)
+    assert {shard_of(f"screening_{i}", 4) for i in range(100)} == {0, 1, 2, 3}
+
+
+class TestShardedCinema:
+    def test_add(self, cinema):
+        assert len(cinema) == 4
+        assert "screening_0" in cinema
+        assert cinema.shards == 2
+        with pytest.raises(ValueError):
+            cinema.add("screening_0", "title", 1, 1)
+        assert len(cinema) == 4
+
+    def test_book(self, cinema):
+        movie = Movie("title", 2, 5)
+        booking_id = cinema.book("screening_1", 3)
+        assert booking_id == movie.book(3)
+        assert cinema.seats_unbooked("screening_1") == 7
+        assert cinema.get_map("screening_1", booking_id) == movie.get_map(booking_id)
+        assert cinema.get_viewport(
+            "screening_1", booking_id, 8, 30
+        ) == movie.get_viewport(booking_id, 8, 30)
+        assert cinema.move("screening_1", booking_id, 1, 0) == movie.move(
+            booking_id, 1, 0
+        )
+        assert cinema.confirm("screening_1", booking_id) is True
+        assert cinema.book("screening_1", 1, 0, 0) == booking_id + 1
+        cinema.unbook("screening_1", booking_id)
+        assert cinema.get_booking("screening_1", booking_id) is None
+        with pytest.raises(KeyError):
+            cinema.book("screening_9", 1)
+
+    def test_batch(self, cinema):
+        results = cinema.batch([("book", f"screening_{i % 4}", (5,)) for i in range(8)])
+        assert results == [BookingID(1)] * 4 + [BookingID(2)] * 4
+        results = cinema.batch(
+            [("seats_unbooked", "screening_2", ()), ("book", "screening_9", (1,))]
+        )
+        assert results[0] == 0
+        assert isinstance(results[1], KeyError)
@@ -0,0 +1,91 @@
+from src._shared import SeatMapReader, SharedSeats
+from src._types import BookingID, Movie
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import sys
+import threading
+import pytest
+
+
+@pytest.fixture
+def movie():
+    return Movie("title", 3, 5)
+
+
+@pytest.fixture
+def shared(movie):
+    movie.book(2)
+    shared = SharedSeats.create(movie)
+    yield shared
+    shared.close()
+
+
+def read_seats_unbooked(name):
+    reader = SeatMapReader(name)
+    try:
+        return reader.seats_unbooked()
+    finally:
+        reader.close()
+
+
+class TestSharedSeats:
+    def test_create(self, movie, shared):
+        reader = SeatMapReader(shared.name)
+        assert (reader.rows, reader.cols) == (3, 5)
+        assert reader.seats_unbooked() == 13
+        assert reader.get_map(BookingID(1)) == movie.get_map(BookingID(1))
+        reader.close()
+
+    def test_writes(self, movie, shared):
+        reader = SeatMapReader(shared.name)
+        booking_id = movie.book(6)
+        assert reader.seats_unbooked() == movie.seats_unbooked() == 7
+        assert reader.get_map(booking_id) == movie.get_map(booking_id)
+        movie.unbook(BookingID(1))
+        assert reader.get_map(None) == movie.get_map(None)
+        movie.move(booking_id, 1, 2)
+        assert reader.get_map(booking_id) == movie.get_map(booking_id)
+        reader.close()
+
+    def test_seat_writes(self, movie, shared):
+        reader = SeatMapReader(shared.name)
+        movie.seat(0, 0).book(BookingID(5))
+        assert reader.seats_unbooked() == movie.seats_unbooked() == 12
+        assert reader.get_map(BookingID(5)) == movie.get_map(BookingID(5))
+        movie.seat(0, 0).unbook()
+        assert reader.seats_unbooked() == movie.seats_unbooked() == 13
+        reader.close()
+
+    def test_other_process(self, movie, shared):
+        movie.book(3)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            assert executor.submit(read_seats_unbooked, shared.name).result() == 10
+
+    def test_consistent_reads(self, movie, shared):
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        done = threading.Event()
+
+        def writer():
+            for _ in range(2_000):
+                movie.unbook(movie.book(4))
+            done.set()
+
+        reader = SeatMapReader(shared.name)
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            while not done.is_set():
+                assert reader.get_map(None).count("#") in (2, 6)
+        finally:
+            thread.join()
+            reader.close()
+            sys.setswitchinterval(switch_interval)
+
+    def test_close(self, movie):
+        booking_id = movie.book(2)
+        SharedSeats.create(movie).close()
+        assert movie.get_booking(booking_id) == [(0, 2), (0, 1)]
+        assert movie.book(1) == BookingID(2)
+        assert movie.seats_unbooked() == 12
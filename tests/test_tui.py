@@ -0,0 +1,59 @@
+from src._tui import ScrollingScreen
+from src._constants import SCREEN_DEFAULT_SPACING
+import src._types
+import curses
+from unittest.mock import Mock
+
+
+class TestScrollingScreen:
+    def test_reexported(self):
+        assert src._types.ScrollingScreen is ScrollingScreen
+
+    def test_addstr(self):
+        stdscn = Mock()
+        stdscn.getyx = Mock(return_value=(0, 0))
+
+        screen = ScrollingScreen(stdscn)
+        screen.addstr("str")
+
+        stdscn.getyx.assert_called_once()
+        stdscn.addstr.assert_called_once_with(0 + SCREEN_DEFAULT_SPACING, 0, "str")
+
+    def test_addstr_overflow(self):
+        stdscn = Mock()
+        stdscn.getyx = Mock(return_value=(23, 0))
+        stdscn.getmaxyx = Mock(return_value=(24, 80))
+        stdscn.addstr = Mock(side_effect=[curses.error, None])
+
+        screen = ScrollingScreen(stdscn)
+        screen.addstr("str")
+
+        stdscn.scroll.assert_called_once_with(SCREEN_DEFAULT_SPACING)
+        stdscn.addstr.assert_called_with(23, 0, "str")
+        assert screen.scroll_retries == 1
+
+    def test_addpad(self, monkeypatch):
+        pad = Mock()
+        monkeypatch.setattr(curses, "newpad", Mock(return_value=pad))
+        stdscn = Mock()
+        stdscn.getyx = Mock(return_value=(20, 0))
+        stdscn.getmaxyx = Mock(return_value=(24, 8))
+
+        screen = ScrollingScreen(stdscn)
+        screen.addpad("a\nbbbbbbbbbb\nc\nd", spacing=1)
+
+        curses.newpad.assert_called_once_with(5, 11)
+        stdscn.scroll.assert_called_once_with(2)
+        pad.overwrite.assert_called_once_with(stdscn, 0, 0, 19, 0, 22, 7)
+        stdscn.move.assert_called_once_with(22, 1)
+
+    def test_repaint(self):
+        stdscn = Mock()
+        stdscn.getmaxyx = Mock(return_value=(24, 80))
+
+        screen = ScrollingScreen(stdscn)
+        screen.repaint(3, [(5, 4, "o"), (30, 4, "o")], (12, 0))
+
+        stdscn.addch.assert_called_once_with(8, 4, "o")
+        stdscn.move.assert_called_once_with(12, 0)
+        stdscn.clrtobot.assert_called_once()
@@ -1,15 +1,45 @@
-from src._types import Seat, Movie, ScrollingScreen
+from src._types import (
+    BookingID,
+    Seat,
+    SeatGrid,
+    FenwickTree,
+    Movie,
+    HeadlessScreen,
+)
 from src._constants import (
     SCREEN_DEFAULT_SPACING,
     MOVIE_MAX_COLS,
     MOVIE_MIN_ROWS,
     MOVIE_MIN_COLS,
     MOVIE_MAX_ROWS,
+    VENUE_MAX_ROWS,
+    VENUE_MAX_COLS,
 )
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 from unittest.mock import Mock
 import pytest
 
 
+class TestBookingID:
+    def test_str(self):
+        assert str(BookingID(1)) == "GIC0001"
+        assert f"{BookingID(9999)}" == "GIC9999"
+        assert f"{BookingID(10_000)}" == "GIC10000"
+
+    def test_parse(self):
+        assert BookingID.parse("GIC0001") == 1
+        assert BookingID.parse(" gic10000 ") == 10_000
+        assert BookingID.parse(str(BookingID(123_456))) == 123_456
+
+    @pytest.mark.parametrize(
+        "booking_id", ["", "GIC", "GIC1", "GIC0000", "GICabcd", "XYZ0001", "0001x"]
+    )
+    def test_parse_invalid(self, booking_id):
+        with pytest.raises(ValueError):
+            BookingID.parse(booking_id)
+
+
 @pytest.fixture
 def seat():
     return Seat()
@@ -18,22 +48,106 @@ def seat():
 class TestSeat:
     def test_init(self, seat):
         assert seat.is_booked is False
-        assert seat.get_chr("some_booking_id") == "."
+        assert seat.get_chr(BookingID(1)) == "."
 
     def test_book(self, seat):
-        seat.book("some_booking_id")
+        seat.book(BookingID(1))
         assert seat.is_booked is True
-        assert seat.get_chr("some_booking_id") == "o"
-        assert seat.get_chr("other_booking_id") == "#"
+        assert seat.get_chr(BookingID(1)) == "o"
+        assert seat.get_chr(BookingID(2)) == "#"
 
     def test_unbook(self, seat):
-        seat.book("some_booking_id")
+        seat.book(BookingID(1))
         assert seat.is_booked is True
-        assert seat.get_chr("some_booking_id") == "o"
+        assert seat.get_chr(BookingID(1)) == "o"
 
         seat.unbook()
         assert seat.is_booked is False
-        assert seat.get_chr("some_booking_id") == "."
+        assert seat.get_chr(BookingID(1)) == "."
+
+
+def assert_counters(grid):
+    for row in range(grid.rows):
+        assert grid.count_row_free(row) == grid.get_row(row, None).count(".")
+        assert grid.row_mask(row).bit_count() == grid.count_row_free(row)
+        assert grid.row_center_mask(row).bit_count() == grid.count_row_free(row)
+    assert grid.count_free() == sum(
+        grid.count_row_free(row) for row in range(grid.rows)
+    )
+
+
+class TestFenwickTree:
+    def test_prefix_sum(self):
+        tree = FenwickTree([1, 0, 2, 3])
+        assert [tree.prefix_sum(stop) for stop in range(5)] == [0, 1, 1, 3, 6]
+        tree.add(1, 4)
+        assert [tree.prefix_sum(stop) for stop in range(5)] == [0, 1, 5, 7, 10]
+
+    def test_search(self):
+        tree = FenwickTree([1, 0, 2, 3])
+        assert [tree.search(target) for target in range(7)] == [0, 2, 2, 3, 3, 3, 4]
+
+
+@pytest.fixture
+def grid():
+    return SeatGrid(2, 3)
+
+
+class TestSeatGrid:
+    def test_init(self, grid):
+        assert grid.rows == 2
+        assert grid.cols == 3
+        assert grid.count_free() == 6
+        assert grid.get_row(0, BookingID(1)) == [".", ".", "."]
+
+    def test_copy_on_write(self, grid):
+        other_grid = SeatGrid(2, 3)
+        grid.release(0, 0)
+        grid.assign(0, 1, BookingID(1))
+        assert other_grid.is_booked(0, 1) is False
+        assert other_grid.count_row_free(0) == 3
+        assert other_grid.row_mask(0) == 0b111
+        assert other_grid.next_free_row(0) == 0
+        assert SeatGrid(2, 3).get_row(0, None) == [".", ".", "."]
+        assert_counters(grid)
+        assert_counters(other_grid)
+
+    def test_assign(self, grid):
+        grid.assign(0, 1, BookingID(1))
+        grid.assign(1, 2, BookingID(1))
+        grid.assign(1, 0, BookingID(2))
+        assert grid.count_free() == 3
+        assert grid.booking_id(0, 1) == BookingID(1)
+        assert grid.get_row(1, BookingID(1)) == ["#", ".", "o"]
+        assert grid.seats(BookingID(1)) == [(0, 1), (1, 2)]
+        assert grid.seats(BookingID(3)) is None
+        assert grid.count_row_free(0) == 2
+        assert grid.count_row_free(1) == 1
+        assert_counters(grid)
+
+        grid.assign(1, 0, BookingID(1))
+        assert grid.count_free() == 3
+        assert grid.seats(BookingID(1)) == [(0, 1), (1, 2), (1, 0)]
+        assert grid.seats(BookingID(2)) is None
+        assert_counters(grid)
+
+    def test_release_booking(self, grid):
+        grid.assign(0, 1, BookingID(1))
+        grid.assign(1, 0, BookingID(2))
+        grid.release_booking(BookingID(1))
+        assert grid.count_free() == 5
+        assert grid.is_booked(0, 1) is False
+        assert grid.is_booked(1, 0) is True
+        grid.release_booking(BookingID(3))
+        assert grid.count_free() == 5
+        assert_counters(grid)
+
+        assert grid.next_free_row(0) == 0
+        grid.release(0, 0)
+        grid.release(1, 0)
+        assert grid.seats(BookingID(2)) is None
+        assert grid.count_free() == 6
+        assert_counters(grid)
 
 
 @pytest.fixture
@@ -45,6 +159,15 @@ def min_movie():
 def max_movie():
     return Movie("max_title", MOVIE_MAX_ROWS, MOVIE_MAX_COLS)
 
+    def test_changes_since_forgotten(self, monkeypatch):
+        monkeypatch.setattr("src._types.GRID_CHANGES_MAX", 4)
+        grid = SeatGrid(1, 5)
+        for col in range(5):
+            grid.assign(0, col, BookingID(1))
+        assert grid.changes_since(0) is None
+        assert grid.changes_since(3) == [(0, 3), (0, 4)]
+        assert grid.changes_since(5) == []
+
 
 class TestMovie:
     def test_init(self, min_movie, max_movie):
@@ -83,26 +206,280 @@ class TestMovie:
         with pytest.raises(ValueError):
             Movie.from_user_input(f"some_title {MOVIE_MIN_ROWS} {MOVIE_MAX_COLS + 1}")
 
+    def test_from_user_input_large_venue(self):
+        movie = Movie.from_user_input(
+            f"some_title {VENUE_MAX_ROWS} {VENUE_MAX_COLS}",
+            max_rows=VENUE_MAX_ROWS,
+            max_cols=VENUE_MAX_COLS,
+        )
+        assert movie.seats_unbooked() == VENUE_MAX_ROWS * VENUE_MAX_COLS
+        with pytest.raises(ValueError):
+            Movie.from_user_input(f"some_title {MOVIE_MAX_ROWS + 1} {MOVIE_MIN_COLS}")
+        with pytest.raises(ValueError):
+            Movie.from_user_input(
+                f"some_title {VENUE_MAX_ROWS + 1} {MOVIE_MIN_COLS}",
+                max_rows=VENUE_MAX_ROWS,
+                max_cols=VENUE_MAX_COLS,
+            )
+
+    def test_book_large_venue(self):
+        movie = Movie("title", 1000, 300)
+        movie.book(300 * 999)
+        assert movie.book(2) == BookingID(2)
+        assert movie.get_booking(BookingID(2)) == [(999, 149), (999, 150)]
+
+    def test_get_map_large_venue(self):
+        movie = Movie("title", 28, 101)
+        booking_id = movie.book(1, 27, 100)
+        booking_map = movie.get_map(booking_id).splitlines()
+        assert booking_map[5].startswith("AB   .   .")
+        assert booking_map[5].endswith(".   o")
+        assert booking_map[-2].startswith("A    .   .")
+        assert booking_map[-1].endswith("  98  99 100 101")
+        assert len(booking_map[-1]) == len(booking_map[-2])
+
+    def test_changes_since(self):
+        movie = Movie("title", 5, 12)
+        booking_id = movie.book(3)
+        version = movie.version
+        movie.unbook(booking_id)
+        booking_id = movie.book(3, 1, 2)
+        changes = movie.changes_since(version, booking_id)
+        assert sorted(changes) == [
+            (0, 4, "."),
+            (0, 5, "."),
+            (0, 6, "."),
+            (1, 2, "o"),
+            (1, 3, "o"),
+            (1, 4, "o"),
+        ]
+        booking_map = movie.get_map(booking_id).splitlines()
+        for row, col, chr in changes:
+            line, x = movie.map_position(row, col)
+            assert booking_map[line][x] == chr
+        assert movie.changes_since(movie.version, booking_id) == []
+        assert movie.changes_since(movie.version + 1, booking_id) is None
+
+    def test_map_fits(self, max_movie):
+        width = len(max(max_movie.get_map(None).splitlines(), key=len))
+        assert max_movie.map_fits(MOVIE_MAX_ROWS + 6, width)
+        assert not max_movie.map_fits(MOVIE_MAX_ROWS + 5, width)
+        assert not max_movie.map_fits(MOVIE_MAX_ROWS + 6, width - 1)
+
+    def test_get_viewport_fits(self, max_movie):
+        booking_id = max_movie.book(4)
+        assert max_movie.get_viewport(booking_id, 100, 300) == max_movie.get_map(
+            booking_id
+        )
+
+    def test_get_viewport_window(self):
+        movie = Movie("title", 100, 200)
+        booking_id = movie.book(2, 49, 99)
+        viewport = movie.get_viewport(booking_id, 16, 42).splitlines()
+        assert len(viewport) == 16
+        assert all(len(line) <= 42 for line in viewport)
+        assert viewport[5].startswith("BB")
+        assert viewport[-2].startswith("AS")
+        assert "AX   .   .   .   .   .   o   o   .   .   ." in viewport
+        assert viewport[-1] == "    95  96  97  98  99 100 101 102 103 104"
+
+    def test_get_viewport_edge(self):
+        movie = Movie("title", 100, 200)
+        viewport = movie.get_viewport(movie.book(1, 0, 0), 10, 30).splitlines()
+        assert viewport[5] == "D    .   .   .   .   .   .   ."
+        assert viewport[-2] == "A    o   .   .   .   .   .   ."
+        assert viewport[-1] == "     1   2   3   4   5   6   7"
+
     def test_book_one(self, min_movie, max_movie):
         min_booking_id = min_movie.book(1)
         assert min_movie.seats_unbooked() == MOVIE_MIN_ROWS * MOVIE_MIN_COLS - 1
-        assert min_booking_id == "GIC0001"
+        assert min_booking_id == BookingID(1)
 
         max_booking_id = max_movie.book(1)
         assert max_movie.seats_unbooked() == MOVIE_MAX_ROWS * MOVIE_MAX_COLS - 1
-        assert max_booking_id == "GIC0001"
+        assert max_booking_id == BookingID(1)
 
     def test_book_multiple(self, max_movie):
         max_booking_id = max_movie.book(50)
         assert max_movie.seats_unbooked() == MOVIE_MAX_ROWS * MOVIE_MAX_COLS - 50
-        assert max_booking_id == "GIC0001"
+        assert max_booking_id == BookingID(1)
+
+    def test_book_concurrent_booking_ids(self, max_movie):
+        # Only issuing Booking IDs is thread-safe, bookings need a `Cinema`
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            booking_ids = list(
+                executor.map(lambda _: max_movie._next_booking_id(), range(500))
+            )
+        assert len(set(booking_ids)) == 500
+        assert max(booking_ids) == BookingID(500)
+
+    def test_book_many(self, max_movie):
+        booking_ids = max_movie.book_many([(30, None), (5, (3, 10)), (30, None)])
+        assert booking_ids == [BookingID(1), BookingID(2), BookingID(3)]
+        assert max_movie.seats_unbooked() == MOVIE_MAX_ROWS * MOVIE_MAX_COLS - 65
+        assert max_movie.get_booking(BookingID(2)) == [
+            (3, col) for col in range(10, 15)
+        ]
+        assert max_movie.get_booking(BookingID(3))[:2] == [(0, 9), (0, 40)]
+        assert max_movie.book(1) == BookingID(4)
+
+    def test_book_many_same_as_book(self, max_movie):
+        other_movie = Movie("other_title", MOVIE_MAX_ROWS, MOVIE_MAX_COLS)
+        requests = [(seats, None) for seats in range(1, 40)]
+        booking_ids = max_movie.book_many(requests)
+        assert booking_ids == [other_movie.book(seats) for seats, _ in requests]
+        assert max_movie.get_map(BookingID(20)) == other_movie.get_map(BookingID(20))
+
+    def test_book_many_all_or_nothing(self, min_movie, max_movie):
+        with pytest.raises(ValueError):
+            min_movie.book_many([(1, None), (1, None)])
+        assert min_movie.seats_unbooked() == MOVIE_MIN_ROWS * MOVIE_MIN_COLS
+        assert min_movie.book(1) == BookingID(1)
+
+        with pytest.raises(ValueError):
+            max_movie.book_many([(10, None), (10, (MOVIE_MAX_ROWS - 1, 45))])
+        assert max_movie.seats_unbooked() == MOVIE_MAX_ROWS * MOVIE_MAX_COLS
+        assert max_movie.get_booking(BookingID(1)) is None
+
+    def test_book_many_invalid_seat(self, max_movie):
+        max_movie.journal = Mock()
+        for start_seat in [(MOVIE_MAX_ROWS, 0), (0, -1), (-1, 0), (0, MOVIE_MAX_COLS)]:
+            with pytest.raises(ValueError):
+                max_movie.book_many([(10, None), (1, start_seat)])
+        assert max_movie.seats_unbooked() == MOVIE_MAX_ROWS * MOVIE_MAX_COLS
+        assert max_movie.journal.record_book.call_count == 0
+        assert max_movie.book(1) == BookingID(1)
+
+    def test_hold(self):
+        now = [0.0]
+        movie = Movie("title", 2, 2, hold_ttl=10.0, clock=lambda: now[0])
+        held_id = movie.book(2)
+        confirmed_id = movie.book(1)
+        assert movie.is_held(held_id) is True
+        assert movie.confirm(confirmed_id) is True
+        assert movie.is_held(confirmed_id) is False
+
+        now[0] = 9.0
+        assert movie.seats_unbooked() == 1
+        now[0] = 10.0
+        assert movie.seats_unbooked() == 3
+        assert movie.get_booking(held_id) is None
+        assert movie.get_booking(confirmed_id) == [(1, 0)]
+        assert movie.confirm(held_id) is False
+
+    def test_hold_rebook(self):
+        now = [0.0]
+        movie = Movie("title", 2, 2, hold_ttl=10.0, clock=lambda: now[0])
+        booking_id = movie.book(2)
+        now[0] = 5.0
+        movie.unbook(booking_id)
+        movie.book(2, 1, 0)
+        now[0] = 10.0
+        assert movie.expire_holds() == []
+        now[0] = 15.0
+        assert movie.expire_holds() == [booking_id]
+        assert movie.seats_unbooked() == 4
+
+    def test_preview(self, max_movie):
+        max_movie._allocator = Mock(wraps=max_movie._allocator)
+        version = max_movie.version
+        plan = max_movie.preview(3)
+        assert plan.seats == ((0, 24), (0, 25), (0, 23))
+        assert max_movie.preview(3) is plan
+        assert max_movie._allocator.allocate.call_count == 1
+        assert max_movie.version == version
+        assert max_movie.seats_unbooked() == MOVIE_MAX_ROWS * MOVIE_MAX_COLS
+
+        assert max_movie.preview(3, 1, 0).seats == ((1, 0), (1, 1), (1, 2))
+        assert max_movie.preview(3) is plan
+        max_movie.book(1)
+        assert max_movie.preview(3) is not plan
+        assert len(max_movie._plans) == 1
+
+    def test_preview_evicts(self, max_movie, monkeypatch):
+        monkeypatch.setattr("src._types.PLAN_CACHE_SIZE", 2)
+        plans = [max_movie.preview(seats_to_book) for seats_to_book in (1, 2, 1, 3)]
+        assert plans[2] is plans[0]
+        assert max_movie.preview(1) is plans[0]
+        assert max_movie.preview(2) is not plans[1]
+
+    def test_commit(self, max_movie):
+        plan = max_movie.preview(3, 1, 0)
+        booking_map = max_movie.get_map(max_movie.next_booking_id, plan)
+        booking_id = max_movie.commit(plan)
+        assert booking_id == BookingID(1)
+        assert max_movie.get_booking(booking_id) == list(plan.seats)
+        assert max_movie.get_map(booking_id) == booking_map
+
+        stale_plan = max_movie.preview(3, 1, 0)
+        max_movie.book(1, 1, 3)
+        booking_id = max_movie.commit(stale_plan)
+        assert max_movie.get_booking(booking_id) == [(1, 4), (1, 5), (1, 6)]
+
+    def test_preview_changes(self, min_movie, max_movie):
+        plan = max_movie.preview(2, 0, 0)
+        new_plan = max_movie.preview(2, 0, 1)
+        assert max_movie.preview_changes(plan, new_plan) == [(0, 0, "."), (0, 2, "o")]
+        max_movie.book(1, 5, 5)
+        assert max_movie.preview_changes(new_plan, max_movie.preview(2)) is None
+
+    def test_move(self):
+        movie = Movie("title", 2, 4)
+        booking_id = movie.book(4)
+        other_id = movie.book(2)
+        assert movie.move(booking_id, 0, 0) == []
+        assert movie.move(booking_id, 0, 2) == [
+            (0, 0, "."),
+            (0, 1, "."),
+            (1, 0, "o"),
+            (1, 3, "o"),
+        ]
+        assert movie.get_booking(booking_id) == [(0, 2), (0, 3), (1, 0), (1, 3)]
+        assert movie.get_booking(other_id) == [(1, 1), (1, 2)]
+        assert movie.seats_unbooked() == 2
+        with pytest.raises(ValueError):
+            movie.move(BookingID(3), 0, 0)
+
+    def test_move_failed(self):
+        movie = Movie("title", 3, 4)
+        movie.journal = Mock()
+        booking_id = movie.book(2)
+        for row_index, col_index in [(5, 0), (0, -1), (2, 3)]:
+            with pytest.raises(ValueError):
+                movie.move(booking_id, row_index, col_index)
+            assert movie.get_booking(booking_id) == [(0, 1), (0, 2)]
+        assert movie.seats_unbooked() == 10
+        assert movie.journal.record_unbook.call_count == 0
+
+        movie._allocator = Mock(allocate=Mock(side_effect=TypeError))
+        with pytest.raises(TypeError):
+            movie.move(booking_id, 1, 0)
+        assert movie.get_booking(booking_id) == [(0, 1), (0, 2)]
+
+    def test_hold_move(self):
+        now = [0.0]
+        movie = Movie("title", 2, 2, hold_ttl=10.0, clock=lambda: now[0])
+        booking_id = movie.book(2)
+        now[0] = 5.0
+        movie.move(booking_id, 1, 0)
+        now[0] = 10.0
+        assert movie.expire_holds() == []
+        now[0] = 15.0
+        assert movie.expire_holds() == [booking_id]
+
+    def test_hold_disabled(self, min_movie):
+        booking_id = min_movie.book(1)
+        assert min_movie.is_held(booking_id) is False
+        assert min_movie.expire_holds() == []
+        assert min_movie.confirm(booking_id) is True
+        assert min_movie.confirm(BookingID(2)) is False
 
     def test_get_map_min(
         self,
         min_movie,
     ):
         assert (
-            min_movie.get_map("")
+            min_movie.get_map(None)
             == """Booking id: 
 Selected seats:
 
@@ -123,8 +500,8 @@ A   o
     1  """
         )
         assert (
-            min_movie.get_map("some_booking_id")
-            == """Booking id: some_booking_id
+            min_movie.get_map(BookingID(2))
+            == """Booking id: GIC0002
 Selected seats:
 
    S   C   R   E   E   N   
@@ -135,7 +512,7 @@ A   #
 
     def test_get_map_max(self, max_movie):
         assert (
-            max_movie.get_map("")
+            max_movie.get_map(None)
             == """Booking id: 
 Selected seats:
 
@@ -170,6 +547,79 @@ A   .   .   .   .   .   .   .   .   .   .   .   .   .   .   .   .   .   .   .
     1   2   3   4   5   6   7   8   9  10  11  12  13  14  15  16  17  18  19  20  21  22  23  24  25  26  27  28  29  30  31  32  33  34  35  36  37  38  39  40  41  42  43  44  45  46  47  48  49  50"""
         )
 
+    def test_counters(self, max_movie):
+        booking_ids = [max_movie.book(30) for _ in range(20)]
+        assert_counters(max_movie._grid)
+        assert max_movie._grid.count_row_free(0) == 0
+
+        max_movie.unbook(booking_ids[0])
+        max_movie.book(5, 0, 0)
+        assert_counters(max_movie._grid)
+
+        for booking_id in booking_ids:
+            max_movie.unbook(booking_id)
+        assert_counters(max_movie._grid)
+
+    def test_next_free_row(self, max_movie):
+        grid = max_movie._grid
+        max_movie.book(MOVIE_MAX_COLS * 3)
+        assert grid.next_free_row(0) == 3
+        assert grid.next_free_row(4) == 4
+        max_movie.unbook(max_movie.book(1, 1, 0))
+        max_movie.unbook(BookingID(1))
+        assert grid.next_free_row(0) == 0
+        max_movie.book(grid.count_free())
+        assert grid.next_free_row(0) is None
+        assert grid.next_free_row(MOVIE_MAX_ROWS) is None
+
+    def test_book_skips_full_rows(self, min_movie, max_movie):
+        max_movie.book(MOVIE_MAX_COLS * 2)
+        max_movie.book(1)
+        assert max_movie._grid.count_row_free(2) == MOVIE_MAX_COLS - 1
+
+        min_movie.book(1)
+        min_movie.book(1, 0, 0)
+        assert min_movie.seats_unbooked() == 0
+
+    def test_get_booking(self, min_movie, max_movie):
+        assert min_movie.get_booking(BookingID(1)) is None
+        booking_id = min_movie.book(1)
+        assert min_movie.get_booking(booking_id) == [(0, 0)]
+        min_movie.unbook(booking_id)
+        assert min_movie.get_booking(booking_id) is None
+
+        booking_id = max_movie.book(3)
+        assert max_movie.get_booking(booking_id) == [(0, 24), (0, 25), (0, 23)]
+        max_movie.unbook(booking_id)
+        booking_id = max_movie.book(2, 1, MOVIE_MAX_COLS - 1)
+        assert max_movie.get_booking(booking_id) == [(1, 49), (2, 24)]
+
+    def test_seat_view(self, max_movie):
+        booking_id = max_movie.book(1)
+        seat = max_movie.seat(0, MOVIE_MAX_COLS // 2 - 1)
+        assert seat.is_booked is True
+        assert seat.booking_id == booking_id
+        assert seat.get_chr(booking_id) == "o"
+
+        seat.unbook()
+        assert max_movie.seats_unbooked() == MOVIE_MAX_ROWS * MOVIE_MAX_COLS
+
+    def test_get_map_cache(self, max_movie):
+        max_movie._render_row = Mock(wraps=max_movie._render_row)
+        booking_map = max_movie.get_map(None)
+        assert max_movie._render_row.call_count == MOVIE_MAX_ROWS
+        assert max_movie.get_map(None) is booking_map
+        assert max_movie._render_row.call_count == MOVIE_MAX_ROWS
+
+        booking_id = max_movie.book(1)
+        max_movie._render_row.reset_mock()
+        max_movie.get_map(booking_id)
+        max_movie._render_row.assert_called_once_with(0, booking_id)
+
+        max_movie._render_row.reset_mock()
+        assert max_movie.get_map(None) != booking_map
+        max_movie._render_row.assert_called_once_with(0, None)
+
     def test_unbook_existent(self, min_movie, max_movie):
         booking_id = min_movie.book(1)
         assert min_movie.seats_unbooked() == MOVIE_MIN_ROWS * MOVIE_MIN_COLS - 1
@@ -181,25 +631,44 @@ A   .   .   .   .   .   .   .   .   .   .   .   .   .   .   .   .   .   .   .
         max_movie.unbook(booking_id)
         assert max_movie.seats_unbooked() == MOVIE_MAX_ROWS * MOVIE_MAX_COLS
 
+    def test_unbook_many(self, max_movie):
+        booking_ids = [max_movie.book(4) for _ in range(3)]
+        version = max_movie.version
+        max_movie.unbook_many([booking_ids[0], booking_ids[2], BookingID(9)])
+        assert list(max_movie.bookings()) == [booking_ids[1]]
+        assert max_movie.version == version + 8
+        assert sum(map(bool, max_movie.slots())) == 4
+
     def test_unbook_nonexistent(self, min_movie, max_movie):
         min_movie.book(1)
         assert min_movie.seats_unbooked() == MOVIE_MIN_ROWS * MOVIE_MIN_COLS - 1
-        min_movie.unbook("some_booking_id")
+        min_movie.unbook(BookingID(2))
         assert min_movie.seats_unbooked() == MOVIE_MIN_ROWS * MOVIE_MIN_COLS - 1
 
         max_movie.book(1)
         assert max_movie.seats_unbooked() == MOVIE_MAX_ROWS * MOVIE_MAX_COLS - 1
-        max_movie.unbook("some_booking_id")
+        max_movie.unbook(BookingID(2))
         assert max_movie.seats_unbooked() == MOVIE_MAX_ROWS * MOVIE_MAX_COLS - 1
 
 
-class TestScrollingScreen:
-    def test_addstr(self):
-        stdscn = Mock()
-        stdscn.getyx = Mock(return_value=(0, 0))
+class TestHeadlessScreen:
+    def test_getstr(self):
+        screen = HeadlessScreen(StringIO(" title 1 1 \n"), StringIO())
+        assert screen.getstr() == "title 1 1"
+        with pytest.raises(EOFError):
+            screen.getstr()
 
-        screen = ScrollingScreen(stdscn)
-        screen.addstr("str")
+    def test_getch(self):
+        screen = HeadlessScreen(StringIO("1\n\n"), StringIO())
+        assert screen.getch() == ord("1")
+        assert screen.getch() == ord("\n")
 
-        stdscn.getyx.assert_called_once()
-        stdscn.addstr.assert_called_once_with(0 + SCREEN_DEFAULT_SPACING, 0, "str")
+    def test_addstr(self):
+        output = StringIO()
+        screen = HeadlessScreen(StringIO(), output)
+        screen.addstr("str")
+        assert screen.addpad("map", spacing=1) is None
+        screen.repaint(0, [(0, 0, "o")], (0, 0))
+        assert output.getvalue() == ""
+        screen.flush()
+        assert output.getvalue() == "\n" * SCREEN_DEFAULT_SPACING + "str\nmap"